@@ -0,0 +1,5 @@
+"""
+Benchmarks for the hotel booking system.
+
+Run from the app directory, e.g. ``python -m benchmarks.notification_render``.
+"""
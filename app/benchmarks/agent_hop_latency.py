@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Per-hop latency of a supervisor-to-agent call over A2A HTTP versus in-process
+
+Both modes call the same stub agent, so the difference is the cost of the
+hop itself: JSON-RPC serialization, the loopback HTTP request and the A2A
+task bookkeeping.
+"""
+import json
+import time
+import socket
+import asyncio
+import argparse
+import logging
+import statistics
+import threading
+
+from strands import Agent
+from strands.multiagent.a2a import A2AServer
+from strands_tools.a2a_client import A2AClientToolProvider
+
+from src.core.a2a_client import PooledA2AClient
+from src.core.colocated import ColocatedAgentProvider
+from src.core.dispatch import extract_a2a_text
+from benchmarks.stubs import StubModel
+
+MESSAGE = "What is the check-in time at Hotel Sunshine?"
+
+
+def stub_agent(reply: str) -> Agent:
+    return Agent(
+        StubModel(reply),
+        name="GuestAdvisoryAgent",
+        description="Stub advisory agent",
+        callback_handler=None,
+    )
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def start_a2a_server(agent: Agent) -> str:
+    port = free_port()
+    server = A2AServer(agent, host="127.0.0.1", port=port, http_url=f"http://127.0.0.1:{port}")
+    serve_args = {"host": "127.0.0.1", "port": port, "log_level": "warning"}
+    threading.Thread(target=server.serve, kwargs=serve_args, daemon=True).start()
+    for _ in range(100):
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=0.1).close()
+            break
+        except OSError:
+            time.sleep(0.05)
+    return f"http://127.0.0.1:{port}"
+
+
+async def measure(send_message, url: str, calls: int, warmup: int):
+    for _ in range(warmup):
+        await send_message(MESSAGE, url)
+    latencies_ms = []
+    for _ in range(calls):
+        start = time.perf_counter()
+        result = await send_message(MESSAGE, url)
+        latencies_ms.append((time.perf_counter() - start) * 1000)
+        assert result["status"] == "success" and extract_a2a_text(result), result
+    latencies_ms.sort()
+    return {
+        "calls": calls,
+        "mean_ms": round(statistics.mean(latencies_ms), 3),
+        "p50_ms": round(latencies_ms[len(latencies_ms) // 2], 3),
+        "p95_ms": round(latencies_ms[int(len(latencies_ms) * 0.95) - 1], 3),
+    }
+
+
+async def run(calls: int, warmup: int, reply_bytes: int):
+    reply = ("Check-in is from 3 PM. " * (reply_bytes // 23 + 1))[:reply_bytes]
+
+    url = start_a2a_server(stub_agent(reply))
+    provider = A2AClientToolProvider([url])
+    a2a = await measure(provider._send_message, url, calls, warmup)
+
+    pooled_client = PooledA2AClient([url], probe_interval=0)
+    pooled = await measure(pooled_client.send_message, url, calls, warmup)
+    await pooled_client.close()
+
+    colocated_provider = ColocatedAgentProvider({url: stub_agent(reply)})
+    colocated = await measure(colocated_provider.send_message, url, calls, warmup)
+
+    return {
+        "reply_bytes": reply_bytes,
+        "a2a_http": a2a,
+        "a2a_pooled": pooled,
+        "colocated": colocated,
+        "hop_overhead_ms": round(a2a["mean_ms"] - colocated["mean_ms"], 3),
+        "pooled_hop_overhead_ms": round(pooled["mean_ms"] - colocated["mean_ms"], 3),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure A2A versus in-process agent hop latency")
+    parser.add_argument("--calls", type=int, default=200, help="Timed calls per mode")
+    parser.add_argument("--warmup", type=int, default=10, help="Untimed calls per mode")
+    parser.add_argument("--reply-bytes", type=int, default=2000, help="Size of the stub agent's reply")
+    parser.add_argument("--output", help="Write results as JSON to this file")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    results = asyncio.run(run(args.calls, args.warmup, args.reply_bytes))
+
+    print(json.dumps(results, indent=2))
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+"""
+Offline load test of main.send_message against stubbed backends
+
+Bedrock and Gemini are replaced by StubModel, the AgentCore gateway by a
+local MCP server with the five Lambda tools, Cognito by a local token
+endpoint and AgentCore memory by an in-process client. Everything else
+(routing, session pool, caches, A2A or in-process hops) is the real code,
+so the numbers measure the system's own overhead.
+"""
+import io
+import os
+import re
+import sys
+import json
+import time
+import tempfile
+import asyncio
+import argparse
+import logging
+import resource
+import statistics
+import threading
+from contextlib import ExitStack, redirect_stdout
+from unittest.mock import patch
+
+from benchmarks.stubs import HopCounter, StubModel
+from benchmarks.stub_services import (
+    start_mcp_gateway,
+    start_oauth_server,
+    stub_memory_factory,
+    wait_for_port,
+)
+
+WORKLOAD = [
+    "Find hotels in Lisbon under $200",
+    "What is the cancellation policy?",
+    "Show my bookings for guest@example.com",
+    "I'm travelling to Paris next month, which hotel would you suggest for a family?",
+    "Is there a fee if I cancel my booking BK-1 tomorrow, and what are my current reservations for guest@example.com?",
+    "What time is check-in at Hotel Sunshine?",
+]
+
+# (agent, gateway tool, keywords), checked in order
+ROUTES = [
+    ("GuestAdvisoryAgent", "guest-advisory-kb", re.compile(r"polic|check-in|check-out|pets?\b|fee", re.I)),
+    ("ReservationAgent", "query-reservations", re.compile(r"booking|reservation", re.I)),
+    ("SearchDiscoveryAgent", "search-hotel", re.compile(r"hotel|room|stay", re.I)),
+]
+# Model specs standing for the three kinds of hop; stub_model_builder maps them to stubs
+STUB_MODEL_REGISTRY = {
+    "default": ["stub/subagent"],
+    "SupervisorAgent": ["stub/supervisor"],
+    "subject_composer": ["stub/helper"],
+    "html_formatter": ["stub/helper"],
+}
+EMAIL = re.compile(r"[\w.+-]+@[\w-]+\.[\w.-]+")
+CITY = re.compile(r"\b(?:in|to|at)\s+([A-Z][a-z]+)")
+
+
+def supervisor_router(settings):
+    def route(text, tool_names):
+        if "a2a_send_message" not in tool_names:
+            return None
+        for agent, _, keywords in ROUTES:
+            if keywords.search(text):
+                return "a2a_send_message", {"message_text": text, "target_agent_url": settings.get_agent_url(agent)}
+        return None
+
+    return route
+
+
+def agent_router(text, tool_names):
+    for _, target, keywords in ROUTES:
+        if not keywords.search(text):
+            continue
+        name = next((n for n in tool_names if n.startswith(target)), None)
+        if name is None:
+            return None
+        if target == "search-hotel":
+            city = CITY.search(text)
+            return name, {"city": city.group(1) if city else ""}
+        if target == "query-reservations":
+            email = EMAIL.search(text)
+            return name, {"guest_email": email.group(0) if email else "guest@example.com"}
+        return name, {"query": text}
+    return None
+
+
+def rss_mb() -> float:
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 1024 / 1024
+    except OSError:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def percentile(sorted_values, fraction):
+    index = min(len(sorted_values) - 1, max(0, int(round(fraction * len(sorted_values))) - 1))
+    return sorted_values[index]
+
+
+def configure_environment(args, counter: HopCounter):
+    """Point the real configuration at the stand-ins; must run before src is imported"""
+    os.environ.update({
+        "COGNITO_DOMAIN_URL": start_oauth_server(counter),
+        "AGENTCORE_GATEWAY_URL": start_mcp_gateway(counter, latency=args.tool_latency),
+        "USER_POOL_CLIENT_ID": "stub-client",
+        "USER_POOL_CLIENT_SECRET": "stub-secret",
+        "AGENTCORE_RESOURCE_SERVER_ID": "stub",
+        "GOOGLE_API_KEY": "stub",
+        "AWS_DEFAULT_REGION": "us-east-1",
+        "DEPLOYMENT_MODE": args.mode,
+        "LOCAL_ROUTER": "true" if args.router else "false",
+        "LITELLM_LOCAL_MODEL_COST_MAP": "True",
+        "MODEL_REGISTRY": json.dumps(STUB_MODEL_REGISTRY),
+    })
+    for name in ("TOKEN_CACHE_PATH", "MCP_SCHEMA_CACHE_PATH", "MEMORY_ID"):
+        os.environ.pop(name, None)
+    # Every run starts without a resolved memory, like a fresh host
+    os.environ["MEMORY_REGISTRY_PATH"] = os.path.join(tempfile.mkdtemp(prefix="load-test-"), "memory_registry.json")
+
+
+def stub_model_builder(factories):
+    """Replacement for model_registry.build_model that serves stub specs"""
+    return lambda spec, aws_region=None: factories[spec]()
+
+
+def start_agent_servers():
+    """Serve each specialist agent over A2A on its usual port, in this process"""
+    import uvicorn
+    from src.agents.run_agents import AGENTS
+
+    for agent_class in AGENTS.values():
+        app = agent_class().create_app(host="127.0.0.1")
+        config = uvicorn.Config(app, host="127.0.0.1", port=int(agent_class.PORT), log_level="warning")
+        threading.Thread(target=uvicorn.Server(config).run, daemon=True).start()
+        wait_for_port(int(agent_class.PORT))
+
+
+def counted_send(cls, counter: HopCounter, settings):
+    original = cls.send_message
+
+    async def send_message(self, message_text, target_agent_url, message_id=None):
+        counter.add("subagent_calls")
+        counter.add(f"subagent:{settings.get_agent_name(target_agent_url)}")
+        return await original(self, message_text, target_agent_url, message_id)
+
+    return patch.object(cls, "send_message", send_message)
+
+
+async def drive(send_message, total: int, concurrency: int, users: int, offset: int = 0):
+    slots = asyncio.Semaphore(concurrency)
+    latencies_ms = []
+    errors = 0
+
+    async def one(i: int):
+        nonlocal errors
+        request = {
+            "question": WORKLOAD[i % len(WORKLOAD)],
+            "actor_id": f"user-{i % users}",
+            "session_id": f"session-{i % users}",
+        }
+        async with slots:
+            start = time.perf_counter()
+            response = await send_message(request)
+            latencies_ms.append((time.perf_counter() - start) * 1000)
+        if isinstance(response, dict) and "error" in response:
+            errors += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one(offset + i) for i in range(total)))
+    return latencies_ms, errors, time.perf_counter() - start
+
+
+def run(args) -> dict:
+    counter = HopCounter()
+    configure_environment(args, counter)
+
+    from src.config.settings import Settings
+    from src.core.a2a_client import PooledA2AClient
+    from src.core.colocated import ColocatedAgentProvider
+
+    settings = Settings()
+
+    def model(hop: str, tool_router=None):
+        return lambda *a, **kw: StubModel(
+            reply="Here is what I found. " * 8,
+            latency=args.model_latency,
+            input_tokens=args.input_tokens,
+            output_tokens=args.output_tokens,
+            token_latency=args.token_latency,
+            tool_router=tool_router,
+            hop=hop,
+            counter=counter,
+        )
+
+    with ExitStack() as stack:
+        # The agents' default callback handler prints every reply; keep stdout for the results
+        stack.enter_context(redirect_stdout(io.StringIO()))
+        stack.enter_context(patch("src.utils.model_registry.build_model", stub_model_builder({
+            "stub/supervisor": model("supervisor_llm", supervisor_router(settings)),
+            "stub/subagent": model("subagent_llm", agent_router),
+            "stub/helper": model("helper_llm"),
+        })))
+        stack.enter_context(patch("src.core.memory.MemoryClient", stub_memory_factory(counter, args.memory_latency)))
+        stack.enter_context(counted_send(PooledA2AClient, counter, settings))
+        stack.enter_context(counted_send(ColocatedAgentProvider, counter, settings))
+
+        rss_start = rss_mb()
+        if args.mode == "a2a":
+            start_agent_servers()
+        from src import main
+
+        async def measure():
+            await drive(main.send_message, args.warmup, args.concurrency, args.users, offset=0)
+            before = counter.snapshot()
+            latencies_ms, errors, elapsed = await drive(
+                main.send_message, args.requests, args.concurrency, args.users, offset=args.warmup
+            )
+            after = counter.snapshot()
+            return latencies_ms, errors, elapsed, {k: v - before.get(k, 0) for k, v in after.items()}
+
+        latencies_ms, errors, elapsed, hops = asyncio.run(measure())
+
+    latencies_ms.sort()
+    return {
+        "config": {
+            "mode": args.mode,
+            "router": args.router,
+            "requests": args.requests,
+            "concurrency": args.concurrency,
+            "users": args.users,
+            "model_latency_s": args.model_latency,
+            "token_latency_s": args.token_latency,
+            "input_tokens": args.input_tokens,
+            "output_tokens": args.output_tokens,
+            "tool_latency_s": args.tool_latency,
+            "memory_latency_s": args.memory_latency,
+            "python": sys.version.split()[0],
+        },
+        "latency_ms": {
+            "p50": round(percentile(latencies_ms, 0.50), 2),
+            "p95": round(percentile(latencies_ms, 0.95), 2),
+            "p99": round(percentile(latencies_ms, 0.99), 2),
+            "mean": round(statistics.mean(latencies_ms), 2),
+            "max": round(latencies_ms[-1], 2),
+        },
+        "throughput_rps": round(args.requests / elapsed, 2),
+        "errors": errors,
+        "memory": {
+            "rss_start_mb": round(rss_start, 1),
+            "rss_end_mb": round(rss_mb(), 1),
+            "peak_rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+        },
+        "calls": dict(sorted(hops.items())),
+        "calls_per_request": {k: round(v / args.requests, 3) for k, v in sorted(hops.items())},
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test send_message against stubbed LLM, MCP and A2A backends")
+    parser.add_argument("--mode", choices=["a2a", "colocated"], default="a2a", help="Deployment mode")
+    parser.add_argument("--requests", type=int, default=200, help="Timed requests")
+    parser.add_argument("--warmup", type=int, default=12, help="Untimed requests before measuring")
+    parser.add_argument("--concurrency", type=int, default=16, help="Requests in flight at once")
+    parser.add_argument("--users", type=int, default=32, help="Distinct actor/session pairs")
+    parser.add_argument("--model-latency", type=float, default=0.05, help="Stub model latency per turn (s)")
+    parser.add_argument("--token-latency", type=float, default=0.0, help="Extra stub latency per output token (s)")
+    parser.add_argument("--input-tokens", type=int, default=1200, help="Reported input tokens per turn")
+    parser.add_argument("--output-tokens", type=int, default=150, help="Reported output tokens per turn")
+    parser.add_argument("--tool-latency", type=float, default=0.01, help="Stub MCP tool latency (s)")
+    parser.add_argument("--memory-latency", type=float, default=0.01, help="Stub memory call latency (s)")
+    parser.add_argument("--no-router", dest="router", action="store_false", help="Disable the local intent router")
+    parser.add_argument("--output", help="Write results as JSON to this file")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    results = run(args)
+
+    print(json.dumps(results, indent=2))
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
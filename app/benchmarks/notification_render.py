@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Compare per-email latency and token spend of the template and LLM notification paths
+"""
+import json
+import time
+import argparse
+import statistics
+from dotenv import load_dotenv
+
+from src.agents.templates import NotificationTemplateRenderer
+
+load_dotenv(override=True)
+
+SAMPLE_EVENTS = [
+    (
+        "BookingCreated",
+        {
+            "booking_id": "BK-10234",
+            "hotel_name": "Hotel Sunshine",
+            "guest_email": "guest@example.com",
+            "check_in_date": "2025-11-02",
+            "check_out_date": "2025-11-05",
+            "rooms": 1,
+            "total_price": "$540.00",
+        },
+    ),
+    (
+        "BookingModified",
+        {
+            "booking_id": "BK-10234",
+            "hotel_name": "Hotel Sunshine",
+            "guest_email": "guest@example.com",
+            "check_in_date": "2025-11-03",
+            "check_out_date": "2025-11-06",
+            "rooms": 2,
+            "total_price": "$1080.00",
+            "changes": "Dates moved by one day, rooms increased from 1 to 2",
+        },
+    ),
+    (
+        "BookingCancelled",
+        {
+            "booking_id": "BK-10234",
+            "hotel_name": "Hotel Sunshine",
+            "guest_email": "guest@example.com",
+            "check_in_date": "2025-11-03",
+            "check_out_date": "2025-11-06",
+            "cancellation_fee": "$108.00",
+        },
+    ),
+]
+
+
+def summarize(latencies_ms, tokens):
+    latencies_ms = sorted(latencies_ms)
+    return {
+        "emails": len(latencies_ms),
+        "mean_ms": round(statistics.mean(latencies_ms), 3),
+        "p50_ms": round(latencies_ms[len(latencies_ms) // 2], 3),
+        "p95_ms": round(latencies_ms[min(int(len(latencies_ms) * 0.95), len(latencies_ms) - 1)], 3),
+        "tokens_per_email": round(tokens / len(latencies_ms), 1),
+    }
+
+
+def run_template_path(samples: int):
+    renderer = NotificationTemplateRenderer()
+    latencies = []
+    for i in range(samples):
+        event_type, booking = SAMPLE_EVENTS[i % len(SAMPLE_EVENTS)]
+        start = time.perf_counter()
+        renderer.render(event_type, booking)
+        latencies.append((time.perf_counter() - start) * 1000)
+    return summarize(latencies, 0)
+
+
+def run_llm_path(samples: int):
+    # Imported lazily: building the helper pools needs model credentials
+    from src.agents.notification import subject_composer_pool, html_formatter_pool
+
+    latencies = []
+    tokens = 0
+    for i in range(samples):
+        event_type, booking = SAMPLE_EVENTS[i % len(SAMPLE_EVENTS)]
+        body = f"{event_type}\n" + "\n".join(f"{k}: {v}" for k, v in booking.items())
+        start = time.perf_counter()
+        with subject_composer_pool.checkout() as subject_agent:
+            subject_result = subject_agent(body)
+        with html_formatter_pool.checkout() as html_agent:
+            html_result = html_agent(body)
+        latencies.append((time.perf_counter() - start) * 1000)
+        for result in (subject_result, html_result):
+            tokens += result.metrics.accumulated_usage.get("totalTokens", 0)
+    return summarize(latencies, tokens)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark notification rendering paths")
+    parser.add_argument("--samples", type=int, default=300, help="Emails rendered per path")
+    parser.add_argument("--llm-samples", type=int, default=6, help="Emails rendered through the LLM path")
+    parser.add_argument("--skip-llm", action="store_true", help="Only benchmark the template path")
+    parser.add_argument("--output", help="Write results as JSON to this file")
+    args = parser.parse_args()
+
+    results = {"template": run_template_path(args.samples)}
+    if not args.skip_llm:
+        results["llm"] = run_llm_path(args.llm_samples)
+
+    print(json.dumps(results, indent=2))
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
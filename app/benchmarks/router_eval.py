@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Offline accuracy and latency evaluation for the local intent router
+"""
+import json
+import time
+import argparse
+import statistics
+
+from src.core.router import IntentRouter, NaiveBayesClassifier
+
+# Requests the router must leave to the LLM supervisor are labelled SUPERVISOR
+SUPERVISOR = "SupervisorAgent"
+
+LABELLED_REQUESTS = [
+    ("hotels in Lisbon under $200", "SearchDiscoveryAgent"),
+    ("Find me a hotel in Paris with a pool", "SearchDiscoveryAgent"),
+    ("show hotels near Central Park", "SearchDiscoveryAgent"),
+    ("any 4 star hotels in Dubai this weekend?", "SearchDiscoveryAgent"),
+    ("looking for cheap hotels in Rome", "SearchDiscoveryAgent"),
+    ("search hotels with free breakfast", "SearchDiscoveryAgent"),
+    ("rooms in Barcelona for next Friday", "SearchDiscoveryAgent"),
+    ("list hotels below 150 dollars", "SearchDiscoveryAgent"),
+    ("what's the check-in time", "GuestAdvisoryAgent"),
+    ("What time is check out?", "GuestAdvisoryAgent"),
+    ("what is your cancellation policy", "GuestAdvisoryAgent"),
+    ("are pets allowed", "GuestAdvisoryAgent"),
+    ("Is smoking allowed in the rooms?", "GuestAdvisoryAgent"),
+    ("tell me about the pet policy", "GuestAdvisoryAgent"),
+    ("what are the hotel rules for children", "GuestAdvisoryAgent"),
+    ("deposit policy for Hotel Sunshine?", "GuestAdvisoryAgent"),
+    ("show my bookings for x@y.com", "ReservationAgent"),
+    ("list reservations for jane.doe@example.com", "ReservationAgent"),
+    ("my bookings, email sam@mail.org", "ReservationAgent"),
+    ("get my reservations for guest@hotel.com with status CONFIRMED", "ReservationAgent"),
+    ("book hotel H-102 for 2 nights for x@y.com", SUPERVISOR),
+    ("cancel booking BK-10234", SUPERVISOR),
+    ("I need to cancel my booking for next week, but I'm worried about fees", SUPERVISOR),
+    ("modify my reservation to add a room", SUPERVISOR),
+    ("change the dates of booking BK-991 to next month", SUPERVISOR),
+    ("show my bookings", SUPERVISOR),
+    ("hi there", SUPERVISOR),
+    ("can you help me plan a trip?", SUPERVISOR),
+    ("reserve the cheapest hotel in Lisbon", SUPERVISOR),
+    ("send me the confirmation email again", SUPERVISOR),
+    ("what did I ask you yesterday?", SUPERVISOR),
+    ("extend my stay by one night", SUPERVISOR),
+]
+
+# Asked later in a conversation: only requests that stand on their own may skip the supervisor
+FOLLOW_UP_REQUESTS = [
+    ("what's the cancellation policy for that hotel?", SUPERVISOR),
+    ("are pets allowed there?", SUPERVISOR),
+    ("what is the check-in time", SUPERVISOR),
+    ("what is the check-in time at Hotel Sunshine", "GuestAdvisoryAgent"),
+    ("show hotels under $150", SUPERVISOR),
+    ("show hotels in Porto under $150", "SearchDiscoveryAgent"),
+    ("list reservations for jane.doe@example.com", "ReservationAgent"),
+]
+
+# Training examples for the optional classifier (kept separate from the evaluation set)
+TRAINING_EXAMPLES = [
+    ("hotels in city with price under budget", "SearchDiscoveryAgent"),
+    ("find search available hotel rooms amenities rating", "SearchDiscoveryAgent"),
+    ("cheap affordable hotel options pool wifi breakfast", "SearchDiscoveryAgent"),
+    ("check in check out time policy", "GuestAdvisoryAgent"),
+    ("pets smoking children age rules allowed", "GuestAdvisoryAgent"),
+    ("cancellation fee penalty policy deposit payment", "GuestAdvisoryAgent"),
+    ("show list my bookings reservations email", "ReservationAgent"),
+    ("book reserve cancel modify change my booking", SUPERVISOR),
+    ("hello help plan trip thanks", SUPERVISOR),
+    ("send email confirmation again", SUPERVISOR),
+]
+
+
+def evaluate(router: IntentRouter, repeats: int, requests=LABELLED_REQUESTS, has_history: bool = False):
+    routed = correct = 0
+    latencies_us = []
+    mistakes = []
+    for question, expected in requests:
+        for _ in range(repeats):
+            start = time.perf_counter()
+            decision = router.route(question, has_history=has_history)
+            latencies_us.append((time.perf_counter() - start) * 1e6)
+        predicted = decision.agent if decision else SUPERVISOR
+        if decision:
+            routed += 1
+        if predicted == expected:
+            correct += 1
+        else:
+            mistakes.append({"question": question, "expected": expected, "predicted": predicted})
+
+    routed_correct = sum(
+        1 for q, expected in requests
+        if (d := router.route(q, has_history=has_history)) and d.agent == expected
+    )
+    latencies_us.sort()
+    return {
+        "requests": len(requests),
+        "accuracy": round(correct / len(requests), 3),
+        "coverage": round(routed / len(requests), 3),
+        "routed_precision": round(routed_correct / routed, 3) if routed else None,
+        "mean_latency_us": round(statistics.mean(latencies_us), 2),
+        "p99_latency_us": round(latencies_us[int(len(latencies_us) * 0.99) - 1], 2),
+        "mistakes": mistakes,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Evaluate the local intent router")
+    parser.add_argument("--threshold", type=float, default=0.8, help="Router confidence threshold")
+    parser.add_argument("--repeats", type=int, default=200, help="Timing repeats per request")
+    parser.add_argument("--output", help="Write results as JSON to this file")
+    args = parser.parse_args()
+
+    results = {
+        "rules": evaluate(IntentRouter(threshold=args.threshold), args.repeats),
+        "rules+classifier": evaluate(
+            IntentRouter(classifier=NaiveBayesClassifier(TRAINING_EXAMPLES), threshold=args.threshold),
+            args.repeats,
+        ),
+        "follow-ups": evaluate(
+            IntentRouter(threshold=args.threshold), args.repeats, FOLLOW_UP_REQUESTS, has_history=True
+        ),
+    }
+
+    print(json.dumps(results, indent=2))
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+"""
+Cold-start cost of the AgentCore entrypoint: import, bind, readiness and first request
+
+Every measurement runs in a fresh interpreter. ``import`` times a bare
+``import src.main``. ``serve`` starts the real app with uvicorn against the
+stand-ins from the load test and records, from the start of the import:
+when /ping first answers, when it reports Healthy, and how long the first
+and a warm /invocations request take. ``--eager`` builds the supervisor
+before binding, which is the order the entrypoint used to have.
+"""
+import io
+import os
+import sys
+import json
+import time
+import argparse
+import statistics
+import subprocess
+import threading
+import urllib.request
+from contextlib import ExitStack, redirect_stdout
+from unittest.mock import patch
+
+QUESTION = "Find hotels in Lisbon under $200"
+
+
+def get_json(url: str, payload: dict = None, timeout: float = 60) -> dict:
+    data = json.dumps(payload).encode("utf-8") if payload is not None else None
+    headers = {"Content-Type": "application/json"} if data else {}
+    with urllib.request.urlopen(urllib.request.Request(url, data=data, headers=headers), timeout=timeout) as response:
+        return json.loads(response.read() or b"null")
+
+
+def stub_patches(args, counter, stack: ExitStack):
+    """Swap the models and memory client for stubs"""
+    from benchmarks.load_test import agent_router, stub_model_builder, supervisor_router
+    from benchmarks.stub_services import StubMemoryClient
+    from benchmarks.stubs import StubModel
+    from src.config.settings import Settings
+
+    class ProvisioningMemoryClient(StubMemoryClient):
+        def create_memory_and_wait(self, name: str, **kwargs) -> dict:
+            # create_memory_and_wait blocks until the memory resource is active
+            time.sleep(args.provision_latency)
+            return super().create_memory_and_wait(name, **kwargs)
+
+    def model(hop, tool_router=None):
+        return lambda: StubModel(
+            reply="Here is what I found.", latency=args.model_latency, tool_router=tool_router, hop=hop, counter=counter
+        )
+
+    memory = ProvisioningMemoryClient(counter, args.memory_latency)
+    stack.enter_context(redirect_stdout(io.StringIO()))
+    stack.enter_context(patch("src.utils.model_registry.build_model", stub_model_builder({
+        "stub/supervisor": model("supervisor_llm", supervisor_router(Settings())),
+        "stub/subagent": model("subagent_llm", agent_router),
+        "stub/helper": model("helper_llm"),
+    })))
+    stack.enter_context(patch("src.core.memory.MemoryClient", lambda *a, **kw: memory))
+
+
+def measure_import() -> dict:
+    start = time.perf_counter()
+    import src.main  # noqa: F401
+
+    loaded = [name for name in ("strands", "boto3", "litellm", "a2a", "mcp") if name in sys.modules]
+    return {"import_s": time.perf_counter() - start, "heavy_modules_loaded": loaded}
+
+
+def measure_serve(args) -> dict:
+    import uvicorn
+    from benchmarks.load_test import configure_environment
+    from benchmarks.stub_services import free_port
+    from benchmarks.stubs import HopCounter
+
+    counter = HopCounter()
+    configure_environment(args, counter)
+    base = f"http://127.0.0.1:{free_port()}"
+    port = int(base.rsplit(":", 1)[1])
+    stack = ExitStack()
+
+    start = time.perf_counter()
+    from src import main
+
+    imported = time.perf_counter()
+    build = main.supervisor_init.factory
+
+    def stubbed_build():
+        stub_patches(args, counter, stack)
+        return build()
+
+    main.supervisor_init.factory = stubbed_build
+    if args.eager:
+        main.supervisor_init.start().result()
+
+    config = uvicorn.Config(main.app, host="127.0.0.1", port=port, log_level="warning", lifespan="on")
+    threading.Thread(target=uvicorn.Server(config).run, daemon=True).start()
+    while True:
+        try:
+            get_json(f"{base}/ping", timeout=1)
+            break
+        except OSError:
+            time.sleep(0.005)
+    bound = time.perf_counter()
+
+    ready = {}
+
+    def wait_ready():
+        while get_json(f"{base}/ping").get("status") != "Healthy":
+            time.sleep(0.005)
+        ready["at"] = time.perf_counter()
+
+    watcher = threading.Thread(target=wait_ready, daemon=True)
+    watcher.start()
+
+    request = {"question": QUESTION, "actor_id": "startup", "session_id": "startup"}
+    sent = time.perf_counter()
+    get_json(f"{base}/invocations", request)
+    first_done = time.perf_counter()
+    watcher.join()
+
+    sent_warm = time.perf_counter()
+    get_json(f"{base}/invocations", request)
+    warm_done = time.perf_counter()
+
+    return {
+        "import_s": imported - start,
+        "bind_s": bound - start,
+        "ready_s": ready["at"] - start,
+        "first_request_s": first_done - sent,
+        "first_response_s": first_done - start,
+        "warm_request_s": warm_done - sent_warm,
+        "supervisor_init_s": main.supervisor_init.init_seconds,
+    }
+
+
+def serve_agents(args):
+    """Host the specialist agents on their usual ports until killed"""
+    from benchmarks.load_test import configure_environment, start_agent_servers
+    from benchmarks.stubs import HopCounter
+
+    counter = HopCounter()
+    configure_environment(args, counter)
+    stack = ExitStack()
+    stub_patches(args, counter, stack)
+    start_agent_servers()
+    sys.__stdout__.write("ready\n")
+    sys.__stdout__.flush()
+    threading.Event().wait()
+
+
+def child(args, role: str, eager: bool = False) -> dict:
+    command = [sys.executable, "-m", "benchmarks.startup_time", "--role", role] + forwarded(args)
+    if eager:
+        command.append("--eager")
+    output = subprocess.run(command, capture_output=True, text=True, check=True, timeout=300).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def forwarded(args) -> list:
+    return [
+        "--mode", args.mode,
+        "--provision-latency", str(args.provision_latency),
+        "--model-latency", str(args.model_latency),
+        "--memory-latency", str(args.memory_latency),
+        "--tool-latency", str(args.tool_latency),
+    ]
+
+
+def summarize(runs: list) -> dict:
+    summary = {}
+    for key, value in runs[0].items():
+        if isinstance(value, (int, float)):
+            values = [run[key] for run in runs]
+            summary[key] = {"median": round(statistics.median(values), 4), "max": round(max(values), 4)}
+        else:
+            summary[key] = value
+    return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure entrypoint import, bind, readiness and first-request latency")
+    parser.add_argument("--mode", choices=["a2a", "colocated"], default="a2a", help="Deployment mode")
+    parser.add_argument("--repeat", type=int, default=5, help="Fresh processes per measurement")
+    parser.add_argument("--provision-latency", type=float, default=1.0, help="Simulated create_memory_and_wait time (s)")
+    parser.add_argument("--model-latency", type=float, default=0.05, help="Stub model latency per turn (s)")
+    parser.add_argument("--memory-latency", type=float, default=0.01, help="Stub memory call latency (s)")
+    parser.add_argument("--tool-latency", type=float, default=0.01, help="Stub MCP tool latency (s)")
+    parser.add_argument("--eager", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--role", choices=["import", "serve", "agents"], help=argparse.SUPPRESS)
+    parser.add_argument("--output", help="Write results as JSON to this file")
+    args = parser.parse_args()
+    args.router = True
+
+    if args.role:
+        results = {"import": measure_import, "serve": measure_serve, "agents": serve_agents}[args.role]
+        result = results() if args.role == "import" else results(args)
+        sys.__stdout__.write(json.dumps(result) + "\n")
+        return
+
+    agents = None
+    if args.mode == "a2a":
+        command = [sys.executable, "-m", "benchmarks.startup_time", "--role", "agents"] + forwarded(args)
+        agents = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
+        agents.stdout.readline()
+    try:
+        results = {
+            "config": {
+                "mode": args.mode,
+                "repeat": args.repeat,
+                "provision_latency_s": args.provision_latency,
+                "model_latency_s": args.model_latency,
+                "python": sys.version.split()[0],
+            },
+            "import": summarize([child(args, "import") for _ in range(args.repeat)]),
+            "lazy": summarize([child(args, "serve") for _ in range(args.repeat)]),
+            "eager": summarize([child(args, "serve", eager=True) for _ in range(args.repeat)]),
+        }
+    finally:
+        if agents:
+            agents.terminate()
+            agents.wait()
+
+    print(json.dumps(results, indent=2))
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    os.environ.setdefault("LITELLM_LOCAL_MODEL_COST_MAP", "True")
+    main()
@@ -0,0 +1,170 @@
+"""
+Local stand-ins for the AgentCore gateway, Cognito and AgentCore memory
+"""
+import json
+import time
+import socket
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional
+
+from mcp.server.fastmcp import FastMCP
+
+from benchmarks.stubs import HopCounter
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def wait_for_port(port: int, timeout: float = 10):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=0.1).close()
+            return
+        except OSError:
+            time.sleep(0.05)
+    raise TimeoutError(f"Nothing listening on port {port}")
+
+
+def start_mcp_gateway(counter: HopCounter, latency: float = 0.0) -> str:
+    """Serve the five Lambda-backed gateway tools over streamable HTTP; returns the gateway URL"""
+    port = free_port()
+    server = FastMCP("stub-gateway", host="127.0.0.1", port=port, log_level="WARNING")
+
+    def called(tool: str):
+        counter.add("mcp_tool_calls")
+        counter.add(f"mcp:{tool}")
+        if latency:
+            time.sleep(latency)
+
+    @server.tool(name="search-hotel___searchHotel")
+    def search_hotel(city: str = "", max_price: float = 0, min_rating: float = 0) -> str:
+        """Search hotels by city, price and rating"""
+        called("search-hotel")
+        hotels = [
+            {"hotel_id": f"H-{i}", "name": f"Stub Hotel {i}", "city": city or "Lisbon", "price": 100 + 20 * i}
+            for i in range(5)
+        ]
+        return json.dumps({"hotels": hotels})
+
+    @server.tool(name="query-reservations___queryReservations")
+    def query_reservations(guest_email: str, status: str = "") -> str:
+        """List a guest's reservations"""
+        called("query-reservations")
+        return json.dumps({"reservations": [{"booking_id": "BK-1", "guest_email": guest_email, "status": "CONFIRMED"}]})
+
+    @server.tool(name="room-reservation___roomReservation")
+    def room_reservation(
+        guest_email: str, hotel_id: str, city: str = "", hotel_name: str = "",
+        check_in_date: str = "", nights: int = 1, rooms_booked: int = 1, price_per_night: float = 0,
+    ) -> str:
+        """Create a reservation"""
+        called("room-reservation")
+        return json.dumps({"booking_id": "BK-2", "status": "CONFIRMED"})
+
+    @server.tool(name="modify-reservation___modifyReservation")
+    def modify_reservation(booking_id: str, guest_email: str, status: str = "", nights: int = 0) -> str:
+        """Modify or cancel a reservation"""
+        called("modify-reservation")
+        return json.dumps({"booking_id": booking_id, "status": status or "MODIFIED"})
+
+    @server.tool(name="guest-advisory-kb___guestAdvisoryKb")
+    def guest_advisory_kb(query: str) -> str:
+        """Answer a hotel policy question from the knowledge base"""
+        called("guest-advisory-kb")
+        return json.dumps({"answer": "Check-in is from 3 PM; free cancellation up to 24 hours before arrival."})
+
+    threading.Thread(target=server.run, kwargs={"transport": "streamable-http"}, daemon=True).start()
+    wait_for_port(port)
+    return f"http://127.0.0.1:{port}/mcp"
+
+
+def start_oauth_server(counter: HopCounter, expires_in: int = 3600) -> str:
+    """Cognito-style client-credentials token endpoint; returns the domain URL"""
+
+    class TokenHandler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            self.rfile.read(int(self.headers.get("Content-Length", 0)))
+            counter.add("oauth_token_requests")
+            body = json.dumps({"access_token": "stub-token", "expires_in": expires_in, "token_type": "Bearer"})
+            self.send_response(200 if self.path == "/oauth2/token" else 404)
+            self.send_header("Content-Type", "application/json")
+            self.end_headers()
+            self.wfile.write(body.encode("utf-8"))
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", free_port()), TokenHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return f"http://127.0.0.1:{server.server_address[1]}"
+
+
+class StubControlPlane:
+    """The paginated list_memories call of the boto3 control-plane client"""
+
+    def __init__(self, memory_client: "StubMemoryClient"):
+        self.memory_client = memory_client
+
+    def list_memories(self, maxResults: int = 100, nextToken: Optional[str] = None) -> dict:
+        self.memory_client._call("list_memories")
+        start = int(nextToken or 0)
+        memories = self.memory_client._memories[start:start + maxResults]
+        more = start + maxResults < len(self.memory_client._memories)
+        return {"memories": memories, **({"nextToken": str(start + maxResults)} if more else {})}
+
+
+class StubMemoryClient:
+    """In-process stand-in for bedrock_agentcore's MemoryClient with simulated latency"""
+
+    def __init__(self, counter: HopCounter, latency: float = 0.0):
+        self.counter = counter
+        self.latency = latency
+        self.gmcp_client = StubControlPlane(self)
+        self._memories: List[dict] = []
+        self._events: Dict[tuple, List[dict]] = {}
+        self._lock = threading.Lock()
+
+    def _call(self, operation: str):
+        self.counter.add(f"memory:{operation}")
+        if self.latency:
+            time.sleep(self.latency)
+
+    def create_memory_and_wait(self, name: str, **kwargs) -> dict:
+        self._call("create_memory")
+        with self._lock:
+            if any(m.get("name") == name for m in self._memories):
+                raise ValueError(f"Memory with name {name} already exists")
+            memory = {"id": f"{name}-stub000001", "name": name, "status": "ACTIVE"}
+            self._memories.append(memory)
+        return memory
+
+    def get_memory_status(self, memory_id: str) -> str:
+        self._call("get_memory")
+        return next((m["status"] for m in self._memories if m["id"] == memory_id), "DELETING")
+
+    def create_event(self, memory_id: str, actor_id: str, session_id: str, messages: list, **kwargs):
+        self._call("create_event")
+        with self._lock:
+            self._events.setdefault((memory_id, actor_id, session_id), []).extend(messages)
+
+    def get_last_k_turns(self, memory_id: str, actor_id: str, session_id: str, k: int = 5, **kwargs):
+        self._call("get_last_k_turns")
+        with self._lock:
+            events = list(self._events.get((memory_id, actor_id, session_id), []))
+        turns: List[List[dict]] = []
+        for text, role in events:
+            if role.upper() == "USER" or not turns:
+                turns.append([])
+            turns[-1].append({"role": role.upper(), "content": {"text": text}})
+        return turns[-k:]
+
+
+def stub_memory_factory(counter: HopCounter, latency: float = 0.0, shared: Optional[StubMemoryClient] = None):
+    """Callable that replaces MemoryClient(region_name=...)"""
+    client = shared or StubMemoryClient(counter, latency)
+    return lambda *args, **kwargs: client
@@ -0,0 +1,116 @@
+"""
+Offline stand-ins for the models the agents depend on
+"""
+import json
+import asyncio
+import threading
+from collections import Counter
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple
+
+from strands.models import Model
+
+# Given the latest user text and the available tool names, return a tool call or None
+ToolRouter = Callable[[str, List[str]], Optional[Tuple[str, Dict[str, Any]]]]
+
+
+class HopCounter:
+    """Thread-safe call counts per hop, shared by every stub"""
+
+    def __init__(self):
+        self._counts: Counter = Counter()
+        self._lock = threading.Lock()
+
+    def add(self, hop: str, n: int = 1):
+        with self._lock:
+            self._counts[hop] += n
+
+    def snapshot(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._counts)
+
+
+class StubModel(Model):
+    """Model that answers with a fixed reply after a simulated delay
+
+    Latency is ``latency`` plus ``token_latency`` per output token, and the
+    reported usage uses ``input_tokens``/``output_tokens``. With a
+    ``tool_router``, the first turn after a user message calls the tool it
+    picks and the turn after the tool result answers.
+    """
+
+    def __init__(
+        self,
+        reply: str = "OK",
+        latency: float = 0.0,
+        chunks: int = 1,
+        input_tokens: int = 0,
+        output_tokens: int = 0,
+        token_latency: float = 0.0,
+        tool_router: Optional[ToolRouter] = None,
+        hop: Optional[str] = None,
+        counter: Optional[HopCounter] = None,
+    ):
+        self.reply = reply
+        self.latency = latency
+        self.chunks = chunks
+        self.input_tokens = input_tokens
+        self.output_tokens = output_tokens
+        self.token_latency = token_latency
+        self.tool_router = tool_router
+        self.hop = hop
+        self.counter = counter
+        self.calls = 0
+
+    def update_config(self, **model_config: Any):
+        pass
+
+    def get_config(self) -> dict:
+        return {"reply": self.reply, "latency": self.latency}
+
+    async def structured_output(self, output_model, prompt, system_prompt: Optional[str] = None, **kwargs):
+        raise NotImplementedError("StubModel does not produce structured output")
+        yield  # pragma: no cover
+
+    def _tool_call(self, messages, tool_specs) -> Optional[Tuple[str, Dict[str, Any]]]:
+        if not self.tool_router or not tool_specs or not messages:
+            return None
+        last = messages[-1]
+        if last["role"] != "user" or any("toolResult" in block for block in last["content"]):
+            return None
+        text = " ".join(block.get("text", "") for block in last["content"])
+        return self.tool_router(text, [spec["name"] for spec in tool_specs])
+
+    async def stream(self, messages, tool_specs=None, system_prompt=None, **kwargs) -> AsyncIterator[dict]:
+        self.calls += 1
+        if self.counter and self.hop:
+            self.counter.add(self.hop)
+        delay = self.latency + self.token_latency * self.output_tokens
+        if delay:
+            await asyncio.sleep(delay)
+
+        yield {"messageStart": {"role": "assistant"}}
+        tool_call = self._tool_call(messages, tool_specs)
+        if tool_call:
+            name, tool_input = tool_call
+            tool_use_id = f"tooluse_{self.calls}"
+            yield {"contentBlockStart": {"start": {"toolUse": {"toolUseId": tool_use_id, "name": name}}}}
+            yield {"contentBlockDelta": {"delta": {"toolUse": {"input": json.dumps(tool_input)}}}}
+            yield {"contentBlockStop": {}}
+            stop_reason = "tool_use"
+        else:
+            size = max(1, len(self.reply) // self.chunks)
+            for start in range(0, len(self.reply), size):
+                yield {"contentBlockDelta": {"delta": {"text": self.reply[start:start + size]}}}
+            yield {"contentBlockStop": {}}
+            stop_reason = "end_turn"
+        yield {"messageStop": {"stopReason": stop_reason}}
+        yield {
+            "metadata": {
+                "usage": {
+                    "inputTokens": self.input_tokens,
+                    "outputTokens": self.output_tokens,
+                    "totalTokens": self.input_tokens + self.output_tokens,
+                },
+                "metrics": {"latencyMs": int(delay * 1000)},
+            }
+        }
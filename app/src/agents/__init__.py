@@ -3,6 +3,8 @@ from .search_discovery import SearchDiscoveryAgent
 from .reservation import ReservationAgent
 from .guest_advisory import GuestAdvisoryAgent
 from .notification import NotificationAgent
+from .helper_pool import HelperAgentPool
+from .response_cache import ResponseCache, CachedResponseAgent
 
 __all__ = [
     "BaseAgent",
@@ -10,4 +12,7 @@ __all__ = [
     "ReservationAgent",
     "GuestAdvisoryAgent",
     "NotificationAgent",
+    "HelperAgentPool",
+    "ResponseCache",
+    "CachedResponseAgent",
 ]
@@ -1,10 +1,18 @@
-import os
 import logging
+import uvicorn
 from abc import ABC, abstractmethod
+from typing import List
 from strands import Agent
-from strands.models.litellm import LiteLLMModel
+from strands.types.tools import AgentTool
+from strands.models import Model
 from strands.multiagent.a2a import A2AServer
-from ..utils.mcp_client import create_mcp_client
+from ..utils.mcp_client import get_mcp_session
+from .serving import ConcurrencyLimiter, add_health_routes
+from ..utils.tool_cache import CachingMCPTool, get_tool_result_cache
+from ..utils.resilience import DeadlineMiddleware, guard_mcp_tool
+from ..utils.tracing import TraceContextMiddleware, setup_tracing
+from ..utils.metrics import MetricsHookProvider, add_metrics_route, get_metrics_registry
+from ..utils.model_registry import get_model_registry
 
 logger = logging.getLogger(__name__)
 
@@ -14,33 +22,63 @@ class BaseAgent(ABC):
 
     def __init__(self, port: str):
         self.port = port
+        # No-op unless TRACING_EXPORTER is set; the first caller in a process names the service
+        setup_tracing(self.get_agent_name())
+        self.mcp_session = get_mcp_session()
+        self.tool_cache = get_tool_result_cache()
+        get_metrics_registry().register_cache("mcp_tool_results", self.tool_cache)
         self.agent = self._create_agent()
+        # Serve from cached schemas right away, re-check them against the gateway
+        self.mcp_session.validate_tools(on_change=self._refresh_mcp_tools)
 
     def _create_agent(self) -> Agent:
         """Create the agent with MCP tools"""
         try:
-            mcp_client = create_mcp_client()
+            mcp_tools = self._wrap_mcp_tools(self.mcp_session.get_tools())
+            self._mcp_tool_names = [t.tool_name for t in mcp_tools]
+
+            # Shared per model; the chain comes from Settings.model_registry
+            model = get_model_registry().get(self.get_agent_name())
+
+            agent = self._new_agent(
+                model,
+                name=self.get_agent_name(),
+                description=self.get_agent_description(),
+                system_prompt=self.get_system_prompt(),
+                tools=list(mcp_tools) + self.get_custom_tools(),
+                hooks=[MetricsHookProvider(self.get_agent_name())],
+            )
+
+            return agent
+        except Exception as e:
+            logger.error(f"Failed to create agent: {e}")
+            raise
 
-            with mcp_client:
-                mcp_tools = mcp_client.list_tools_sync()
+    def _new_agent(self, model: Model, **kwargs) -> Agent:
+        """Construct the strands Agent; subclasses may return a specialized Agent"""
+        return Agent(model, **kwargs)
 
-                model = LiteLLMModel(
-                    client_args={"api_key": os.getenv("GOOGLE_API_KEY")},
-                    model_id="gemini/gemini-2.5-flash",
-                )
+    def _refresh_mcp_tools(self, mcp_tools: List[AgentTool]):
+        """Swap the agent's MCP tools for a refreshed set from the gateway"""
+        mcp_tools = self._wrap_mcp_tools(mcp_tools)
+        registry = self.agent.tool_registry.registry
+        for name in self._mcp_tool_names:
+            registry.pop(name, None)
+        for mcp_tool in mcp_tools:
+            registry[mcp_tool.tool_name] = mcp_tool
+        self._mcp_tool_names = [t.tool_name for t in mcp_tools]
 
-                agent = Agent(
-                    model,
-                    name=self.get_agent_name(),
-                    description=self.get_agent_description(),
-                    system_prompt=self.get_system_prompt(),
-                    tools=mcp_tools,
-                )
+    def _wrap_mcp_tools(self, mcp_tools: List[AgentTool]) -> List[AgentTool]:
+        """Serve repeated gateway calls from the shared tool result cache
 
-                return agent
-        except Exception as e:
-            logger.error(f"Failed to create agent: {e}")
-            raise
+        Misses run within the request deadline, behind a per-target circuit
+        breaker, and identical concurrent calls to shared targets run once.
+        """
+        return [CachingMCPTool(guard_mcp_tool(t), self.tool_cache) for t in mcp_tools]
+
+    def get_custom_tools(self) -> List[AgentTool]:
+        """Get agent-specific tools to register alongside the MCP tools"""
+        return []
 
     @abstractmethod
     def get_agent_name(self) -> str:
@@ -57,23 +95,31 @@ class BaseAgent(ABC):
         """Get the system prompt for the agent"""
         pass
 
-    def serve(self, host: str = "0.0.0.0"):
+    def create_app(self, host: str = "0.0.0.0", max_in_flight: int = 4, max_queue: int = 32):
+        """Build the ASGI app: the A2A server behind a concurrency limit, plus health probes and /metrics
+
+        Requests continue the caller's trace, so sub-agent spans join the supervisor's trace,
+        and keep to what is left of the caller's request budget.
+        """
+        a2a_server = A2AServer(self.agent, host=host, port=int(self.port))
+        app = a2a_server.to_starlette_app()
+        limiter = ConcurrencyLimiter(app, max_in_flight=max_in_flight, max_queue=max_queue)
+        add_health_routes(app, limiter)
+        add_metrics_route(app)
+        get_metrics_registry().register_collector("server", limiter.samples)
+        return TraceContextMiddleware(DeadlineMiddleware(limiter))
+
+    def serve(self, host: str = "0.0.0.0", max_in_flight: int = 4, max_queue: int = 32):
         """Start the A2A server for this agent"""
         try:
-            mcp_client = create_mcp_client()
-
-            with mcp_client:
-                mcp_tools = mcp_client.list_tools_sync()
-
-                # Update agent tools
-                self.agent.tools = mcp_tools
-
-                # Create and serve A2A server within MCP context
-                a2a_server = A2AServer(self.agent, port=self.port)
-                logger.info(f"Starting {self.get_agent_name()} on {host}:{self.port}")
-                a2a_server.serve(host=host, port=int(self.port))
+            # The MCP session stays open for the lifetime of the server
+            app = self.create_app(host, max_in_flight, max_queue)
+            logger.info(f"Starting {self.get_agent_name()} on {host}:{self.port}")
+            uvicorn.run(app, host=host, port=int(self.port))
         except KeyboardInterrupt:
             logger.info(f"{self.get_agent_name()} shutting down...")
         except Exception as e:
             logger.error(f"{self.get_agent_name()} error: {e}")
             raise
+        finally:
+            self.mcp_session.close()
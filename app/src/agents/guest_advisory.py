@@ -1,10 +1,22 @@
+from strands import Agent
+from strands.models import Model
 from .base import BaseAgent
+from .response_cache import CachedResponseAgent, create_response_cache
+from ..utils.metrics import get_metrics_registry
 
 class GuestAdvisoryAgent(BaseAgent):
     """Agent responsible for providing hotel policies and advisory information"""
+
+    PORT = "9003"
     
     def __init__(self):
-        super().__init__(port="9003")
+        # Needed by _new_agent, which runs inside BaseAgent.__init__
+        self.response_cache = create_response_cache()
+        get_metrics_registry().register_cache("advisory_responses", self.response_cache)
+        super().__init__(port=self.PORT)
+
+    def _new_agent(self, model: Model, **kwargs) -> Agent:
+        return CachedResponseAgent(model, response_cache=self.response_cache, **kwargs)
     
     def get_agent_name(self) -> str:
         return "GuestAdvisoryAgent"
@@ -0,0 +1,106 @@
+import os
+import queue
+import logging
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional
+from strands import Agent
+from strands.models import Model
+
+from ..utils.metrics import MetricsHookProvider
+from ..utils.model_registry import get_model_registry
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_POOL_SIZE = int(os.getenv("HELPER_POOL_SIZE", "4"))
+DEFAULT_CHECKOUT_TIMEOUT = float(os.getenv("HELPER_POOL_CHECKOUT_TIMEOUT", "30"))
+
+
+class HelperAgentPool:
+    """Bounded pool of pre-built, stateless helper agents
+
+    Agents are created lazily up to ``size`` and share one model client, so
+    connection reuse survives across calls. Tools run on worker threads, so
+    checkout is thread-safe and blocks when every agent is in use.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        system_prompt: str,
+        size: int = DEFAULT_POOL_SIZE,
+        model: Optional[Model] = None,
+    ):
+        self.name = name
+        self.system_prompt = system_prompt
+        self.size = size
+        # The pool's name is its role in the model registry
+        self.model = model or get_model_registry().get(name)
+        self.metrics_hooks = MetricsHookProvider(name)
+        self._idle: "queue.LifoQueue[Agent]" = queue.LifoQueue(maxsize=size)
+        self._lock = threading.Lock()
+        self._created = 0
+        self._in_use = 0
+        self._waiting = 0
+        self._checkouts = 0
+
+    def _build_agent(self) -> Agent:
+        return Agent(self.model, system_prompt=self.system_prompt, hooks=[self.metrics_hooks])
+
+    def _acquire(self, timeout: Optional[float]) -> Agent:
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self._lock:
+            if self._created < self.size:
+                self._created += 1
+                build = True
+            else:
+                self._waiting += 1
+                build = False
+
+        if build:
+            try:
+                return self._build_agent()
+            except Exception:
+                with self._lock:
+                    self._created -= 1
+                raise
+
+        try:
+            return self._idle.get(timeout=timeout)
+        except queue.Empty as e:
+            raise TimeoutError(f"No {self.name} helper agent available after {timeout}s") from e
+        finally:
+            with self._lock:
+                self._waiting -= 1
+
+    @contextmanager
+    def checkout(self, timeout: Optional[float] = DEFAULT_CHECKOUT_TIMEOUT) -> Iterator[Agent]:
+        """Borrow an agent for a single call and return it reset to the pool"""
+        agent = self._acquire(timeout)
+        with self._lock:
+            self._in_use += 1
+            self._checkouts += 1
+        try:
+            yield agent
+        finally:
+            # Helpers are stateless: drop the conversation before reuse
+            agent.messages = []
+            with self._lock:
+                self._in_use -= 1
+            self._idle.put_nowait(agent)
+
+    def metrics(self) -> Dict[str, int]:
+        """Current pool occupancy"""
+        with self._lock:
+            return {
+                "size": self.size,
+                "created": self._created,
+                "idle": self._idle.qsize(),
+                "in_use": self._in_use,
+                "waiting": self._waiting,
+                "checkouts": self._checkouts,
+            }
@@ -1,12 +1,17 @@
 import os
-from strands import Agent, tool
-from strands.models.litellm import LiteLLMModel
-from strands.multiagent.a2a import A2AServer
+import logging
+from strands import tool
+from strands.types.tools import AgentTool
 from email.mime.text import MIMEText
-from typing import Dict
-import smtplib
+from typing import Any, Dict, List, Optional
 from .base import BaseAgent
-from ..utils.mcp_client import create_mcp_client
+from .helper_pool import HelperAgentPool
+from .notification_buffer import NotificationBuffer
+from .templates import NotificationTemplateRenderer
+from ..utils.metrics import get_metrics_registry
+from ..utils.smtp_outbox import get_email_outbox
+
+logger = logging.getLogger(__name__)
 
 SUBJECT_COMPOSER_ASSISTANT_PROMPT = """
 You are an expert email subject line composer for a hotel booking system.
@@ -49,11 +54,15 @@ along with full booking context, and create clear, professional notifications.
 
 Your responsibilities:
 1. Classify the event type and decide the appropriate notification template.
-2. Construct a plain-text email body summarizing the booking details (booking_id, hotel name,
+2. Call the "send_templated_notification" tool first with the event type and the structured booking
+   fields (booking_id, hotel_name, guest_email, check_in_date, check_out_date, rooms, total_price,
+   status, changes, cancellation_fee). If it returns status "success", the email has been sent or
+   scheduled and you are done. Only if it returns status "fallback", continue with the steps below.
+3. Construct a plain-text email body summarizing the booking details (booking_id, hotel name,
    check-in date, check-out date, rooms, price, status, etc.).
-3. Use the "subject_composer_assistant" tool to generate a professional subject line for the email.
-4. Use the "html_formatter_assistant" tool to format the email body into a clean HTML layout.
-5. Use the "email_sender" tool to send the email with the generated subject and HTML body.
+4. Use the "subject_composer_assistant" tool to generate a professional subject line for the email.
+5. Use the "html_formatter_assistant" tool to format the email body into a clean HTML layout.
+6. Use the "email_sender" tool to send the email with the generated subject and HTML body.
 
 Guidelines:
 - Always include all relevant booking details so the user understands exactly what happened.
@@ -63,6 +72,20 @@ Guidelines:
 - Return a structured, actionable response confirming the notification was sent.
 """
 
+template_renderer = NotificationTemplateRenderer()
+
+# Pre-built helper agents shared across tool calls
+subject_composer_pool = HelperAgentPool("subject_composer", SUBJECT_COMPOSER_ASSISTANT_PROMPT)
+html_formatter_pool = HelperAgentPool("html_formatter", HTML_FORMATTER_ASSISTANT_PROMPT)
+
+
+def get_helper_pool_metrics() -> Dict[str, Dict[str, int]]:
+    """Occupancy of the notification helper agent pools"""
+    return {
+        subject_composer_pool.name: subject_composer_pool.metrics(),
+        html_formatter_pool.name: html_formatter_pool.metrics(),
+    }
+
 @tool
 def subject_composer_assistant(query: str) -> str:
     """
@@ -75,15 +98,8 @@ def subject_composer_assistant(query: str) -> str:
         A short, professional subject line for the email.
     """
     try:
-        model = LiteLLMModel(
-            client_args={"api_key": os.getenv("GOOGLE_API_KEY")},
-            model_id="gemini/gemini-2.5-flash",
-        )
-        subject_agent = Agent(
-            model,
-            system_prompt=SUBJECT_COMPOSER_ASSISTANT_PROMPT,
-        )
-        response = subject_agent(query)
+        with subject_composer_pool.checkout() as subject_agent:
+            response = subject_agent(query)
         return str(response).strip()
     except Exception as e:
         return f"Error in subject composer assistant: {str(e)}"
@@ -100,19 +116,32 @@ def html_formatter_assistant(query: str) -> str:
         A responsive, well-formatted HTML string suitable for sending via email.
     """
     try:
-        model = LiteLLMModel(
-            client_args={"api_key": os.getenv("GOOGLE_API_KEY")},
-            model_id="gemini/gemini-2.5-flash",
-        )
-        html_agent = Agent(
-            model,
-            system_prompt=HTML_FORMATTER_ASSISTANT_PROMPT,
-        )
-        response = html_agent(query)
+        with html_formatter_pool.checkout() as html_agent:
+            response = html_agent(query)
         return str(response).strip()
     except Exception as e:
         return f"Error in HTML formatter assistant: {str(e)}"
 
+def _send_email(subject: str, html_body: str) -> Dict[str, str]:
+    """Queue an HTML email on the SMTP outbox"""
+    from_email = os.getenv("GMAIL_USER")
+    to_email = os.getenv("GMAIL_TO")
+
+    msg = MIMEText(html_body, "html")
+    msg["Subject"] = subject
+    msg["From"] = from_email
+    msg["To"] = to_email
+
+    try:
+        outbox_id = get_email_outbox().submit(msg)
+        logger.info(f"Queued email {outbox_id}: {subject}")
+        return {
+            "status": "success",
+            "message": f"Email queued for delivery to {to_email}",
+        }
+    except Exception as e:
+        return {"status": "failure", "message": f"Failed to send email: {str(e)}"}
+
 @tool
 def email_sender(subject: str, html_body: str) -> Dict[str, str]:
     """
@@ -124,37 +153,68 @@ def email_sender(subject: str, html_body: str) -> Dict[str, str]:
 
     Returns:
         dict: A structured result with:
-            - "status": "success" if the email was sent, otherwise "failure".
+            - "status": "success" if the email was queued for delivery, otherwise "failure".
             - "message": Optional error message when status is "failure".
     """
-    gmail_app_password = os.getenv("GMAIL_APP_PASSWORD")
-    from_email = os.getenv("GMAIL_USER")
-    to_email = os.getenv("GMAIL_TO")
-    
-    msg = MIMEText(html_body, "html")
-    msg["Subject"] = subject
-    msg["From"] = from_email
-    msg["To"] = to_email
+    return _send_email(subject, html_body)
+
+def _send_rendered(event_type: str, booking: Dict[str, Any]) -> Dict[str, str]:
+    """Render a (possibly collapsed) booking event and queue the email"""
+    rendered = template_renderer.render(event_type, booking)
+    if rendered is None:
+        return {"status": "failure", "message": f"Cannot render event '{event_type}'"}
+    return _send_email(rendered.subject, rendered.html_body)
+
+def _template_fallback(event_type: str, fields: Dict[str, Any]) -> Optional[Dict[str, str]]:
+    """None when the event can be rendered from its fields, else the fallback result"""
+    if template_renderer.can_render(event_type, fields):
+        return None
+    missing = template_renderer.missing_fields(fields)
+    return {
+        "status": "fallback",
+        "message": f"Cannot use a template for event '{event_type}' (missing fields: {missing}); "
+        "compose the email with the assistant tools instead.",
+    }
+
+# Collapses a booking's events within the quiet window into one email. Off by
+# default: a window delays every confirmation by that long, so deployments opt in
+notification_buffer = NotificationBuffer(
+    _send_rendered,
+    quiet_window=float(os.getenv("NOTIFICATION_QUIET_WINDOW", "0")),
+    max_delay=float(os.getenv("NOTIFICATION_MAX_DELAY", "600")),
+    urgent_events=[e for e in os.getenv("NOTIFICATION_URGENT_EVENTS", "BookingCancelled").split(",") if e],
+)
 
-    print(msg.as_string())
+@tool
+def send_templated_notification(event_type: str, booking: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Renders and sends a notification email for a known booking event without any LLM calls.
 
-    try:
-        with smtplib.SMTP("smtp.gmail.com", 587) as server:
-            server.starttls()
-            server.login(from_email, gmail_app_password)
-            server.send_message(msg)
-        return {
-            "status": "success",
-            "message": f"Email successfully sent to {to_email}",
-        }
-    except Exception as e:
-        return {"status": "failure", "message": f"Failed to send email: {str(e)}"}
+    When a quiet window is configured, events for the same booking within it are combined
+    into one email, so a booking that is created and then cancelled only gets the cancellation.
+
+    Args:
+        event_type (str): One of BookingCreated, BookingModified or BookingCancelled.
+        booking (dict): Structured booking fields such as booking_id, hotel_name, guest_email,
+            check_in_date, check_out_date, rooms, total_price, status, changes and cancellation_fee.
+
+    Returns:
+        dict: A structured result with:
+            - "status": "success" or "failure" from sending or scheduling, or "fallback" when
+              the event type is unknown or required fields are missing.
+            - "message": Details, including the missing fields for a fallback.
+    """
+    # Fields from the booking's earlier, still buffered events can complete this one
+    return notification_buffer.submit(event_type, booking, validate=_template_fallback)
 
 class NotificationAgent(BaseAgent):
     """Agent responsible for handling booking notifications and communications"""
+
+    PORT = "9004"
     
     def __init__(self):
-        super().__init__(port="9004")
+        super().__init__(port=self.PORT)
+        get_metrics_registry().register_collector("notifications", notification_buffer.samples)
     
     def get_agent_name(self) -> str:
         return "NotificationAgent"
@@ -165,38 +225,14 @@ class NotificationAgent(BaseAgent):
     def get_system_prompt(self) -> str:
         return NOTIFICATION_AGENT_PROMPT
     
-    def _create_agent(self) -> Agent:
-        """Override to add custom tools along with MCP tools"""
-        try:
-            mcp_client = create_mcp_client()
-            
-            with mcp_client:
-                mcp_tools = mcp_client.list_tools_sync()
-                
-                # Combine MCP tools with custom notification tools
-                all_tools = list(mcp_tools) + [
-                    subject_composer_assistant,
-                    html_formatter_assistant,
-                    email_sender
-                ]
-                
-                model = LiteLLMModel(
-                    client_args={"api_key": os.getenv("GOOGLE_API_KEY")},
-                    model_id="gemini/gemini-2.5-flash",
-                )
-                
-                agent = Agent(
-                    model,
-                    name=self.get_agent_name(),
-                    description=self.get_agent_description(),
-                    system_prompt=self.get_system_prompt(),
-                    tools=all_tools,
-                )
-                
-                return agent
-        except Exception as e:
-            print(f"Failed to create notification agent: {e}")
-            raise
+    def get_custom_tools(self) -> List[AgentTool]:
+        """Notification tools registered alongside the MCP tools"""
+        return [
+            send_templated_notification,
+            subject_composer_assistant,
+            html_formatter_assistant,
+            email_sender
+        ]
 
 if __name__ == "__main__":
     agent = NotificationAgent()
@@ -0,0 +1,218 @@
+import time
+import atexit
+import logging
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+BOOKING_CREATED = "BookingCreated"
+BOOKING_MODIFIED = "BookingModified"
+BOOKING_CANCELLED = "BookingCancelled"
+
+Event = Tuple[str, Dict[str, Any]]
+# send(event_type, booking) -> {"status": ..., "message": ...}
+SendNotification = Callable[[str, Dict[str, Any]], Dict[str, Any]]
+# validate(event_type, fields) -> None to accept, or the result to return instead
+ValidateEvent = Callable[[str, Dict[str, Any]], Optional[Dict[str, Any]]]
+
+
+def _fields(booking: Dict[str, Any]) -> Dict[str, Any]:
+    return {k: v for k, v in booking.items() if v not in (None, "")}
+
+
+def merge_fields(events: List[Event]) -> Dict[str, Any]:
+    """Booking fields across events, later values winning"""
+    merged: Dict[str, Any] = {}
+    for _, booking in events:
+        merged.update(_fields(booking))
+    return merged
+
+
+def collapse(events: List[Event]) -> Event:
+    """The one notification that replaces a booking's buffered events
+
+    A cancellation supersedes everything before it; earlier events only fill
+    in fields it lacks. Otherwise the fields are merged: a booking created
+    in the window is confirmed with its final details, and several
+    modifications become one update listing every change.
+    """
+    event_type, booking = events[-1]
+    if event_type == BOOKING_CANCELLED:
+        merged = merge_fields(events)
+        merged.pop("changes", None)
+        merged.pop("status", None)
+        return BOOKING_CANCELLED, dict(merged, **_fields(booking))
+
+    # Only what happened after a cancellation still applies
+    cancelled = [i for i, (t, _) in enumerate(events) if t == BOOKING_CANCELLED]
+    live = events[cancelled[-1] + 1:] if cancelled else events
+    if len(live) == 1:
+        return live[0]
+
+    merged = merge_fields(live)
+    if any(t == BOOKING_CREATED for t, _ in live):
+        # The guest has not been sent a confirmation yet; confirm the final state
+        merged.pop("changes", None)
+        merged.pop("status", None)
+        return BOOKING_CREATED, merged
+
+    changes = [str(b["changes"]) for _, b in live if b.get("changes")]
+    if changes:
+        merged["changes"] = "; ".join(changes)
+    return BOOKING_MODIFIED, merged
+
+
+@dataclass
+class _Pending:
+    events: List[Event] = field(default_factory=list)
+    first_at: float = 0.0
+    last_at: float = 0.0
+
+
+class NotificationBuffer:
+    """Holds booking notifications for a quiet window and sends one email per booking
+
+    Events are keyed by booking_id. A booking's email goes out once no new
+    event has arrived for ``quiet_window`` seconds, or ``max_delay`` seconds
+    after its first event, whichever is sooner. The buffered events are
+    collapsed first (see collapse()). Events in ``urgent_events`` are sent at
+    once, together with anything pending for the booking. A quiet window of
+    0 sends every event immediately. Emails saved are counted in metrics().
+    """
+
+    def __init__(
+        self,
+        send: SendNotification,
+        quiet_window: float = 0,
+        max_delay: float = 600,
+        urgent_events: Iterable[str] = (BOOKING_CANCELLED,),
+    ):
+        self.send = send
+        self.quiet_window = quiet_window
+        self.max_delay = max(max_delay, quiet_window)
+        self.urgent_events = set(urgent_events)
+        self._pending: Dict[str, _Pending] = {}
+        self._condition = threading.Condition()
+        self._worker: Optional[threading.Thread] = None
+        self._closed = False
+        self._metrics = {"events": 0, "emails_sent": 0, "emails_saved": 0, "urgent": 0, "failed": 0}
+
+    def submit(
+        self, event_type: str, booking: Dict[str, Any], validate: Optional[ValidateEvent] = None
+    ) -> Dict[str, Any]:
+        """Buffer an event, or send it now if it is urgent; returns a tool-style result
+
+        ``validate`` sees the event's fields completed from the booking's
+        pending events. It runs under the buffer's lock, so those events
+        cannot be sent in between and leave the event incomplete. If it
+        returns a result, the event is dropped and that result returned.
+        """
+        booking_id = str(booking.get("booking_id", ""))
+        urgent = event_type in self.urgent_events or self.quiet_window <= 0 or not booking_id
+        with self._condition:
+            if validate is not None:
+                pending = self._pending.get(booking_id) if booking_id else None
+                fields = merge_fields((pending.events if pending else []) + [(event_type, booking)])
+                rejected = validate(event_type, fields)
+                if rejected is not None:
+                    return rejected
+            self._metrics["events"] += 1
+            if urgent:
+                pending = self._pending.pop(booking_id, None) if booking_id else None
+                events = (pending.events if pending else []) + [(event_type, booking)]
+                self._metrics["urgent"] += event_type in self.urgent_events
+            else:
+                now = time.monotonic()
+                pending = self._pending.setdefault(booking_id, _Pending(first_at=now))
+                pending.events.append((event_type, booking))
+                pending.last_at = now
+                self._ensure_worker()
+                self._condition.notify()
+
+        if urgent:
+            return self._send(events)
+        return {
+            "status": "success",
+            "message": f"Notification for booking {booking_id} scheduled; it is sent once the booking "
+            f"has had no further changes for {self.quiet_window:g}s",
+        }
+
+    def flush(self, booking_id: Optional[str] = None):
+        """Send the pending email for one booking, or for every booking, now"""
+        with self._condition:
+            if booking_id is None:
+                due = list(self._pending.values())
+                self._pending = {}
+            else:
+                due = [p for p in [self._pending.pop(str(booking_id), None)] if p]
+        for pending in due:
+            self._send(pending.events)
+
+    def close(self):
+        """Stop the background sender and send what is left"""
+        with self._condition:
+            if self._closed:
+                return
+            self._closed = True
+            self._condition.notify()
+        if self._worker:
+            self._worker.join(timeout=5)
+        self.flush()
+
+    def metrics(self) -> Dict[str, int]:
+        with self._condition:
+            return dict(self._metrics, pending=sum(len(p.events) for p in self._pending.values()))
+
+    def samples(self):
+        """Counter and gauge samples for the metrics endpoint"""
+        metrics = self.metrics()
+        for key in ("events", "emails_sent", "emails_saved", "urgent", "failed"):
+            yield f"notification_{key}_total", {}, metrics[key]
+        yield "notification_pending_events", {}, metrics["pending"]
+
+    def _send(self, events: List[Event]) -> Dict[str, Any]:
+        event_type, booking = collapse(events)
+        if len(events) > 1:
+            logger.info(
+                f"Collapsed {len(events)} events for booking {booking.get('booking_id')} into one {event_type} email"
+            )
+        try:
+            result = self.send(event_type, booking)
+        except Exception as e:
+            result = {"status": "failure", "message": f"Failed to send email: {str(e)}"}
+        with self._condition:
+            if result.get("status") == "success":
+                self._metrics["emails_sent"] += 1
+                self._metrics["emails_saved"] += len(events) - 1
+            else:
+                self._metrics["failed"] += 1
+        if result.get("status") != "success":
+            logger.error(f"Notification for booking {booking.get('booking_id')} failed: {result.get('message')}")
+        return result
+
+    def _due_at(self, pending: _Pending) -> float:
+        return min(pending.last_at + self.quiet_window, pending.first_at + self.max_delay)
+
+    def _ensure_worker(self):
+        # Started on first use, so importing the agent module does not spawn a thread
+        if self._worker is None:
+            self._worker = threading.Thread(target=self._run, name="notification-buffer", daemon=True)
+            self._worker.start()
+            atexit.register(self.close)
+
+    def _run(self):
+        while True:
+            with self._condition:
+                if self._closed:
+                    return
+                now = time.monotonic()
+                due = [key for key, pending in self._pending.items() if self._due_at(pending) <= now]
+                if not due:
+                    next_due = min((self._due_at(p) for p in self._pending.values()), default=None)
+                    self._condition.wait(timeout=None if next_due is None else next_due - now)
+                    continue
+                batches = [self._pending.pop(key) for key in due]
+            for pending in batches:
+                self._send(pending.events)
@@ -12,8 +12,10 @@ from .base import BaseAgent
 class ReservationAgent(BaseAgent):
     """Agent responsible for managing hotel reservations"""
 
+    PORT = "9002"
+
     def __init__(self):
-        super().__init__(port="9002")
+        super().__init__(port=self.PORT)
 
     def get_agent_name(self) -> str:
         return "ReservationAgent"
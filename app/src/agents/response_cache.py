@@ -0,0 +1,243 @@
+import os
+import re
+import math
+import time
+import zlib
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple
+from strands import Agent
+from strands.agent.agent_result import AgentResult
+from strands.telemetry.metrics import EventLoopMetrics
+
+from ..utils.tool_cache import failed_status
+
+logger = logging.getLogger(__name__)
+
+# Names like "Grand Plaza Hotel" or "Seaside Inn" scope an answer to one property
+HOTEL_PATTERN = re.compile(
+    r"\b((?:[A-Z][\w'&-]*\s+){1,4}(?:Hotel|Inn|Resort|Suites|Lodge|Hostel)|Hotel\s+(?:[A-Z][\w'&-]*\s*){1,4})"
+)
+# Answers about a specific guest or booking are never shared
+PERSONAL_PATTERN = re.compile(r"[\w.+-]+@[\w-]+\.[\w.-]+|\b(?:booking|reservation)\s*(?:id|#|number)\b", re.I)
+ALL_HOTELS = "*"
+
+Embedder = Callable[[str], List[float]]
+
+
+def normalize_question(text: str) -> str:
+    """Lower-case, strip punctuation and collapse whitespace"""
+    return " ".join(re.findall(r"[a-z0-9]+", text.lower()))
+
+
+def hotel_scope(text: str) -> str:
+    match = HOTEL_PATTERN.search(text)
+    return normalize_question(match.group(1)) if match else ALL_HOTELS
+
+
+def hashing_embedder(dimensions: int = 4096) -> Embedder:
+    """Local hashing vectorizer over word unigrams and bigrams, L2-normalized"""
+
+    def embed(text: str) -> List[float]:
+        words = normalize_question(text).split()
+        features = words + [f"{a} {b}" for a, b in zip(words, words[1:])]
+        vector = [0.0] * dimensions
+        for feature in features:
+            vector[zlib.crc32(feature.encode("utf-8")) % dimensions] += 1.0
+        norm = math.sqrt(sum(v * v for v in vector)) or 1.0
+        return [v / norm for v in vector]
+
+    return embed
+
+
+@dataclass
+class CachedAnswer:
+    question: str
+    answer: str
+    expires_at: float
+    vector: Optional[List[float]] = None
+
+
+class ResponseCache:
+    """Answer cache for repeated policy questions
+
+    Answers are keyed by hotel scope and normalized question text and expire
+    after ``ttl`` seconds or when the knowledge-base version changes, either
+    through bump_kb_version() or a new value from ``version_source``. With a
+    ``similarity_threshold`` above zero, a miss falls back to the most similar
+    cached question in the same scope, compared by cosine similarity of
+    ``embedder`` vectors (a local hashing vectorizer by default).
+    """
+
+    def __init__(
+        self,
+        ttl: float = 3600,
+        max_entries: int = 512,
+        kb_version: str = "1",
+        similarity_threshold: float = 0.0,
+        embedder: Optional[Embedder] = None,
+        version_source: Optional[Callable[[], Optional[str]]] = None,
+    ):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.kb_version = kb_version
+        self.similarity_threshold = similarity_threshold
+        self.version_source = version_source
+        self.embed = (embedder or hashing_embedder()) if similarity_threshold > 0 else None
+        self._entries: "OrderedDict[Tuple[str, str], CachedAnswer]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._metrics = {"hits": 0, "similar_hits": 0, "misses": 0, "stores": 0, "evictions": 0}
+
+    def is_cacheable(self, question: str) -> bool:
+        return bool(normalize_question(question)) and not PERSONAL_PATTERN.search(question)
+
+    def get(self, question: str) -> Optional[str]:
+        self._check_version()
+        scope, key = hotel_scope(question), normalize_question(question)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get((scope, key))
+            if entry is not None and entry.expires_at > now:
+                self._entries.move_to_end((scope, key))
+                self._metrics["hits"] += 1
+                return entry.answer
+            if entry is not None:
+                del self._entries[(scope, key)]
+
+            candidates = [
+                (k, e) for k, e in self._entries.items() if k[0] == scope and e.vector and e.expires_at > now
+            ]
+        if self.embed and candidates:
+            vector = self.embed(question)
+            _, best = max(candidates, key=lambda item: self._cosine(vector, item[1].vector))
+            if self._cosine(vector, best.vector) >= self.similarity_threshold:
+                with self._lock:
+                    self._metrics["similar_hits"] += 1
+                logger.debug(f"Similar cached question: {best.question!r}")
+                return best.answer
+
+        with self._lock:
+            self._metrics["misses"] += 1
+        return None
+
+    def put(self, question: str, answer: str):
+        scope, key = hotel_scope(question), normalize_question(question)
+        vector = self.embed(question) if self.embed else None
+        with self._lock:
+            self._entries[(scope, key)] = CachedAnswer(question, answer, time.monotonic() + self.ttl, vector)
+            self._entries.move_to_end((scope, key))
+            self._metrics["stores"] += 1
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._metrics["evictions"] += 1
+
+    def bump_kb_version(self, version: Optional[str] = None):
+        """Drop every answer after the knowledge base has been re-synced"""
+        with self._lock:
+            self.kb_version = version or str(int(self.kb_version) + 1 if self.kb_version.isdigit() else 1)
+            self._entries.clear()
+        logger.info(f"Knowledge base version is now {self.kb_version}; response cache cleared")
+
+    def _check_version(self):
+        version = self.version_source() if self.version_source else None
+        if version and version != self.kb_version:
+            self.bump_kb_version(version)
+
+    def metrics(self) -> Dict[str, Any]:
+        with self._lock:
+            hits = self._metrics["hits"] + self._metrics["similar_hits"]
+            lookups = hits + self._metrics["misses"]
+            return dict(
+                self._metrics,
+                entries=len(self._entries),
+                kb_version=self.kb_version,
+                hit_ratio=round(hits / lookups, 4) if lookups else 0.0,
+            )
+
+    @staticmethod
+    def _cosine(a: List[float], b: List[float]) -> float:
+        return sum(x * y for x, y in zip(a, b))
+
+
+def prompt_text(prompt: Any) -> Optional[str]:
+    """Plain text of a string or text-only content block prompt, else None"""
+    if isinstance(prompt, str):
+        return prompt
+    if isinstance(prompt, list) and prompt and all(isinstance(b, dict) and set(b) == {"text"} for b in prompt):
+        return "\n".join(block["text"] for block in prompt)
+    return None
+
+
+def tool_results(message: Dict[str, Any]) -> List[Dict[str, Any]]:
+    return [block["toolResult"] for block in message.get("content", []) if "toolResult" in block]
+
+
+class CachedResponseAgent(Agent):
+    """Agent that answers repeated questions from a ResponseCache
+
+    Only answers grounded in tool results are stored, and only when every
+    tool call of the turn succeeded, so an apology written after a failed
+    knowledge-base lookup is never served to other guests.
+    """
+
+    def __init__(self, *args, response_cache: ResponseCache, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.response_cache = response_cache
+
+    async def stream_async(self, prompt: Any = None, **kwargs: Any) -> AsyncIterator[Any]:
+        question = prompt_text(prompt)
+        cacheable = question is not None and self.response_cache.is_cacheable(question)
+        answer = self.response_cache.get(question) if cacheable else None
+        if answer is not None:
+            message = {"role": "assistant", "content": [{"text": answer}]}
+            self.messages.extend([{"role": "user", "content": [{"text": question}]}, message])
+            yield {"result": AgentResult(stop_reason="end_turn", message=message, metrics=EventLoopMetrics(), state={})}
+            return
+
+        result = None
+        results = []
+        async for event in super().stream_async(prompt, **kwargs):
+            if "result" in event:
+                result = event["result"]
+            elif "message" in event:
+                results.extend(tool_results(event["message"]))
+            yield event
+
+        grounded = bool(results) and all(
+            r.get("status") != "error" and failed_status(r) is None for r in results
+        )
+        if cacheable and grounded and result is not None and result.stop_reason == "end_turn":
+            answer = "".join(block.get("text", "") for block in result.message["content"])
+            if answer.strip():
+                self.response_cache.put(question, answer)
+
+
+def file_version_source(path: str) -> Callable[[], Optional[str]]:
+    """Read the knowledge-base version from a file, re-reading only when it changes"""
+    state = {"mtime": None, "version": None}
+
+    def read() -> Optional[str]:
+        try:
+            mtime = os.stat(path).st_mtime
+        except OSError:
+            return state["version"]
+        if mtime != state["mtime"]:
+            with open(path) as f:
+                state["mtime"], state["version"] = mtime, f.read().strip() or None
+        return state["version"]
+
+    return read
+
+
+def create_response_cache() -> ResponseCache:
+    """Build the advisory response cache from the environment"""
+    version_file = os.getenv("ADVISORY_KB_VERSION_FILE")
+    return ResponseCache(
+        ttl=float(os.getenv("ADVISORY_CACHE_TTL", "3600")),
+        max_entries=int(os.getenv("ADVISORY_CACHE_MAX_ENTRIES", "512")),
+        kb_version=os.getenv("ADVISORY_KB_VERSION", "1"),
+        similarity_threshold=float(os.getenv("ADVISORY_CACHE_SIMILARITY", "0")),
+        version_source=file_version_source(version_file) if version_file else None,
+    )
@@ -2,14 +2,17 @@
 """
 Script to run individual agents for development and testing
 """
+import os
 import sys
 import argparse
+import uvicorn
 from dotenv import load_dotenv
 
 from .search_discovery import SearchDiscoveryAgent
 from .reservation import ReservationAgent
 from .guest_advisory import GuestAdvisoryAgent
 from .notification import NotificationAgent
+from .serving import warm_shared_caches
 
 load_dotenv(override=True)
 
@@ -20,6 +23,15 @@ AGENTS = {
     "notification": NotificationAgent,
 }
 
+def create_app():
+    """App factory run by each uvicorn worker; the agent and limits come from the environment"""
+    agent = AGENTS[os.environ["A2A_AGENT"]]()
+    return agent.create_app(
+        host=os.getenv("A2A_HOST", "0.0.0.0"),
+        max_in_flight=int(os.getenv("AGENT_MAX_IN_FLIGHT", "4")),
+        max_queue=int(os.getenv("AGENT_MAX_QUEUE", "32")),
+    )
+
 def main():
     parser = argparse.ArgumentParser(description="Run individual hotel booking agents")
     parser.add_argument(
@@ -32,14 +44,51 @@ def main():
         default="0.0.0.0",
         help="Host to bind to (default: 0.0.0.0)"
     )
-    
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=int(os.getenv("AGENT_WORKERS", "1")),
+        help="Worker processes sharing the agent's port (default: 1)"
+    )
+    parser.add_argument(
+        "--max-in-flight",
+        type=int,
+        default=int(os.getenv("AGENT_MAX_IN_FLIGHT", "4")),
+        help="Concurrent requests per worker before queueing (default: 4)"
+    )
+    parser.add_argument(
+        "--max-queue",
+        type=int,
+        default=int(os.getenv("AGENT_MAX_QUEUE", "32")),
+        help="Queued requests per worker before answering 503 (default: 32)"
+    )
+
     args = parser.parse_args()
     
     agent_class = AGENTS[args.agent]
-    agent = agent_class()
-    
-    print(f"Starting {agent.get_agent_name()}...")
-    agent.serve(host=args.host)
+    if args.workers <= 1:
+        agent = agent_class()
+        print(f"Starting {agent.get_agent_name()}...")
+        agent.serve(host=args.host, max_in_flight=args.max_in_flight, max_queue=args.max_queue)
+        return
+
+    # Workers are separate processes: configure them through the environment and
+    # let them start from the token and tool schemas fetched here
+    os.environ.update({
+        "A2A_AGENT": args.agent,
+        "A2A_HOST": args.host,
+        "AGENT_MAX_IN_FLIGHT": str(args.max_in_flight),
+        "AGENT_MAX_QUEUE": str(args.max_queue),
+    })
+    warm_shared_caches()
+    print(f"Starting {args.agent} agent with {args.workers} workers...")
+    uvicorn.run(
+        f"{__package__}.run_agents:create_app",
+        factory=True,
+        host=args.host,
+        port=int(agent_class.PORT),
+        workers=args.workers,
+    )
 
 if __name__ == "__main__":
     main()
@@ -9,8 +9,10 @@ from .base import BaseAgent
 class SearchDiscoveryAgent(BaseAgent):
     """Agent responsible for hotel search and discovery operations"""
 
+    PORT = "9001"
+
     def __init__(self):
-        super().__init__(port="9001")
+        super().__init__(port=self.PORT)
 
     def get_agent_name(self) -> str:
         return "SearchDiscoveryAgent"
@@ -0,0 +1,124 @@
+import os
+import json
+import asyncio
+import logging
+import tempfile
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+from ..utils.metrics import METRICS_PATH
+
+logger = logging.getLogger(__name__)
+
+LIVENESS_PATH = "/livez"
+READINESS_PATH = "/readyz"
+
+
+class ConcurrencyLimiter:
+    """ASGI wrapper that caps in-flight requests per worker
+
+    Up to ``max_in_flight`` requests run at once; up to ``max_queue`` more
+    wait for a slot for at most ``queue_timeout`` seconds. Anything beyond
+    that is rejected with 503 and Retry-After so callers can back off or try
+    another worker. Health probes and metrics scrapes are never limited.
+    """
+
+    def __init__(self, app, max_in_flight: int = 4, max_queue: int = 32, queue_timeout: float = 30):
+        self.app = app
+        self.max_in_flight = max_in_flight
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.in_flight = 0
+        self.queued = 0
+        self.rejected = 0
+        self._slots = asyncio.Semaphore(max_in_flight)
+
+    @property
+    def saturated(self) -> bool:
+        return self.in_flight + self.queued >= self.max_in_flight + self.max_queue
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"] in (LIVENESS_PATH, READINESS_PATH, METRICS_PATH):
+            await self.app(scope, receive, send)
+            return
+
+        if self.saturated:
+            await self._reject(send, "Server busy")
+            return
+
+        self.queued += 1
+        try:
+            await asyncio.wait_for(self._slots.acquire(), timeout=self.queue_timeout)
+        except asyncio.TimeoutError:
+            await self._reject(send, "Timed out waiting for a free worker slot")
+            return
+        finally:
+            self.queued -= 1
+
+        self.in_flight += 1
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.in_flight -= 1
+            self._slots.release()
+
+    async def _reject(self, send, reason: str):
+        self.rejected += 1
+        body = json.dumps({"error": reason}).encode("utf-8")
+        await send({
+            "type": "http.response.start",
+            "status": 503,
+            "headers": [(b"content-type", b"application/json"), (b"retry-after", b"1")],
+        })
+        await send({"type": "http.response.body", "body": body})
+
+    def metrics(self) -> dict:
+        return {
+            "in_flight": self.in_flight,
+            "queued": self.queued,
+            "rejected": self.rejected,
+            "max_in_flight": self.max_in_flight,
+            "max_queue": self.max_queue,
+        }
+
+    def samples(self):
+        """Gauge samples for the metrics endpoint"""
+        for key in ("in_flight", "queued", "rejected"):
+            yield f"server_requests_{key}", {}, getattr(self, key)
+
+
+def add_health_routes(app: Starlette, limiter: ConcurrencyLimiter):
+    """Liveness answers while the process runs; readiness fails while the queue is full"""
+
+    async def liveness(request: Request) -> JSONResponse:
+        return JSONResponse({"status": "alive", "pid": os.getpid()})
+
+    async def readiness(request: Request) -> JSONResponse:
+        status = 503 if limiter.saturated else 200
+        body = dict(limiter.metrics(), status="busy" if limiter.saturated else "ready")
+        return JSONResponse(body, status_code=status)
+
+    app.router.routes.insert(0, Route(LIVENESS_PATH, liveness, methods=["GET"]))
+    app.router.routes.insert(0, Route(READINESS_PATH, readiness, methods=["GET"]))
+
+
+def warm_shared_caches():
+    """Fetch the gateway token and tool schemas once so every worker starts from the disk caches"""
+    cache_dir = os.path.join(tempfile.gettempdir(), "hotel-agents")
+    os.makedirs(cache_dir, mode=0o700, exist_ok=True)
+    os.environ.setdefault("TOKEN_CACHE_PATH", os.path.join(cache_dir, "token.json"))
+    os.environ.setdefault("MCP_SCHEMA_CACHE_PATH", os.path.join(cache_dir, "mcp_schemas.json"))
+
+    from ..utils.auth import get_token_manager
+    from ..utils.mcp_client import get_mcp_session
+
+    try:
+        get_token_manager().get_token()
+        session = get_mcp_session()
+        session.get_tools()
+        session.close()
+    except Exception as e:
+        # Workers fall back to fetching on their own
+        logger.warning(f"Could not warm shared caches: {e}")
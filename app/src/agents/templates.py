@@ -0,0 +1,118 @@
+import html
+from dataclasses import dataclass
+from string import Template
+from typing import Any, Dict, List, Optional
+
+# Fields every known event needs before the template path can be used
+REQUIRED_FIELDS = ["booking_id", "hotel_name", "check_in_date", "check_out_date"]
+
+# Optional fields rendered as extra rows when present, in display order
+DETAIL_FIELDS = [
+    ("booking_id", "Booking ID"),
+    ("hotel_name", "Hotel"),
+    ("guest_email", "Guest"),
+    ("check_in_date", "Check-in"),
+    ("check_out_date", "Check-out"),
+    ("rooms", "Rooms"),
+    ("total_price", "Total price"),
+    ("status", "Status"),
+    ("changes", "Changes"),
+    ("cancellation_fee", "Cancellation fee"),
+]
+
+EVENT_TEMPLATES = {
+    "BookingCreated": {
+        "subject": Template("Booking Confirmed - $hotel_name, #$booking_id"),
+        "heading": "Your booking is confirmed",
+        "intro": Template(
+            "Thank you for booking with us. Your stay at <b>$hotel_name</b> "
+            "from <b>$check_in_date</b> to <b>$check_out_date</b> is confirmed."
+        ),
+        "status": "CONFIRMED",
+    },
+    "BookingModified": {
+        "subject": Template("Booking Updated - $hotel_name, #$booking_id"),
+        "heading": "Your booking has been updated",
+        "intro": Template(
+            "Your booking at <b>$hotel_name</b> has been updated. "
+            "Your stay is now from <b>$check_in_date</b> to <b>$check_out_date</b>."
+        ),
+        "status": "MODIFIED",
+    },
+    "BookingCancelled": {
+        "subject": Template("Booking Cancelled - #$booking_id"),
+        "heading": "Your booking has been cancelled",
+        "intro": Template(
+            "Your booking at <b>$hotel_name</b> for <b>$check_in_date</b> to "
+            "<b>$check_out_date</b> has been cancelled."
+        ),
+        "status": "CANCELLED",
+    },
+}
+
+PAGE_TEMPLATE = Template("""<html>
+<body style="margin:0;padding:0;background-color:#f4f4f4;font-family:Arial,Helvetica,sans-serif;">
+<table width="100%" cellpadding="0" cellspacing="0" style="background-color:#f4f4f4;padding:16px 0;">
+<tr><td align="center">
+<table width="100%" cellpadding="0" cellspacing="0" style="max-width:600px;background-color:#ffffff;">
+<tr><td style="padding:24px;background-color:#1f3a5f;color:#ffffff;font-size:20px;font-weight:bold;">$hotel_name</td></tr>
+<tr><td style="padding:24px;color:#333333;font-size:16px;">
+<h2 style="margin:0 0 16px 0;font-size:18px;">$heading</h2>
+<p style="margin:0 0 16px 0;line-height:1.5;">$intro</p>
+<table width="100%" cellpadding="6" cellspacing="0" style="border-collapse:collapse;font-size:14px;">
+$rows
+</table>
+</td></tr>
+<tr><td style="padding:16px 24px;color:#888888;font-size:12px;">This is an automated message from the hotel booking system.</td></tr>
+</table>
+</td></tr>
+</table>
+</body>
+</html>""")
+
+ROW_TEMPLATE = Template(
+    '<tr><td style="border-bottom:1px solid #eeeeee;color:#666666;">$label</td>'
+    '<td style="border-bottom:1px solid #eeeeee;"><b>$value</b></td></tr>'
+)
+
+
+@dataclass
+class RenderedEmail:
+    subject: str
+    html_body: str
+
+
+class NotificationTemplateRenderer:
+    """Renders notification emails for known booking events without an LLM"""
+
+    def missing_fields(self, booking: Dict[str, Any]) -> List[str]:
+        return [f for f in REQUIRED_FIELDS if booking.get(f) in (None, "")]
+
+    def can_render(self, event_type: str, booking: Dict[str, Any]) -> bool:
+        return event_type in EVENT_TEMPLATES and not self.missing_fields(booking)
+
+    def render(self, event_type: str, booking: Dict[str, Any]) -> Optional[RenderedEmail]:
+        """Render subject and HTML body, or None when the LLM path is needed"""
+        if not self.can_render(event_type, booking):
+            return None
+
+        spec = EVENT_TEMPLATES[event_type]
+        fields = {k: str(v) for k, v in booking.items() if v not in (None, "")}
+        fields.setdefault("status", spec["status"])
+        escaped = {k: html.escape(v) for k, v in fields.items()}
+
+        rows = "\n".join(
+            ROW_TEMPLATE.substitute(label=label, value=escaped[key])
+            for key, label in DETAIL_FIELDS
+            if key in escaped
+        )
+        html_body = PAGE_TEMPLATE.substitute(
+            hotel_name=escaped["hotel_name"],
+            heading=spec["heading"],
+            intro=spec["intro"].substitute(escaped),
+            rows=rows,
+        )
+        return RenderedEmail(
+            subject=spec["subject"].substitute(fields),
+            html_body=html_body,
+        )
@@ -1,6 +1,16 @@
 import os
+import json
+import tempfile
 from pydantic import BaseModel
-from typing import List
+from typing import Dict, List
+
+# Primary model then fallbacks, per agent or helper tool; "default" covers the rest.
+# "bedrock/<id>" uses Bedrock directly, anything else goes through LiteLLM.
+DEFAULT_MODEL_REGISTRY: Dict[str, List[str]] = {
+    "default": ["gemini/gemini-2.5-flash", "gemini/gemini-2.5-flash-lite"],
+    "SupervisorAgent": ["bedrock/anthropic.claude-3-haiku-20240307-v1:0", "gemini/gemini-2.5-flash"],
+    "subject_composer": ["gemini/gemini-2.5-flash-lite", "gemini/gemini-2.5-flash"],
+}
 
 class Settings(BaseModel):
     """Application configuration settings"""
@@ -18,11 +28,67 @@ class Settings(BaseModel):
     
     # Model Configuration
     google_api_key: str = os.getenv("GOOGLE_API_KEY", "")
+    # MODEL_REGISTRY is JSON in the same shape; its entries replace the defaults
+    model_registry: Dict[str, List[str]] = {
+        **DEFAULT_MODEL_REGISTRY,
+        **json.loads(os.getenv("MODEL_REGISTRY", "{}")),
+    }
+    # Fall back when a model sends nothing for this long; 0 disables
+    model_first_event_timeout: float = float(os.getenv("MODEL_FIRST_EVENT_TIMEOUT", "30"))
     
     # Agent Configuration
     actor_id: str = os.getenv("ACTOR_ID", "user_123")
     session_id: str = os.getenv("SESSION_ID", "personal_session_001")
     memory_name: str = "HotelBookingAgentMemory"
+    # Pin the memory resource; otherwise it is resolved by name and persisted per host
+    memory_id: str = os.getenv("MEMORY_ID", "")
+    memory_registry_path: str = os.getenv(
+        "MEMORY_REGISTRY_PATH", os.path.join(tempfile.gettempdir(), "hotel-agents", "memory_registry.json")
+    )
+    memory_validate_interval: float = float(os.getenv("MEMORY_VALIDATE_INTERVAL", "3600"))
+    memory_flush_batch_size: int = int(os.getenv("MEMORY_FLUSH_BATCH_SIZE", "20"))
+    memory_flush_interval: float = float(os.getenv("MEMORY_FLUSH_INTERVAL", "1.0"))
+    conversation_cache_mb: int = int(os.getenv("CONVERSATION_CACHE_MB", "32"))
+    history_token_budget: int = int(os.getenv("HISTORY_TOKEN_BUDGET", "2000"))
+    history_max_message_tokens: int = int(os.getenv("HISTORY_MAX_MESSAGE_TOKENS", "200"))
+    
+    # Orchestration Configuration
+    # "a2a" calls each agent over HTTP; "colocated" runs them inside the supervisor process
+    deployment_mode: str = os.getenv("DEPLOYMENT_MODE", "a2a")
+    parallel_dispatch: bool = os.getenv("PARALLEL_DISPATCH", "true").lower() == "true"
+    subagent_call_timeout: float = float(os.getenv("SUBAGENT_CALL_TIMEOUT", "60"))
+    # Total time for one user request; each sub-agent call gets what is left of it
+    request_budget: float = float(os.getenv("REQUEST_BUDGET", "120"))
+    circuit_failure_threshold: int = int(os.getenv("CIRCUIT_FAILURE_THRESHOLD", "5"))
+    circuit_reset_timeout: float = float(os.getenv("CIRCUIT_RESET_TIMEOUT", "30"))
+    # Read-only agents that may get a duplicate request when slower than their usual latency
+    hedge_agents: List[str] = [a for a in os.getenv("HEDGE_AGENTS", "").split(",") if a]
+    hedge_percentile: float = float(os.getenv("HEDGE_PERCENTILE", "95"))
+    hedge_min_samples: int = int(os.getenv("HEDGE_MIN_SAMPLES", "20"))
+    # Agents whose identical concurrent queries run once; never per-guest ones
+    coalesce_agents: List[str] = [
+        a for a in os.getenv("COALESCE_AGENTS", "SearchDiscoveryAgent,GuestAdvisoryAgent").split(",") if a
+    ]
+    a2a_pool_size: int = int(os.getenv("A2A_POOL_SIZE", "10"))
+    a2a_card_ttl: float = float(os.getenv("A2A_CARD_TTL", "300"))
+    a2a_probe_interval: float = float(os.getenv("A2A_PROBE_INTERVAL", "10"))
+    local_router: bool = os.getenv("LOCAL_ROUTER", "true").lower() == "true"
+    router_confidence_threshold: float = float(os.getenv("ROUTER_CONFIDENCE_THRESHOLD", "0.8"))
+    # JSON list of [request, agent] pairs; trains a classifier for requests no rule matches
+    router_training_path: str = os.getenv("ROUTER_TRAINING_PATH", "")
+    
+    # Batch Configuration: server-side caps; a batch request may ask for less
+    batch_max_items: int = int(os.getenv("BATCH_MAX_ITEMS", "500"))
+    batch_max_concurrency: int = int(os.getenv("BATCH_MAX_CONCURRENCY", "4"))
+    # Supervisor tokens per minute across a batch; 0 for no limit
+    batch_tokens_per_minute: int = int(os.getenv("BATCH_TOKENS_PER_MINUTE", "0"))
+    # Reserved per item until its actual usage is known
+    batch_estimated_tokens: int = int(os.getenv("BATCH_ESTIMATED_TOKENS", "2000"))
+    
+    # Session Pool Configuration
+    max_sessions: int = int(os.getenv("SUPERVISOR_MAX_SESSIONS", "100"))
+    max_session_pool_mb: int = int(os.getenv("SUPERVISOR_SESSION_POOL_MB", "256"))
+    session_idle_ttl: float = float(os.getenv("SUPERVISOR_SESSION_IDLE_TTL", "1800"))
     
     # Agent URLs
     agent_urls: List[str] = [
@@ -32,5 +98,22 @@ class Settings(BaseModel):
         "http://127.0.0.1:9004",  # Notification Agent
     ]
     
+    # Agent names, in the same order as agent_urls
+    agent_names: List[str] = [
+        "SearchDiscoveryAgent",
+        "ReservationAgent",
+        "GuestAdvisoryAgent",
+        "NotificationAgent",
+    ]
+    
+    def get_agent_url(self, agent_name: str) -> str:
+        """Get the URL of an agent by name"""
+        return dict(zip(self.agent_names, self.agent_urls))[agent_name]
+    
+    def get_agent_name(self, agent_url: str) -> str:
+        """Get the name of an agent by URL, or the URL itself if unknown"""
+        urls = {url.rstrip("/"): name for name, url in zip(self.agent_names, self.agent_urls)}
+        return urls.get(agent_url.rstrip("/"), agent_url)
+    
     class Config:
         env_file = ".env"
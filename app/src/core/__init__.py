@@ -1,4 +1,32 @@
-from .supervisor import SupervisorAgent
-from .memory import MemoryManager, MemoryHookProvider
+from importlib import import_module
 
-__all__ = ["SupervisorAgent", "MemoryManager", "MemoryHookProvider"]
+# Exports are imported on first use, so loading a light module such as
+# core.streaming does not pull in strands, boto3 and the A2A SDK
+_EXPORTS = {
+    "SupervisorAgent": ".supervisor",
+    "MemoryManager": ".memory",
+    "MemoryHookProvider": ".memory",
+    "MemoryRegistry": ".memory_registry",
+    "MemoryWriteBuffer": ".memory_writer",
+    "ConversationCache": ".conversation_cache",
+    "CompactingConversationManager": ".history",
+    "HistoryCompactor": ".history",
+    "ParallelDispatcher": ".dispatch",
+    "SessionAgentPool": ".session_pool",
+    "IntentRouter": ".router",
+    "ColocatedAgentProvider": ".colocated",
+    "PooledA2AClient": ".a2a_client",
+    "ResilientAgentCaller": ".agent_calls",
+    "BackgroundInitializer": ".startup",
+    "BatchRunner": ".batch",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
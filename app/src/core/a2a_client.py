@@ -0,0 +1,266 @@
+import time
+import asyncio
+import logging
+from uuid import uuid4
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+import httpx
+from a2a.client import (
+    A2ACardResolver,
+    A2AClientHTTPError,
+    A2AClientTimeoutError,
+    Client,
+    ClientConfig,
+    ClientFactory,
+)
+from a2a.types import AgentCard, Message, Part, Role, TextPart
+from strands import tool
+from strands.types.tools import AgentTool
+
+from ..utils.resilience import inject_deadline
+from ..utils.tracing import inject_trace_context, traced
+
+logger = logging.getLogger(__name__)
+
+# Errors that mean the agent could not be reached, as opposed to a failed request
+UNREACHABLE_ERRORS = (httpx.TransportError, A2AClientHTTPError, A2AClientTimeoutError)
+
+
+@dataclass
+class AgentConnection:
+    """Pooled HTTP client, cached card and health of one A2A agent"""
+
+    url: str
+    http: httpx.AsyncClient
+    card: Optional[AgentCard] = None
+    client: Optional[Client] = None
+    card_fetched_at: float = 0.0
+    healthy: bool = True
+    consecutive_failures: int = 0
+
+
+class PooledA2AClient:
+    """A2A client with per-agent keep-alive pools, cached cards, deadlines and health probes
+
+    Each agent gets its own persistent httpx client, so calls reuse warm
+    connections. Agent cards are cached and re-fetched after ``card_ttl``
+    seconds. Every call has a deadline. A background probe re-checks each
+    agent's card every ``probe_interval`` seconds. An agent that fails
+    ``failure_threshold`` probes or calls in a row is marked unhealthy. It is
+    then left out of the agent list and calls to it fail fast until a probe
+    succeeds again. Results have the same shape as A2AClientToolProvider's.
+    """
+
+    def __init__(
+        self,
+        agent_urls: List[str],
+        call_timeout: float = 60,
+        connect_timeout: float = 2,
+        pool_size: int = 10,
+        card_ttl: float = 300,
+        probe_interval: float = 10,
+        failure_threshold: int = 2,
+    ):
+        self.agent_urls = [url.rstrip("/") for url in agent_urls]
+        self.call_timeout = call_timeout
+        self.connect_timeout = connect_timeout
+        self.pool_size = pool_size
+        self.card_ttl = card_ttl
+        self.probe_interval = probe_interval
+        self.failure_threshold = failure_threshold
+        self._connections: Dict[str, AgentConnection] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._probe_task: Optional[asyncio.Task] = None
+        self._metrics = {"calls": 0, "errors": 0, "timeouts": 0, "fast_failures": 0, "card_fetches": 0}
+
+    def _connection(self, url: str) -> AgentConnection:
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            # httpx clients are bound to the loop they were first used on
+            self._loop = loop
+            self._connections = {}
+            self._probe_task = None
+        if self._probe_task is None and self.probe_interval > 0:
+            self._probe_task = loop.create_task(self._probe_loop())
+
+        key = url.rstrip("/")
+        if key not in self._connections:
+            self._connections[key] = AgentConnection(
+                url=key,
+                http=httpx.AsyncClient(
+                    timeout=httpx.Timeout(self.call_timeout, connect=self.connect_timeout),
+                    limits=httpx.Limits(
+                        max_connections=self.pool_size,
+                        max_keepalive_connections=self.pool_size,
+                        keepalive_expiry=60,
+                    ),
+                    # Carries the trace context and the remaining request budget to the agent
+                    event_hooks={"request": [inject_trace_context, inject_deadline]},
+                ),
+            )
+        return self._connections[key]
+
+    async def _refresh_card(self, conn: AgentConnection, timeout: Optional[float] = None):
+        resolver = A2ACardResolver(httpx_client=conn.http, base_url=conn.url)
+        card = await asyncio.wait_for(resolver.get_agent_card(), timeout=timeout or self.call_timeout)
+        self._metrics["card_fetches"] += 1
+        if conn.card is None or card != conn.card:
+            conn.client = ClientFactory(ClientConfig(httpx_client=conn.http, streaming=False)).create(card)
+        conn.card = card
+        conn.card_fetched_at = time.monotonic()
+
+    async def _client(self, conn: AgentConnection) -> Client:
+        if conn.client is None:
+            await self._refresh_card(conn)
+        elif time.monotonic() - conn.card_fetched_at > self.card_ttl:
+            try:
+                await self._refresh_card(conn)
+            except Exception as e:
+                logger.warning(f"Keeping stale agent card for {conn.url}: {e}")
+        return conn.client
+
+    def _record(self, conn: AgentConnection, ok: bool):
+        if ok:
+            if not conn.healthy:
+                logger.info(f"Agent at {conn.url} recovered")
+            conn.healthy = True
+            conn.consecutive_failures = 0
+            return
+        conn.consecutive_failures += 1
+        if conn.healthy and conn.consecutive_failures >= self.failure_threshold:
+            conn.healthy = False
+            logger.warning(f"Agent at {conn.url} marked unhealthy")
+
+    async def send_message(
+        self, message_text: str, target_agent_url: str, message_id: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Send a message to an agent within the call deadline"""
+        message_id = message_id or uuid4().hex
+        conn = self._connection(target_agent_url)
+        base = {"message_id": message_id, "target_agent_url": target_agent_url}
+        self._metrics["calls"] += 1
+        if not conn.healthy:
+            self._metrics["fast_failures"] += 1
+            return dict(base, status="error", error=f"Agent at {target_agent_url} is currently unavailable")
+
+        with traced("a2a.send_message", **{"a2a.target_url": target_agent_url, "a2a.message_id": message_id}) as span:
+            try:
+                response = await asyncio.wait_for(self._send(conn, message_text, message_id), timeout=self.call_timeout)
+                self._record(conn, ok=True)
+                return dict(base, status="success", response=response)
+            except asyncio.TimeoutError:
+                self._metrics["timeouts"] += 1
+                self._record(conn, ok=False)
+                span.set_attribute("error.type", "timeout")
+                return dict(base, status="error", error=f"Agent did not respond within {self.call_timeout}s")
+            except Exception as e:
+                self._metrics["errors"] += 1
+                self._record(conn, ok=not isinstance(e, UNREACHABLE_ERRORS))
+                span.record_exception(e)
+                logger.error(f"Error sending message to {target_agent_url}: {e}")
+                return dict(base, status="error", error=str(e))
+
+    async def _send(self, conn: AgentConnection, message_text: str, message_id: str) -> Dict[str, Any]:
+        client = await self._client(conn)
+        message = Message(
+            kind="message",
+            role=Role.user,
+            parts=[Part(TextPart(kind="text", text=message_text))],
+            message_id=message_id,
+        )
+        async for event in client.send_message(message):
+            if isinstance(event, Message):
+                return event.model_dump(mode="python", exclude_none=True)
+            if isinstance(event, tuple) and len(event) == 2:
+                task, update = event
+                return {
+                    "task": task.model_dump(mode="python", exclude_none=True),
+                    "update": update.model_dump(mode="python", exclude_none=True) if update else None,
+                }
+            return {"raw_response": str(event)}
+        raise RuntimeError("No response received from agent")
+
+    async def _probe_loop(self):
+        while True:
+            await asyncio.sleep(self.probe_interval)
+            await self.probe()
+
+    async def probe(self):
+        """Re-check every agent's card; this also refreshes the cached cards"""
+
+        async def check(url: str):
+            conn = self._connection(url)
+            try:
+                await self._refresh_card(conn, timeout=self.connect_timeout * 2)
+                self._record(conn, ok=True)
+            except Exception as e:
+                logger.debug(f"Health probe failed for {url}: {e}")
+                self._record(conn, ok=False)
+
+        await asyncio.gather(*(check(url) for url in self.agent_urls))
+
+    def healthy_agents(self) -> List[str]:
+        return [
+            url for url in self.agent_urls
+            if url not in self._connections or self._connections[url].healthy
+        ]
+
+    async def close(self):
+        if self._probe_task:
+            self._probe_task.cancel()
+            self._probe_task = None
+        for conn in self._connections.values():
+            await conn.http.aclose()
+        self._connections = {}
+
+    def metrics(self) -> Dict[str, Any]:
+        return dict(
+            self._metrics,
+            unhealthy=[url for url, conn in self._connections.items() if not conn.healthy],
+        )
+
+    @tool
+    async def a2a_send_message(self, message_text: str, target_agent_url: str) -> Dict[str, Any]:
+        """
+        Send a message to a specific A2A agent and return the response.
+
+        Use the exact agent URL from your instructions or from a2a_list_discovered_agents.
+        Agents that are currently unavailable fail immediately; tell the user rather than retrying.
+
+        Args:
+            message_text: The message content to send to the agent
+            target_agent_url: The exact URL of the target A2A agent
+
+        Returns:
+            dict: "status", the agent's "response" (if successful) or "error", and "target_agent_url"
+        """
+        return await self.send_message(message_text, target_agent_url)
+
+    @tool
+    async def a2a_list_discovered_agents(self) -> Dict[str, Any]:
+        """
+        List the A2A agents that are currently available, with their URLs, names and descriptions.
+
+        Returns:
+            dict: "status", the available "agents" and the URLs of "unavailable" agents
+        """
+        agents = []
+        for url in self.healthy_agents():
+            conn = self._connection(url)
+            try:
+                await self._client(conn)
+                agents.append({"url": url, "name": conn.card.name, "description": conn.card.description})
+            except Exception as e:
+                logger.debug(f"Could not fetch agent card for {url}: {e}")
+                self._record(conn, ok=False)
+        available = {agent["url"] for agent in agents}
+        return {
+            "status": "success",
+            "agents": agents,
+            "unavailable": [url for url in self.agent_urls if url not in available],
+        }
+
+    @property
+    def tools(self) -> List[AgentTool]:
+        return [self.a2a_send_message, self.a2a_list_discovered_agents]
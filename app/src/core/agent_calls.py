@@ -0,0 +1,200 @@
+import re
+import copy
+import time
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional
+from strands import tool
+
+from ..utils.metrics import get_metrics_registry
+from ..utils.resilience import LatencyTracker, SingleFlight, get_circuit_breaker, remaining
+
+logger = logging.getLogger(__name__)
+
+SendMessage = Callable[..., Awaitable[Dict[str, Any]]]
+
+# Messages that carry guest details are never shared between requests
+EMAIL = re.compile(r"[\w.+-]+@[\w-]+\.[\w.-]+")
+
+# How a failing agent is described to the user
+SERVICE_NAMES = {
+    "SearchDiscoveryAgent": "Hotel search",
+    "ReservationAgent": "Reservations",
+    "GuestAdvisoryAgent": "Hotel policy lookup",
+    "NotificationAgent": "Email notifications",
+}
+
+
+def normalize_query(message_text: str) -> str:
+    """Case, spacing and trailing punctuation do not change what a sub-agent is asked"""
+    return re.sub(r"\s+", " ", message_text.strip().lower()).rstrip(" .!?")
+
+
+def unavailable_message(result: Dict[str, Any]) -> str:
+    """A reply the user can be given as-is when an agent's circuit is open"""
+    service = SERVICE_NAMES.get(result.get("agent"), result.get("agent", "This service"))
+    seconds = max(1, round(result.get("retry_after_s", 0)))
+    return f"{service} is temporarily unavailable. Please try again in about {seconds} second{'s' if seconds > 1 else ''}."
+
+
+class ResilientAgentCaller:
+    """Deadlines, hedging, circuit breakers and single-flight around sub-agent calls
+
+    Wraps the ``send_message`` of the A2A client or the colocated provider.
+    Each call gets what is left of the request budget, capped at
+    ``call_timeout``. Agents in ``hedge_agents`` (read-only ones only) get a
+    duplicate request once a call is slower than their recent
+    ``hedge_percentile`` latency; the first success wins. Each agent has a
+    circuit breaker; while it is open calls fail at once with
+    ``error_type="circuit_open"``. Identical concurrent queries to
+    ``coalesce_agents`` run once and share the result.
+    """
+
+    def __init__(
+        self,
+        send_message: SendMessage,
+        agent_name: Callable[[str], str],
+        call_timeout: float = 60,
+        failure_threshold: Optional[int] = None,
+        reset_timeout: Optional[float] = None,
+        hedge_agents: Iterable[str] = (),
+        hedge_percentile: float = 95,
+        hedge_min_samples: int = 20,
+        coalesce_agents: Iterable[str] = (),
+    ):
+        self.send = send_message
+        self.agent_name = agent_name
+        self.call_timeout = call_timeout
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.hedge_agents = set(hedge_agents)
+        self.hedge_percentile = hedge_percentile
+        self.hedge_min_samples = hedge_min_samples
+        self.coalesce_agents = set(coalesce_agents)
+        self.single_flight = SingleFlight()
+        self._latency: Dict[str, LatencyTracker] = {}
+
+    def breaker(self, name: str):
+        return get_circuit_breaker(f"agent:{name}", self.failure_threshold, self.reset_timeout)
+
+    def hedge_delay(self, name: str) -> Optional[float]:
+        """How long to wait before hedging a call to ``name``; None to never hedge"""
+        if name not in self.hedge_agents or name not in self._latency:
+            return None
+        return self._latency[name].percentile(self.hedge_percentile, self.hedge_min_samples)
+
+    @staticmethod
+    def _error(target_agent_url: str, message_id: Optional[str], error_type: str, error: str, **extra) -> Dict[str, Any]:
+        return dict(
+            extra,
+            status="error",
+            error_type=error_type,
+            error=error,
+            target_agent_url=target_agent_url,
+            message_id=message_id,
+        )
+
+    async def send_message(
+        self, message_text: str, target_agent_url: str, message_id: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Call a sub-agent within the request deadline; same arguments and result shape as the A2A client"""
+        name = self.agent_name(target_agent_url)
+        timeout = remaining(self.call_timeout)
+        if timeout is not None and timeout <= 0:
+            get_metrics_registry().inc("subagent_calls_total", agent=name, outcome="deadline_exceeded")
+            return self._error(
+                target_agent_url, message_id, "deadline_exceeded",
+                f"The request ran out of time before {name} could be called", agent=name,
+            )
+
+        breaker = self.breaker(name)
+        if not breaker.allow():
+            get_metrics_registry().inc("circuit_rejections_total", target=breaker.name)
+            return self._error(
+                target_agent_url, message_id, "circuit_open",
+                f"{name} is failing and temporarily unavailable. Do not retry; tell the user.",
+                agent=name, retry_after_s=round(breaker.retry_after(), 1),
+            )
+
+        if name not in self.coalesce_agents or EMAIL.search(message_text):
+            return await self._call(name, message_text, target_agent_url, timeout, message_id)
+
+        key = (target_agent_url.rstrip("/"), normalize_query(message_text))
+        result, shared = await self.single_flight.do(
+            key, lambda: self._call(name, message_text, target_agent_url, timeout, message_id)
+        )
+        if shared:
+            get_metrics_registry().inc("singleflight_coalesced_total", scope="subagent", target=name)
+        return copy.deepcopy(result)
+
+    async def _call(
+        self, name: str, message_text: str, target_agent_url: str, timeout: Optional[float], message_id: Optional[str]
+    ) -> Dict[str, Any]:
+        start = time.perf_counter()
+        try:
+            async with asyncio.timeout(timeout):
+                result = await self._hedged(name, message_text, target_agent_url, message_id)
+        except TimeoutError:
+            result = self._error(
+                target_agent_url, message_id, "deadline_exceeded",
+                f"{name} did not respond within {timeout:.1f}s", agent=name,
+            )
+
+        ok = result.get("status") == "success"
+        self.breaker(name).record(ok=ok)
+        if ok:
+            self._latency.setdefault(name, LatencyTracker()).observe(time.perf_counter() - start)
+        get_metrics_registry().inc(
+            "subagent_calls_total", agent=name, outcome="success" if ok else result.get("error_type", "error")
+        )
+        return result
+
+    async def _hedged(
+        self, name: str, message_text: str, target_agent_url: str, message_id: Optional[str]
+    ) -> Dict[str, Any]:
+        delay = self.hedge_delay(name)
+        primary = asyncio.ensure_future(self.send(message_text, target_agent_url, message_id))
+        if delay is None:
+            return await primary
+
+        pending = {primary}
+        try:
+            done, _ = await asyncio.wait(pending, timeout=delay)
+            if done:
+                return primary.result()
+
+            logger.info(f"{name} slower than {delay:.2f}s, sending a hedged request")
+            hedge = asyncio.ensure_future(self.send(message_text, target_agent_url))
+            pending.add(hedge)
+            result = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    result = task.result()
+                    if result.get("status") == "success":
+                        winner = "hedge" if task is hedge else "primary"
+                        get_metrics_registry().inc("subagent_hedges_total", agent=name, winner=winner)
+                        return result
+            get_metrics_registry().inc("subagent_hedges_total", agent=name, winner="none")
+            return result
+        finally:
+            for task in pending:
+                task.cancel()
+
+    @tool
+    async def a2a_send_message(self, message_text: str, target_agent_url: str) -> Dict[str, Any]:
+        """
+        Send a message to a specific A2A agent and return the response.
+
+        Use the exact agent URL from your instructions or from a2a_list_discovered_agents.
+        If the result has error_type "circuit_open" or "deadline_exceeded", do not call the agent again;
+        tell the user right away that the service is temporarily unavailable.
+
+        Args:
+            message_text: The message content to send to the agent
+            target_agent_url: The exact URL of the target A2A agent
+
+        Returns:
+            dict: "status", the agent's "response" (if successful) or "error" and "error_type", and "target_agent_url"
+        """
+        return await self.send_message(message_text, target_agent_url)
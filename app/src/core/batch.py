@@ -0,0 +1,182 @@
+import os
+import json
+import time
+import asyncio
+import logging
+from uuid import uuid4
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterable, Iterator, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+# process(question, actor_id, session_id) -> AgentResult or RoutedResponse
+Process = Callable[[str, Optional[str], Optional[str]], Awaitable[Any]]
+
+
+def response_tokens(response: Any) -> Optional[int]:
+    """Tokens the supervisor used for one request; None when it did not call its model"""
+    metrics = getattr(response, "metrics", None)
+    invocations = getattr(metrics, "agent_invocations", None)
+    if not invocations:
+        return None
+    return invocations[-1].usage.get("totalTokens")
+
+
+class TokenRateLimiter:
+    """Token bucket holding a batch under ``tokens_per_minute``
+
+    Each item reserves ``estimate`` tokens before it starts and settles the
+    difference with its actual usage when it finishes, so later items wait
+    longer after expensive ones. A limit of 0 disables the bucket.
+    """
+
+    def __init__(self, tokens_per_minute: int):
+        self.capacity = tokens_per_minute
+        self.available = float(tokens_per_minute)
+        self._refilled_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.available = min(self.capacity, self.available + (now - self._refilled_at) * self.capacity / 60)
+        self._refilled_at = now
+
+    async def acquire(self, estimate: int):
+        if self.capacity <= 0:
+            return
+        estimate = min(estimate, self.capacity)
+        async with self._lock:
+            self._refill()
+            while self.available < estimate:
+                # Wake up at least every second: settled items may have given tokens back
+                await asyncio.sleep(min(1.0, (estimate - self.available) * 60 / self.capacity))
+                self._refill()
+            self.available -= estimate
+
+    def settle(self, estimate: int, actual: int):
+        if self.capacity > 0:
+            self._refill()
+            self.available -= actual - min(estimate, self.capacity)
+
+
+class BatchRunner:
+    """Runs many inquiries concurrently and yields each result as it completes
+
+    At most ``max_concurrency`` items run at once and, when
+    ``tokens_per_minute`` is set, items are held back to stay under it.
+    Items are read lazily, so ``items`` can be a generator over a large file.
+    Each item is a dict with "question" and optionally "id", "actor_id"
+    and "session_id". Items without a session get one of their own; items
+    sharing a session run one after another.
+    """
+
+    def __init__(
+        self,
+        process: Process,
+        max_concurrency: int = 4,
+        tokens_per_minute: int = 0,
+        estimated_tokens: int = 2000,
+    ):
+        self.process = process
+        self.max_concurrency = max(1, max_concurrency)
+        self.limiter = TokenRateLimiter(tokens_per_minute)
+        self.estimated_tokens = estimated_tokens
+        self.session_prefix = f"batch-{uuid4().hex[:8]}"
+
+    async def _run_item(self, index: int, item: Dict[str, Any]) -> Dict[str, Any]:
+        item_id = item.get("id", index)
+        result = {"id": item_id, "session_id": item.get("session_id") or f"{self.session_prefix}-{item_id}"}
+        question = item.get("question")
+        if not question:
+            return dict(result, status="error", error="No question provided")
+
+        await self.limiter.acquire(self.estimated_tokens)
+        start = time.perf_counter()
+        tokens = None
+        try:
+            response = await self.process(question, item.get("actor_id"), result["session_id"])
+            tokens = response_tokens(response)
+            result.update(status="success", text=str(response))
+        except Exception as e:
+            logger.error(f"Batch item {result['id']} failed: {e}")
+            result.update(status="error", error=str(e))
+        finally:
+            self.limiter.settle(self.estimated_tokens, tokens or 0)
+        result.update(tokens=tokens, elapsed_ms=round((time.perf_counter() - start) * 1000))
+        return result
+
+    async def run(self, items: Iterable[Dict[str, Any]]) -> AsyncIterator[Dict[str, Any]]:
+        """Yield one result per item, in completion order"""
+        source = iter(enumerate(items))
+        results: asyncio.Queue = asyncio.Queue()
+
+        async def worker():
+            # Workers share the iterator, so items are read only as a slot frees up
+            for index, item in source:
+                await results.put(await self._run_item(index, item))
+
+        async def run_workers():
+            try:
+                await asyncio.gather(*(worker() for _ in range(self.max_concurrency)))
+            finally:
+                await results.put(None)
+
+        runner = asyncio.create_task(run_workers())
+        try:
+            while (result := await results.get()) is not None:
+                yield result
+            # Re-raise an error reading the items
+            await runner
+        finally:
+            runner.cancel()
+
+
+def read_jsonl(path: str, skip_ids: Optional[Set[Any]] = None) -> Iterator[Dict[str, Any]]:
+    """Stream batch items from a JSONL file; each line's "id" defaults to its line number"""
+    with open(path) as f:
+        for line_number, line in enumerate(f, start=1):
+            if not line.strip():
+                continue
+            item = json.loads(line)
+            item.setdefault("id", line_number)
+            if skip_ids and item["id"] in skip_ids:
+                continue
+            yield item
+
+
+def compact_output(path: str) -> int:
+    """Keep only the last record per id in an output file; returns the records dropped
+
+    A resumed run appends, so an item that failed and then succeeded on a
+    rerun has two records. The file is rewritten in place, in the order the
+    surviving records were written.
+    """
+    latest: Dict[str, str] = {}
+    total = 0
+    with open(path) as f:
+        for line in f:
+            if not line.strip():
+                continue
+            total += 1
+            key = json.dumps(json.loads(line).get("id"))
+            # Re-inserting moves the id to the position of its newest record
+            latest.pop(key, None)
+            latest[key] = line if line.endswith("\n") else line + "\n"
+    if len(latest) == total:
+        return 0
+    with open(f"{path}.tmp", "w") as f:
+        f.writelines(latest.values())
+    os.replace(f"{path}.tmp", path)
+    return total - len(latest)
+
+
+def completed_ids(path: str) -> Set[Any]:
+    """IDs already answered successfully in an output file, so a rerun can resume"""
+    try:
+        with open(path) as f:
+            return {
+                result["id"]
+                for result in (json.loads(line) for line in f if line.strip())
+                if result.get("status") == "success"
+            }
+    except FileNotFoundError:
+        return set()
@@ -0,0 +1,121 @@
+import asyncio
+import logging
+from uuid import uuid4
+from typing import Any, Dict, List, Optional
+from strands import Agent, tool
+from strands.types.tools import AgentTool
+
+from ..config.settings import Settings
+from ..utils.tracing import traced
+
+logger = logging.getLogger(__name__)
+
+
+class ColocatedAgentProvider:
+    """In-process replacement for the A2A client
+
+    Specialist agents run inside the supervisor's process and are called
+    directly, with no JSON-RPC or loopback HTTP. Agents are still addressed
+    by their configured URLs and results have the A2A client's shape, so the
+    supervisor prompt, dispatcher and router work unchanged. Calls to the same
+    agent are serialized and each starts from an empty conversation, like a
+    fresh A2A request.
+    """
+
+    def __init__(self, agents: Dict[str, Agent]):
+        self.agents = {url.rstrip("/"): agent for url, agent in agents.items()}
+        self._locks = {url: asyncio.Lock() for url in self.agents}
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> "ColocatedAgentProvider":
+        """Build every specialist agent; they share the process-wide MCP session and token cache"""
+        from ..agents import GuestAdvisoryAgent, NotificationAgent, ReservationAgent, SearchDiscoveryAgent
+
+        agent_classes = {
+            "SearchDiscoveryAgent": SearchDiscoveryAgent,
+            "ReservationAgent": ReservationAgent,
+            "GuestAdvisoryAgent": GuestAdvisoryAgent,
+            "NotificationAgent": NotificationAgent,
+        }
+        agents = {
+            settings.get_agent_url(name): agent_classes[name]().agent
+            for name in settings.agent_names
+            if name in agent_classes
+        }
+        logger.info(f"Running {len(agents)} agents in-process")
+        return cls(agents)
+
+    async def send_message(
+        self, message_text: str, target_agent_url: str, message_id: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Call an in-process agent; same arguments and result shape as the A2A client"""
+        message_id = message_id or uuid4().hex
+        key = target_agent_url.rstrip("/")
+        agent = self.agents.get(key)
+        if agent is None:
+            return {
+                "status": "error",
+                "error": f"No agent is hosted at {target_agent_url}",
+                "message_id": message_id,
+                "target_agent_url": target_agent_url,
+            }
+
+        try:
+            with traced("a2a.send_message", **{"a2a.target_url": target_agent_url, "a2a.message_id": message_id}):
+                async with self._locks[key]:
+                    agent.messages = []
+                    result = await agent.invoke_async(message_text)
+            text = "".join(block.get("text", "") for block in result.message["content"])
+            return {
+                "status": "success",
+                "response": {
+                    "kind": "message",
+                    "role": "agent",
+                    "parts": [{"kind": "text", "text": text}],
+                    "message_id": uuid4().hex,
+                },
+                "message_id": message_id,
+                "target_agent_url": target_agent_url,
+            }
+        except Exception as e:
+            logger.exception(f"Error sending message to {target_agent_url}")
+            return {
+                "status": "error",
+                "error": str(e),
+                "message_id": message_id,
+                "target_agent_url": target_agent_url,
+            }
+
+    @tool
+    async def a2a_send_message(self, message_text: str, target_agent_url: str) -> Dict[str, Any]:
+        """
+        Send a message to a specific agent and return the response.
+
+        Args:
+            message_text: The message content to send to the agent
+            target_agent_url: The exact URL of the target agent, as listed in your instructions
+
+        Returns:
+            dict: "status", the agent's "response" (if successful) or "error", and "target_agent_url"
+        """
+        return await self.send_message(message_text, target_agent_url)
+
+    @tool
+    async def a2a_list_discovered_agents(self) -> Dict[str, Any]:
+        """
+        List the available agents with their URLs, names and descriptions.
+
+        Returns:
+            dict: "status" and "agents", one entry per agent
+        """
+        return {
+            "status": "success",
+            "agents": [
+                {"url": url, "name": agent.name, "description": agent.description}
+                for url, agent in self.agents.items()
+            ],
+        }
+
+    @property
+    def tools(self) -> List[AgentTool]:
+        return [self.a2a_send_message, self.a2a_list_discovered_agents]
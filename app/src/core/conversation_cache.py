@@ -0,0 +1,83 @@
+import threading
+from collections import OrderedDict, deque
+from typing import Deque, Dict, List, Optional, Tuple
+
+SessionKey = Tuple[str, str]
+# Same shape as MemoryClient.get_last_k_turns: turns of {"role", "content": {"text"}} messages
+Turn = List[dict]
+
+
+class ConversationCache:
+    """In-process ring buffer of recent conversation turns per session
+
+    A session is cached once its history has been read from memory; after
+    that it is kept current by the hook that writes memory events, so warm
+    sessions never re-read memory. Sessions are evicted least-recently-used
+    first once the cache holds more than ``max_bytes`` of message text.
+    """
+
+    def __init__(self, max_turns: int = 10, max_bytes: int = 32 * 1024 * 1024):
+        self.max_turns = max_turns
+        self.max_bytes = max_bytes
+        self._sessions: "OrderedDict[SessionKey, Deque[Turn]]" = OrderedDict()
+        self._sizes: Dict[SessionKey, int] = {}
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+        self._metrics = {"hits": 0, "misses": 0, "evictions": 0}
+
+    def get(self, actor_id: str, session_id: str) -> Optional[List[Turn]]:
+        """Return the cached turns, or None on a miss"""
+        key = (actor_id, session_id)
+        with self._lock:
+            turns = self._sessions.get(key)
+            if turns is None:
+                self._metrics["misses"] += 1
+                return None
+            self._sessions.move_to_end(key)
+            self._metrics["hits"] += 1
+            return [list(turn) for turn in turns]
+
+    def load(self, actor_id: str, session_id: str, turns: List[Turn]):
+        """Seed a session from a remote read"""
+        key = (actor_id, session_id)
+        with self._lock:
+            self._drop(key)
+            self._sessions[key] = deque((list(turn) for turn in turns), maxlen=self.max_turns)
+            self._sizes[key] = 0
+            self._resize(key)
+            self._evict()
+
+    def append(self, actor_id: str, session_id: str, text: str, role: str):
+        """Add a message to a cached session; uncached sessions are left to the next remote read"""
+        key = (actor_id, session_id)
+        role = role.upper()
+        with self._lock:
+            turns = self._sessions.get(key)
+            if turns is None:
+                return
+            # Group like get_last_k_turns: every user message starts a new turn
+            if not turns or role == "USER":
+                turns.append([])
+            turns[-1].append({"role": role, "content": {"text": text}})
+            self._resize(key)
+            self._evict()
+
+    def metrics(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._metrics, sessions=len(self._sessions), bytes=self._total_bytes)
+
+    def _resize(self, key: SessionKey):
+        size = sum(len(m["content"]["text"]) for turn in self._sessions[key] for m in turn)
+        self._total_bytes += size - self._sizes[key]
+        self._sizes[key] = size
+
+    def _drop(self, key: SessionKey):
+        if key in self._sessions:
+            del self._sessions[key]
+            self._total_bytes -= self._sizes.pop(key)
+
+    def _evict(self):
+        while self._total_bytes > self.max_bytes and len(self._sessions) > 1:
+            key = next(iter(self._sessions))
+            self._drop(key)
+            self._metrics["evictions"] += 1
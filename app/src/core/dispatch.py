@@ -0,0 +1,74 @@
+import time
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, List
+from strands import tool
+
+logger = logging.getLogger(__name__)
+
+SendMessage = Callable[[str, str], Awaitable[Dict[str, Any]]]
+
+
+def extract_a2a_text(result: Dict[str, Any]) -> str:
+    """Collect the text parts of an a2a_send_message result"""
+    response = result.get("response") or {}
+    if "task" in response:
+        parts = [
+            part
+            for artifact in response["task"].get("artifacts", [])
+            for part in artifact.get("parts", [])
+        ]
+    else:
+        parts = response.get("parts", [])
+    return "\n".join(part["text"] for part in parts if part.get("text"))
+
+
+class ParallelDispatcher:
+    """Runs a planned set of independent sub-agent calls concurrently"""
+
+    def __init__(self, send_message: SendMessage, call_timeout: float = 60):
+        self.send_message = send_message
+        self.call_timeout = call_timeout
+
+    async def _run_call(self, call: Dict[str, str]) -> Dict[str, Any]:
+        target_agent_url = call.get("target_agent_url", "")
+        message_text = call.get("message_text", "")
+        start = time.perf_counter()
+        try:
+            result = await asyncio.wait_for(
+                self.send_message(message_text, target_agent_url), timeout=self.call_timeout
+            )
+        except asyncio.TimeoutError:
+            result = {
+                "status": "error",
+                "error": f"Agent did not respond within {self.call_timeout}s",
+                "target_agent_url": target_agent_url,
+            }
+        except Exception as e:
+            result = {"status": "error", "error": str(e), "target_agent_url": target_agent_url}
+        result["elapsed_ms"] = round((time.perf_counter() - start) * 1000)
+        return result
+
+    async def dispatch(self, calls: List[Dict[str, str]]) -> List[Dict[str, Any]]:
+        """Send every call at once and return the results in plan order"""
+        logger.info(f"Dispatching {len(calls)} sub-agent calls in parallel")
+        return list(await asyncio.gather(*(self._run_call(call) for call in calls)))
+
+    @tool
+    async def dispatch_parallel_calls(self, calls: List[Dict[str, str]]) -> Dict[str, Any]:
+        """
+        Send several independent messages to A2A agents at the same time and return all responses together.
+
+        Use this instead of consecutive a2a_send_message calls whenever the calls do not depend on each
+        other's results, e.g. a policy lookup with GuestAdvisoryAgent and a reservation lookup with
+        ReservationAgent before a cancellation.
+
+        Args:
+            calls: The planned calls. Each item has "target_agent_url" (the exact agent URL) and
+                "message_text" (the full message for that agent, including all relevant context).
+
+        Returns:
+            dict: "results" holds one entry per call, in the same order as "calls", each with the
+                agent "status", its "response" or "error", and "elapsed_ms".
+        """
+        return {"status": "success", "results": await self.dispatch(calls)}
@@ -0,0 +1,166 @@
+import json
+import hashlib
+from typing import Any, Callable, List, Optional
+from strands import Agent
+from strands.agent.conversation_manager import SlidingWindowConversationManager
+from strands.types.content import Message
+
+try:
+    import tiktoken
+except ImportError:  # optional; fall back to a character-based estimate
+    tiktoken = None
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count, about four characters per token for English text"""
+    return len(text) // 4 + 1
+
+
+def default_token_counter() -> Callable[[str], int]:
+    """Use a local tiktoken encoding when available, otherwise the estimator"""
+    if tiktoken is None:
+        return estimate_tokens
+    try:
+        # The encoding file is downloaded on first use, which fails offline
+        encoding = tiktoken.get_encoding("cl100k_base")
+    except Exception:
+        return estimate_tokens
+    return lambda text: len(encoding.encode(text, disallowed_special=()))
+
+
+class HistoryCompactor:
+    """Fits recent conversation turns into a token budget
+
+    Oversized messages (hotel listings, HTML emails, raw tool output) are
+    collapsed to a short preview plus a stable reference, then the oldest
+    turns are dropped until the rest fits. The output depends only on the
+    turns themselves, so the same history always renders identically.
+    """
+
+    def __init__(
+        self,
+        token_budget: int = 2000,
+        max_message_tokens: int = 200,
+        token_counter: Optional[Callable[[str], int]] = None,
+    ):
+        self.token_budget = token_budget
+        self.max_message_tokens = max_message_tokens
+        self.count_tokens = token_counter or default_token_counter()
+
+    def collapse(self, text: str) -> str:
+        """A short preview plus a stable reference in place of an oversized message"""
+        tokens = self.count_tokens(text)
+        if tokens <= self.max_message_tokens:
+            return text
+        ref = hashlib.sha1(text.encode("utf-8")).hexdigest()[:8]
+        preview = " ".join(text[: self.max_message_tokens * 2].split())
+        return f"{preview} ... [{tokens} tokens omitted, ref {ref}]"
+
+    def _format_turn(self, turn: List[dict]) -> str:
+        return "\n".join(
+            f"{message['role']}: {self.collapse(message['content']['text'])}" for message in turn
+        )
+
+    def compact(self, turns: List[List[dict]]) -> str:
+        """Render turns as context text within the token budget, newest turns kept first"""
+        kept = []
+        used = 0
+        for turn in reversed(turns):
+            text = self._format_turn(turn)
+            tokens = self.count_tokens(text)
+            if kept and used + tokens > self.token_budget:
+                break
+            kept.append(text)
+            used += tokens
+
+        dropped = len(turns) - len(kept)
+        lines = list(reversed(kept))
+        if dropped:
+            lines.insert(0, f"({dropped} earlier turns omitted)")
+        return "\n".join(lines)
+
+
+class CompactingConversationManager(SlidingWindowConversationManager):
+    """Holds a live session's messages to the compactor's budgets between requests
+
+    Session agents are long-lived, so without this every raw tool output
+    would be resent to the model on each later request. After each request,
+    tool inputs and results are collapsed like oversized history messages,
+    as is long text from earlier turns; the latest answer is kept as-is so
+    follow-ups can refer to it. Then the oldest turns are dropped until the
+    history fits the token budget, always keeping the latest turn. A context
+    overflow is still handled by the sliding window.
+    """
+
+    def __init__(self, compactor: HistoryCompactor, window_size: int = 40):
+        super().__init__(window_size=window_size)
+        self.compactor = compactor
+
+    def apply_management(self, agent: Agent, **kwargs: Any) -> None:
+        messages = agent.messages
+        starts = self._turn_starts(messages)
+        latest = starts[-1] if starts else 0
+        for index, message in enumerate(messages):
+            message["content"] = [self._collapse_block(block, index < latest) for block in message["content"]]
+
+        tokens = [self.compactor.count_tokens(self._message_text(m)) for m in messages]
+        total = sum(tokens)
+        trim = 0
+        for start in starts[1:]:
+            if total <= self.compactor.token_budget:
+                break
+            total -= sum(tokens[trim:start])
+            trim = start
+        if trim:
+            del messages[:trim]
+            self.removed_message_count += trim
+
+        super().apply_management(agent, **kwargs)
+
+    @staticmethod
+    def _turn_starts(messages: List[Message]) -> List[int]:
+        """Indexes of the user messages that open a turn, as opposed to carrying tool results"""
+        return [
+            index for index, message in enumerate(messages)
+            if message["role"] == "user" and not any("toolResult" in block for block in message["content"])
+        ]
+
+    def _collapse_block(self, block: dict, earlier_turn: bool) -> dict:
+        if "toolResult" in block:
+            result = block["toolResult"]
+            content = [self._collapse_result_item(item) for item in result.get("content", [])]
+            return {"toolResult": dict(result, content=content)}
+        if "toolUse" in block:
+            tool_use = block["toolUse"]
+            tool_input = {
+                key: self.compactor.collapse(value) if isinstance(value, str) else value
+                for key, value in (tool_use.get("input") or {}).items()
+            }
+            return {"toolUse": dict(tool_use, input=tool_input)}
+        if "text" in block and earlier_turn:
+            return dict(block, text=self.compactor.collapse(block["text"]))
+        return block
+
+    def _collapse_result_item(self, item: dict) -> dict:
+        if "text" in item:
+            return {"text": self.compactor.collapse(item["text"])}
+        if "json" in item:
+            text = json.dumps(item["json"], default=str)
+            collapsed = self.compactor.collapse(text)
+            return item if collapsed == text else {"text": collapsed}
+        return item
+
+    @staticmethod
+    def _message_text(message: Message) -> str:
+        parts = []
+        for block in message["content"]:
+            if "text" in block:
+                parts.append(block["text"])
+            elif "toolUse" in block:
+                parts.append(json.dumps(block["toolUse"].get("input"), default=str))
+            elif "toolResult" in block:
+                parts.extend(
+                    item.get("text") or json.dumps(item.get("json"), default=str)
+                    for item in block["toolResult"].get("content", [])
+                )
+        return "\n".join(parts)
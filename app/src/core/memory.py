@@ -1,4 +1,5 @@
 import logging
+from typing import Optional
 from bedrock_agentcore.memory import MemoryClient
 from strands.hooks import (
     AgentInitializedEvent,
@@ -7,53 +8,72 @@ from strands.hooks import (
     MessageAddedEvent,
 )
 
+from .memory_writer import MemoryWriteBuffer
+from .conversation_cache import ConversationCache
+from .history import HistoryCompactor
+from .memory_registry import DEFAULT_REGISTRY_PATH, MemoryRegistry
+from ..utils.tracing import traced
+
 logger = logging.getLogger(__name__)
 
 
 class MemoryManager:
     """Manages Bedrock AgentCore memory operations"""
 
-    def __init__(self, region_name: str, memory_name: str):
+    def __init__(
+        self,
+        region_name: str,
+        memory_name: str,
+        memory_id: Optional[str] = None,
+        registry_path: Optional[str] = DEFAULT_REGISTRY_PATH,
+        validate_interval: float = 3600,
+    ):
         self.client = MemoryClient(region_name=region_name)
         self.memory_name = memory_name
         self.memory_id = None
+        self.registry = MemoryRegistry(
+            self.client,
+            region_name,
+            path=registry_path,
+            configured_id=memory_id,
+            validate_interval=validate_interval,
+        )
 
     def initialize_memory(self) -> str:
-        """Initialize or retrieve existing memory"""
+        """Resolve the memory ID from the registry, creating the resource on first use"""
         try:
-            # Create memory resource without strategies (short-term memory only)
-            memory = self.client.create_memory_and_wait(
-                name=self.memory_name,
-                strategies=[],  # No strategies for short-term memory
+            # Short-term memory only: no extraction strategies
+            self.memory_id = self.registry.resolve(
+                self.memory_name,
+                strategies=[],
                 description="Short-term memory for hotel booking agent",
                 event_expiry_days=7,
             )
-            self.memory_id = memory["id"]
-            logger.info(f"Created memory: {self.memory_id}")
+            logger.info(f"Using memory: {self.memory_id}")
             return self.memory_id
         except Exception as e:
-            if "already exists" in str(e):
-                # If memory already exists, retrieve its ID
-                memories = self.client.list_memories()
-                self.memory_id = next(
-                    (m["id"] for m in memories if m["id"].startswith(self.memory_name)),
-                    None,
-                )
-                logger.info(
-                    f"Memory already exists. Using existing memory ID: {self.memory_id}"
-                )
-                return self.memory_id
-            else:
-                logger.error(f"Memory initialization error: {e}")
-                raise
+            logger.error(f"Memory initialization error: {e}")
+            raise
 
 
 class MemoryHookProvider(HookProvider):
     """Provides memory hooks for agent lifecycle events"""
 
-    def __init__(self, memory_client: MemoryClient, memory_id: str):
+    def __init__(
+        self,
+        memory_client: MemoryClient,
+        memory_id: str,
+        write_buffer: Optional[MemoryWriteBuffer] = None,
+        conversation_cache: Optional[ConversationCache] = None,
+        compactor: Optional[HistoryCompactor] = None,
+    ):
         self.memory_client = memory_client
         self.memory_id = memory_id
+        # Messages are persisted write-behind, off the agent's hook path
+        self.write_buffer = write_buffer or MemoryWriteBuffer(memory_client, memory_id)
+        # Warm sessions are served from process memory instead of get_last_k_turns
+        self.conversation_cache = conversation_cache or ConversationCache()
+        self.compactor = compactor or HistoryCompactor()
 
     def on_agent_initialized(self, event: AgentInitializedEvent):
         """Load recent conversation history when agent starts"""
@@ -65,23 +85,26 @@ class MemoryHookProvider(HookProvider):
                 logger.warning("Missing actor_id or session_id in agent state")
                 return
 
-            # Load the last 10 conversation turns from memory
-            recent_turns = self.memory_client.get_last_k_turns(
-                memory_id=self.memory_id, actor_id=actor_id, session_id=session_id, k=10
-            )
+            with traced("memory.load_history", **{"memory.actor_id": actor_id, "memory.session_id": session_id}) as span:
+                recent_turns = self.conversation_cache.get(actor_id, session_id)
+                span.set_attribute("memory.cache_hit", recent_turns is not None)
+                if recent_turns is None:
+                    # Make buffered writes visible before reading them back
+                    self.write_buffer.flush()
+
+                    # Load the last 10 conversation turns from memory
+                    recent_turns = self.memory_client.get_last_k_turns(
+                        memory_id=self.memory_id, actor_id=actor_id, session_id=session_id, k=10
+                    )
+                    self.conversation_cache.load(actor_id, session_id, recent_turns or [])
+                span.set_attribute("memory.turns", len(recent_turns or []))
 
             if recent_turns:
-                # Format conversation history for context
-                context_messages = []
-                for turn in recent_turns:
-                    for message in turn:
-                        role = message["role"]
-                        content = message["content"]["text"]
-                        context_messages.append(f"{role}: {content}")
-
-                context = "\n".join(context_messages)
-                # Add context to agent's system prompt
+                # Fit the history into the token budget, dropping the oldest turns first
+                context = self.compactor.compact(recent_turns)
+                # Append after the unchanged base prompt so its prefix stays cacheable
                 event.agent.system_prompt += f"\n\nRecent conversation:\n{context}"
+                event.agent.state.set("loaded_turns", len(recent_turns))
                 logger.info(f"Loaded {len(recent_turns)} conversation turns")
 
         except Exception as e:
@@ -95,17 +118,21 @@ class MemoryHookProvider(HookProvider):
             session_id = event.agent.state.get("session_id")
 
             if messages and messages[-1]["content"][0].get("text"):
-                self.memory_client.create_event(
-                    memory_id=self.memory_id,
-                    actor_id=actor_id,
-                    session_id=session_id,
-                    messages=[
-                        (messages[-1]["content"][0]["text"], messages[-1]["role"])
-                    ],
+                self.record_message(
+                    actor_id,
+                    session_id,
+                    messages[-1]["content"][0]["text"],
+                    messages[-1]["role"],
                 )
         except Exception as e:
             logger.error(f"Memory save error: {e}")
 
+    def record_message(self, actor_id: str, session_id: str, text: str, role: str):
+        """Persist a message and keep the session's cached history current"""
+        with traced("memory.record_message", **{"memory.role": role}):
+            self.write_buffer.enqueue(actor_id, session_id, text, role)
+            self.conversation_cache.append(actor_id, session_id, text, role)
+
     def register_hooks(self, registry: HookRegistry):
         """Register memory hooks"""
         registry.add_callback(MessageAddedEvent, self.on_message_added)
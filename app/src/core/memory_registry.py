@@ -0,0 +1,184 @@
+import os
+import json
+import time
+import logging
+import tempfile
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+REGISTRY_VERSION = 1
+DEFAULT_REGISTRY_PATH = os.path.join(tempfile.gettempdir(), "hotel-agents", "memory_registry.json")
+# Resources in these states can never serve reads or writes again
+UNUSABLE_STATUSES = {"FAILED", "DELETING"}
+
+
+class MemoryRegistry:
+    """Resolves a memory resource's ID by exact name and persists it for the host
+
+    The first process to start looks the name up (paginated, exact match)
+    and creates the resource only if it is missing. It then writes the ID to
+    ``path``; the other workers on the host wait on a file lock and reuse it.
+    A persisted ID is re-validated against the control plane at most every
+    ``validate_interval`` seconds, and is discarded if the resource was
+    deleted or failed. A ``configured_id`` (MEMORY_ID) skips the lookup.
+    """
+
+    def __init__(
+        self,
+        client,
+        region_name: str,
+        path: Optional[str] = DEFAULT_REGISTRY_PATH,
+        configured_id: Optional[str] = None,
+        validate_interval: float = 3600,
+    ):
+        self.client = client
+        self.region_name = region_name
+        self.path = path
+        self.configured_id = configured_id or None
+        self.validate_interval = validate_interval
+
+    def resolve(self, name: str, **create_kwargs) -> str:
+        """Return the ID of the memory named ``name``, creating it if needed"""
+        key = f"{self.region_name}/{name}"
+        if self.configured_id:
+            entry = self._load().get(key, {})
+            if entry.get("memory_id") == self.configured_id and self._fresh(entry):
+                return self.configured_id
+            if not self._usable(self.configured_id):
+                raise ValueError(f"Configured memory {self.configured_id} is missing or unusable")
+            self._store(key, self.configured_id)
+            return self.configured_id
+
+        entry = self._load().get(key)
+        if entry and self._fresh(entry):
+            return entry["memory_id"]
+
+        with self._locked():
+            # Another worker may have resolved it while we waited for the lock
+            entry = self._load().get(key)
+            if entry and self._fresh(entry):
+                return entry["memory_id"]
+            if entry and self._usable(entry["memory_id"]):
+                self._store(key, entry["memory_id"])
+                return entry["memory_id"]
+            if entry:
+                logger.warning(f"Registered memory {entry['memory_id']} is gone; resolving {name} again")
+
+            memory_id = self.find_by_name(name)
+            if memory_id is None:
+                memory_id = self._create(name, **create_kwargs)
+            self._store(key, memory_id)
+            return memory_id
+
+    def find_by_name(self, name: str) -> Optional[str]:
+        """Page through the account's memories for an exact name match"""
+        matches: List[Dict[str, Any]] = []
+        next_token = None
+        while True:
+            kwargs = {"maxResults": 100}
+            if next_token:
+                kwargs["nextToken"] = next_token
+            response = self.client.gmcp_client.list_memories(**kwargs)
+            for memory in response.get("memories", []):
+                if self._name_of(memory) == name and memory.get("status") not in UNUSABLE_STATUSES:
+                    matches.append(memory)
+            next_token = response.get("nextToken")
+            if not next_token:
+                break
+
+        if not matches:
+            return None
+        if len(matches) > 1:
+            logger.warning(f"{len(matches)} memories are named {name}; using the most recently created")
+        matches.sort(key=lambda m: str(m.get("createdAt", "")), reverse=True)
+        return matches[0].get("id") or matches[0].get("memoryId")
+
+    @staticmethod
+    def _name_of(memory: Dict[str, Any]) -> str:
+        if memory.get("name"):
+            return memory["name"]
+        # Summaries may omit the name; IDs are "<name>-<10 character suffix>"
+        memory_id = memory.get("id") or memory.get("memoryId") or ""
+        return memory_id.rsplit("-", 1)[0]
+
+    def _create(self, name: str, **create_kwargs) -> str:
+        try:
+            memory = self.client.create_memory_and_wait(name=name, **create_kwargs)
+            logger.info(f"Created memory: {memory['id']}")
+            return memory["id"]
+        except Exception as e:
+            # Created by another host between our lookup and create
+            if "already exists" not in str(e):
+                raise
+            memory_id = self.find_by_name(name)
+            if memory_id is None:
+                raise
+            return memory_id
+
+    def _usable(self, memory_id: str) -> bool:
+        try:
+            return self.client.get_memory_status(memory_id) not in UNUSABLE_STATUSES
+        except Exception as e:
+            code = getattr(e, "response", {}).get("Error", {}).get("Code")
+            if code in ("ResourceNotFoundException", "ValidationException"):
+                return False
+            # The control plane is unreachable; the persisted ID is still the best answer
+            logger.warning(f"Could not validate memory {memory_id}: {e}")
+            return True
+
+    def _fresh(self, entry: Dict[str, Any]) -> bool:
+        return time.time() - entry.get("validated_at", 0) < self.validate_interval
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        if not self.path or not os.path.exists(self.path):
+            return {}
+        try:
+            with open(self.path) as f:
+                registry = json.load(f)
+            if registry.get("version") != REGISTRY_VERSION:
+                return {}
+            return registry.get("memories", {})
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable memory registry: {e}")
+            return {}
+
+    def _store(self, key: str, memory_id: str):
+        if not self.path:
+            return
+        memories = self._load()
+        memories[key] = {"memory_id": memory_id, "validated_at": time.time()}
+        try:
+            os.makedirs(os.path.dirname(self.path) or ".", mode=0o700, exist_ok=True)
+            tmp_path = f"{self.path}.{os.getpid()}.tmp"
+            with open(tmp_path, "w") as f:
+                json.dump({"version": REGISTRY_VERSION, "memories": memories}, f)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.warning(f"Failed to persist memory registry: {e}")
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        """Serialize resolution across the processes on this host"""
+        if not self.path or fcntl is None:
+            yield
+            return
+        try:
+            os.makedirs(os.path.dirname(self.path) or ".", mode=0o700, exist_ok=True)
+            lock_file = open(f"{self.path}.lock", "w")
+        except OSError as e:
+            logger.warning(f"Resolving memory without a host lock: {e}")
+            yield
+            return
+        with lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
@@ -0,0 +1,127 @@
+import time
+import atexit
+import logging
+import threading
+from collections import OrderedDict, deque
+from typing import Deque, Dict, List, Tuple
+from bedrock_agentcore.memory import MemoryClient
+
+from ..utils.tracing import traced
+
+logger = logging.getLogger(__name__)
+
+SessionKey = Tuple[str, str]
+PendingMessage = Tuple[str, str]
+
+
+class MemoryWriteBuffer:
+    """Write-behind buffer that batches memory events per actor/session
+
+    Messages are queued from the agent's hook path and written by a
+    background thread as one create_event call per session, in arrival order,
+    when ``batch_size`` messages are pending or ``flush_interval`` seconds
+    have passed. Dropped and failed writes are counted in metrics().
+    """
+
+    def __init__(
+        self,
+        memory_client: MemoryClient,
+        memory_id: str,
+        batch_size: int = 20,
+        flush_interval: float = 1.0,
+        max_pending: int = 10000,
+        max_retries: int = 3,
+    ):
+        self.memory_client = memory_client
+        self.memory_id = memory_id
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self.max_retries = max_retries
+        self._pending: "OrderedDict[SessionKey, Deque[PendingMessage]]" = OrderedDict()
+        self._pending_count = 0
+        self._condition = threading.Condition()
+        # Serializes flushes so a session's batches are written in order
+        self._flush_lock = threading.Lock()
+        self._closed = False
+        self._metrics = {"enqueued": 0, "written": 0, "batches": 0, "retried": 0, "failed": 0, "dropped": 0}
+
+        self._worker = threading.Thread(target=self._run, name="memory-writer", daemon=True)
+        self._worker.start()
+        atexit.register(self.close)
+
+    def enqueue(self, actor_id: str, session_id: str, text: str, role: str):
+        """Queue a message for persistence without blocking on the network"""
+        with self._condition:
+            if self._closed or self._pending_count >= self.max_pending:
+                self._metrics["dropped"] += 1
+                return
+            self._pending.setdefault((actor_id, session_id), deque()).append((text, role))
+            self._pending_count += 1
+            self._metrics["enqueued"] += 1
+            if self._pending_count >= self.batch_size:
+                self._condition.notify()
+
+    def flush(self):
+        """Write every pending message now"""
+        with self._flush_lock:
+            with self._condition:
+                batches = list(self._pending.items())
+                self._pending = OrderedDict()
+                self._pending_count = 0
+            for key, messages in batches:
+                self._write(key, list(messages))
+
+    def close(self):
+        """Stop the background writer and flush what is left"""
+        with self._condition:
+            if self._closed:
+                return
+            self._closed = True
+            self._condition.notify()
+        self._worker.join(timeout=5)
+        self.flush()
+
+    def metrics(self) -> Dict[str, int]:
+        with self._condition:
+            return dict(self._metrics, pending=self._pending_count)
+
+    def _run(self):
+        while True:
+            with self._condition:
+                self._condition.wait_for(
+                    lambda: self._closed or self._pending_count >= self.batch_size,
+                    timeout=self.flush_interval,
+                )
+                if self._closed:
+                    return
+            self.flush()
+
+    def _write(self, key: SessionKey, messages: List[PendingMessage]):
+        actor_id, session_id = key
+        for attempt in range(self.max_retries):
+            try:
+                # Runs on the writer thread, so each batch is its own trace
+                with traced(
+                    "memory.create_event",
+                    **{"memory.session_id": session_id, "memory.messages": len(messages), "memory.attempt": attempt},
+                ):
+                    self.memory_client.create_event(
+                        memory_id=self.memory_id,
+                        actor_id=actor_id,
+                        session_id=session_id,
+                        messages=messages,
+                    )
+                with self._condition:
+                    self._metrics["written"] += len(messages)
+                    self._metrics["batches"] += 1
+                return
+            except Exception as e:
+                if attempt + 1 < self.max_retries:
+                    with self._condition:
+                        self._metrics["retried"] += 1
+                    time.sleep(0.2 * (2 ** attempt))
+                else:
+                    logger.error(f"Memory save error: {e}")
+        with self._condition:
+            self._metrics["failed"] += len(messages)
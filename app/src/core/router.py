@@ -0,0 +1,236 @@
+import re
+import json
+import math
+import logging
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Pattern, Protocol, Tuple
+
+logger = logging.getLogger(__name__)
+
+SEARCH_AGENT = "SearchDiscoveryAgent"
+RESERVATION_AGENT = "ReservationAgent"
+ADVISORY_AGENT = "GuestAdvisoryAgent"
+ROUTABLE_AGENTS = {SEARCH_AGENT, RESERVATION_AGENT, ADVISORY_AGENT}
+
+EMAIL_PATTERN = re.compile(r"[\w.+-]+@[\w-]+\.[\w.-]+")
+BOOKING_ID_PATTERN = re.compile(r"\b(?:booking|reservation)\s*(?:id|#|number)?\s*[:#]?\s*([A-Za-z0-9-]{4,})\b", re.I)
+CITY_PATTERN = re.compile(r"\b(?:in|at|near)\s+([A-Z][a-zA-Z]+(?:\s+[A-Z][a-zA-Z]+)*)")
+PRICE_PATTERN = re.compile(r"\b(?:under|below|less than|max(?:imum)?|up to)\s*\$?\s*(\d+(?:\.\d+)?)", re.I)
+RATING_PATTERN = re.compile(r"\b(\d(?:\.\d)?)\s*(?:\+\s*)?(?:stars?|rating)\b", re.I)
+HOTEL_PATTERN = re.compile(
+    r"\b(Hotel\s+[A-Z][\w'-]*(?:\s+[A-Z][\w'-]*)*|[A-Z][\w'-]*(?:\s+[A-Z][\w'-]*)*\s+(?:Hotel|Inn|Resort|Suites|Lodge))\b"
+)
+
+# Words that point back at something said earlier in the conversation
+ANAPHORA_PATTERN = re.compile(
+    r"\b(that|this|those|these|it|its|they|them|their|there|same|the (?:one|first|second|third|last|other|cheapest))\b",
+    re.I,
+)
+
+# What a follow-up must name itself to be routed without the conversation's context
+REQUIRED_PARAMS = {
+    "SearchDiscoveryAgent": "city",
+    "ReservationAgent": "guest_email",
+    "GuestAdvisoryAgent": "hotel_name",
+}
+
+# Actions that change a booking need the supervisor's policy check and confirmation
+MUTATION_PATTERN = re.compile(r"\b(book|reserve|cancel|modify|change|update|extend|move)\b(?!\s+polic)", re.I)
+
+
+@dataclass
+class RouteDecision:
+    agent: str
+    confidence: float
+    params: Dict[str, str] = field(default_factory=dict)
+    source: str = "rules"
+
+    def to_message(self, question: str) -> str:
+        """Message for the sub-agent: the request plus the extracted parameters"""
+        if not self.params:
+            return question
+        details = ", ".join(f"{k}={v}" for k, v in sorted(self.params.items()))
+        return f"{question}\n\nExtracted parameters: {details}"
+
+
+@dataclass
+class RoutedResponse:
+    """Sub-agent answer returned in place of a supervisor AgentResult"""
+
+    message: dict
+    agent: str
+
+    def __str__(self) -> str:
+        return "\n".join(block.get("text", "") for block in self.message["content"])
+
+
+@dataclass
+class RouteRule:
+    agent: str
+    patterns: List[Pattern]
+    confidence: float
+    requires: List[Pattern] = field(default_factory=list)
+
+    def matches(self, question: str) -> bool:
+        return any(p.search(question) for p in self.patterns) and all(
+            p.search(question) for p in self.requires
+        )
+
+
+class IntentClassifier(Protocol):
+    def predict(self, question: str) -> Tuple[Optional[str], float]:
+        """Return the predicted agent (or None) and a confidence in [0, 1]"""
+        ...
+
+
+def _words(pattern: str) -> Pattern:
+    return re.compile(pattern, re.I)
+
+
+DEFAULT_RULES = [
+    RouteRule(
+        ADVISORY_AGENT,
+        [
+            _words(r"\bcheck[- ]?(in|out)\s+(time|hours?)\b"),
+            _words(r"\bwhat time\b.*\bcheck[- ]?(in|out)\b"),
+            _words(r"\b(cancellation|pet|smoking|deposit|payment|age|child(ren)?)\s+polic(y|ies)\b"),
+            _words(r"\b(are|is)\s+(pets?|dogs?|cats?|smoking)\s+allowed\b"),
+            _words(r"\bhotel\s+(polic(y|ies)|rules)\b"),
+        ],
+        confidence=0.9,
+    ),
+    RouteRule(
+        RESERVATION_AGENT,
+        [
+            _words(r"\b(show|list|get|find|view|see|retrieve)\b.*\b(my\s+)?(bookings?|reservations?)\b"),
+            _words(r"\bmy\s+(bookings?|reservations?)\b"),
+        ],
+        confidence=0.9,
+        requires=[EMAIL_PATTERN],
+    ),
+    RouteRule(
+        SEARCH_AGENT,
+        [
+            _words(r"\b(hotels?|rooms?|stays?|accommodations?)\b.*\b(in|near|at)\s+[A-Z]"),
+            _words(r"\b(find|search|show|list|look(ing)? for)\b.*\bhotels?\b"),
+            _words(r"\bhotels?\b.*\b(under|below|less than|cheaper than)\b"),
+        ],
+        confidence=0.85,
+    ),
+]
+
+
+class NaiveBayesClassifier:
+    """Tiny bag-of-words classifier trained on labelled example requests"""
+
+    @classmethod
+    def from_file(cls, path: str) -> "NaiveBayesClassifier":
+        """Train on a JSON list of [request, agent] pairs"""
+        with open(path) as f:
+            return cls((text, label) for text, label in json.load(f))
+
+    def __init__(self, examples: Iterable[Tuple[str, str]]):
+        self._word_counts: Dict[str, Counter] = defaultdict(Counter)
+        self._label_counts: Counter = Counter()
+        for text, label in examples:
+            self._label_counts[label] += 1
+            self._word_counts[label].update(self._tokenize(text))
+        self._vocabulary = {w for counts in self._word_counts.values() for w in counts}
+
+    @staticmethod
+    def _tokenize(text: str) -> List[str]:
+        return re.findall(r"[a-z]+", text.lower())
+
+    def predict(self, question: str) -> Tuple[Optional[str], float]:
+        if not self._label_counts:
+            return None, 0.0
+
+        total = sum(self._label_counts.values())
+        vocabulary_size = len(self._vocabulary) or 1
+        log_scores = {}
+        for label, count in self._label_counts.items():
+            words = self._word_counts[label]
+            denominator = sum(words.values()) + vocabulary_size
+            score = math.log(count / total)
+            for word in self._tokenize(question):
+                score += math.log((words[word] + 1) / denominator)
+            log_scores[label] = score
+
+        best = max(log_scores, key=log_scores.get)
+        peak = log_scores[best]
+        normalizer = sum(math.exp(s - peak) for s in log_scores.values())
+        return best, 1.0 / normalizer
+
+
+class IntentRouter:
+    """Local fast path that routes easy requests straight to a sub-agent
+
+    Keyword/regex rules run first; an optional classifier handles requests no
+    rule matches. Only decisions at or above ``threshold`` are returned, and
+    requests that would change a booking always go to the LLM supervisor.
+    The sub-agent only sees the request itself, so in a conversation with
+    earlier turns, follow-ups that refer back ("that hotel") or leave out
+    what the agent needs (see REQUIRED_PARAMS) also go to the supervisor.
+    """
+
+    def __init__(
+        self,
+        rules: Optional[List[RouteRule]] = None,
+        classifier: Optional[IntentClassifier] = None,
+        threshold: float = 0.8,
+    ):
+        self.rules = DEFAULT_RULES if rules is None else rules
+        self.classifier = classifier
+        self.threshold = threshold
+
+    def classify(self, question: str) -> Optional[RouteDecision]:
+        """Best local guess regardless of threshold, or None"""
+        if MUTATION_PATTERN.search(question):
+            return None
+
+        matched = {rule.agent: rule.confidence for rule in self.rules if rule.matches(question)}
+        if len(matched) == 1:
+            agent, confidence = next(iter(matched.items()))
+            return RouteDecision(agent, confidence, self.extract_params(question))
+        if len(matched) > 1:
+            # Conflicting rules: too ambiguous for the fast path
+            return None
+
+        if self.classifier is not None:
+            agent, confidence = self.classifier.predict(question)
+            if agent in ROUTABLE_AGENTS:
+                return RouteDecision(agent, confidence, self.extract_params(question), source="classifier")
+        return None
+
+    def route(self, question: str, has_history: bool = False) -> Optional[RouteDecision]:
+        """Return a decision only when it is confident enough to skip the supervisor LLM"""
+        decision = self.classify(question)
+        if decision is None or decision.confidence < self.threshold:
+            return None
+        if has_history and (
+            ANAPHORA_PATTERN.search(question) or REQUIRED_PARAMS[decision.agent] not in decision.params
+        ):
+            logger.info(f"Follow-up for {decision.agent} needs the conversation, leaving it to the supervisor")
+            return None
+        logger.info(f"Routed locally to {decision.agent} ({decision.source}, {decision.confidence:.2f})")
+        return decision
+
+    @staticmethod
+    def extract_params(question: str) -> Dict[str, str]:
+        params = {}
+        if match := EMAIL_PATTERN.search(question):
+            params["guest_email"] = match.group(0)
+        if match := BOOKING_ID_PATTERN.search(question):
+            params["booking_id"] = match.group(1)
+        if match := CITY_PATTERN.search(question):
+            params["city"] = match.group(1)
+        if match := PRICE_PATTERN.search(question):
+            params["max_price"] = match.group(1)
+        if match := RATING_PATTERN.search(question):
+            params["min_rating"] = match.group(1)
+        if match := HOTEL_PATTERN.search(question):
+            params["hotel_name"] = match.group(1)
+            if params.get("city") == params["hotel_name"]:
+                del params["city"]
+        return params
@@ -0,0 +1,124 @@
+import time
+import asyncio
+import logging
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Callable, Dict, Tuple
+from strands import Agent
+
+logger = logging.getLogger(__name__)
+
+SessionKey = Tuple[str, str]
+
+
+@dataclass
+class SessionEntry:
+    agent: Agent
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    last_used: float = field(default_factory=time.monotonic)
+    size_bytes: int = 0
+
+
+class SessionAgentPool:
+    """LRU pool of per-session agents keyed by (actor_id, session_id)
+
+    Each session gets its own Agent, so requests for different sessions run in
+    parallel while requests for the same session are serialized. Idle sessions
+    are evicted least-recently-used first once the pool exceeds its session or
+    memory cap; an evicted session is rebuilt on its next request, and its
+    recent history is reloaded from AgentCore memory by MemoryHookProvider.
+    """
+
+    def __init__(
+        self,
+        agent_factory: Callable[[str, str], Agent],
+        max_sessions: int = 100,
+        max_memory_bytes: int = 256 * 1024 * 1024,
+        idle_ttl: float = 1800,
+    ):
+        self.agent_factory = agent_factory
+        self.max_sessions = max_sessions
+        self.max_memory_bytes = max_memory_bytes
+        self.idle_ttl = idle_ttl
+        self._entries: "OrderedDict[SessionKey, SessionEntry]" = OrderedDict()
+        self._creating: Dict[SessionKey, asyncio.Future] = {}
+        self._metrics = {"hits": 0, "misses": 0, "evictions": 0}
+
+    async def _get_entry(self, key: SessionKey) -> SessionEntry:
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            self._metrics["hits"] += 1
+            return entry
+
+        # Concurrent first requests for a session share one agent build
+        pending = self._creating.get(key)
+        if pending is not None:
+            self._metrics["hits"] += 1
+            return await asyncio.shield(pending)
+
+        self._metrics["misses"] += 1
+        pending = asyncio.get_running_loop().create_future()
+        self._creating[key] = pending
+        try:
+            # Building the agent loads memory over the network; keep it off the event loop
+            agent = await asyncio.to_thread(self.agent_factory, *key)
+            entry = SessionEntry(agent=agent)
+            self._entries[key] = entry
+            pending.set_result(entry)
+            self._evict()
+            return entry
+        except Exception as e:
+            pending.set_exception(e)
+            # Mark the exception as retrieved when nobody else was waiting
+            pending.exception()
+            raise
+        finally:
+            del self._creating[key]
+
+    @asynccontextmanager
+    async def session(self, actor_id: str, session_id: str) -> AsyncIterator[Agent]:
+        """Hold the session's agent exclusively for the duration of a request"""
+        entry = await self._get_entry((actor_id, session_id))
+        async with entry.lock:
+            try:
+                yield entry.agent
+            finally:
+                entry.last_used = time.monotonic()
+                entry.size_bytes = self._estimate_size(entry.agent)
+                self._evict()
+
+    @staticmethod
+    def _estimate_size(agent: Agent) -> int:
+        """Approximate the memory held by an agent's conversation"""
+        return len(str(agent.messages)) + len(agent.system_prompt or "")
+
+    def _evict(self):
+        """Drop expired sessions, then LRU sessions while over a cap; busy sessions are kept"""
+        now = time.monotonic()
+        for key, entry in list(self._entries.items()):
+            if not entry.lock.locked() and now - entry.last_used > self.idle_ttl:
+                self._remove(key)
+
+        for key, entry in list(self._entries.items()):
+            if not self._over_capacity():
+                break
+            if not entry.lock.locked():
+                self._remove(key)
+
+    def _over_capacity(self) -> bool:
+        total_bytes = sum(entry.size_bytes for entry in self._entries.values())
+        return len(self._entries) > self.max_sessions or total_bytes > self.max_memory_bytes
+
+    def _remove(self, key: SessionKey):
+        del self._entries[key]
+        self._metrics["evictions"] += 1
+        logger.info(f"Evicted session agent for actor={key[0]} session={key[1]}")
+
+    def metrics(self) -> Dict[str, int]:
+        return dict(
+            self._metrics,
+            sessions=len(self._entries),
+            memory_bytes=sum(entry.size_bytes for entry in self._entries.values()),
+        )
@@ -0,0 +1,59 @@
+import time
+import asyncio
+import logging
+import threading
+from concurrent.futures import Future
+from typing import Callable, Generic, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class BackgroundInitializer(Generic[T]):
+    """Builds an expensive object on a background thread, once
+
+    ``start()`` returns immediately, so a server can bind and answer health
+    checks while the object is built. Callers await ``get()``, which starts
+    the build if nobody has yet. A failed build is logged and retried by the
+    next ``get()``.
+    """
+
+    def __init__(self, factory: Callable[[], T], name: str):
+        self.factory = factory
+        self.name = name
+        self.init_seconds: Optional[float] = None
+        self._future: Optional[Future] = None
+        self._lock = threading.Lock()
+
+    def start(self) -> Future:
+        """Begin building in the background if not already built or building"""
+        with self._lock:
+            if self._future is None or (self._future.done() and self._future.exception() is not None):
+                self._future = Future()
+                threading.Thread(target=self._build, args=(self._future,), name=f"init-{self.name}", daemon=True).start()
+            return self._future
+
+    @property
+    def ready(self) -> bool:
+        future = self._future
+        return future is not None and future.done() and future.exception() is None
+
+    async def get(self) -> T:
+        """Wait for the object without blocking the event loop"""
+        future = self.start()
+        if future.done():
+            return future.result()
+        return await asyncio.wrap_future(future)
+
+    def _build(self, future: Future):
+        start = time.perf_counter()
+        try:
+            value = self.factory()
+        except BaseException as e:
+            logger.error(f"Failed to initialize {self.name}: {e}")
+            future.set_exception(e)
+            return
+        self.init_seconds = time.perf_counter() - start
+        logger.info(f"{self.name} ready in {self.init_seconds:.2f}s")
+        future.set_result(value)
@@ -0,0 +1,55 @@
+from typing import Any, Callable, Dict, List, Optional
+
+# Events sent to streaming clients, one per SSE "data:" line
+StreamEvent = Dict[str, Any]
+
+
+def text_event(text: str) -> StreamEvent:
+    return {"type": "text", "text": text}
+
+
+def progress_event(message: str) -> StreamEvent:
+    return {"type": "progress", "message": message}
+
+
+def done_event(text: str, agent: Optional[str] = None) -> StreamEvent:
+    event = {"type": "done", "text": text}
+    if agent:
+        event["agent"] = agent
+    return event
+
+
+def error_event(error: str) -> StreamEvent:
+    return {"type": "error", "error": error}
+
+
+def item_event(result: Dict[str, Any]) -> StreamEvent:
+    """One finished batch item"""
+    return dict(result, type="item")
+
+
+def summary_event(succeeded: int, failed: int, elapsed_s: float) -> StreamEvent:
+    """Sent after the last batch item"""
+    return {"type": "summary", "succeeded": succeeded, "failed": failed, "elapsed_s": round(elapsed_s, 3)}
+
+
+def describe_tool_use(tool_use: dict, agent_name: Callable[[str], str]) -> str:
+    """Progress line for a tool call the supervisor is about to make"""
+    tool_input = tool_use.get("input") or {}
+    if tool_use["name"] == "a2a_send_message":
+        return f"Calling {agent_name(tool_input.get('target_agent_url', ''))}…"
+    if tool_use["name"] == "dispatch_parallel_calls":
+        names = [agent_name(call.get("target_agent_url", "")) for call in tool_input.get("calls", [])]
+        return f"Calling {', '.join(names)} in parallel…"
+    return f"Running {tool_use['name']}…"
+
+
+def tool_progress(message: dict, agent_name: Callable[[str], str]) -> List[StreamEvent]:
+    """Progress events for the tool calls in a completed assistant message"""
+    if message.get("role") != "assistant":
+        return []
+    return [
+        progress_event(describe_tool_use(block["toolUse"], agent_name))
+        for block in message.get("content", [])
+        if "toolUse" in block
+    ]
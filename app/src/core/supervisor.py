@@ -1,12 +1,23 @@
-import boto3
 import logging
 from datetime import datetime
+from typing import AsyncIterator, Optional
 from strands import Agent
-from strands.models import BedrockModel
-from strands_tools.a2a_client import A2AClientToolProvider
 
 from ..config.settings import Settings
+from ..utils.metrics import MetricsHookProvider, get_metrics_registry
+from ..utils.model_registry import get_model_registry
+from ..utils.resilience import request_deadline
 from .memory import MemoryManager, MemoryHookProvider
+from .memory_writer import MemoryWriteBuffer
+from .conversation_cache import ConversationCache
+from .history import CompactingConversationManager, HistoryCompactor
+from .a2a_client import PooledA2AClient
+from .agent_calls import ResilientAgentCaller, unavailable_message
+from .colocated import ColocatedAgentProvider
+from .dispatch import ParallelDispatcher, extract_a2a_text
+from .router import IntentRouter, NaiveBayesClassifier, RouteDecision, RoutedResponse
+from .session_pool import SessionAgentPool
+from .streaming import StreamEvent, done_event, progress_event, text_event, tool_progress
 
 logger = logging.getLogger(__name__)
 
@@ -15,37 +26,103 @@ class SupervisorAgent:
     
     def __init__(self, settings: Settings):
         self.settings = settings
-        self.agent = self._initialize_agent()
+        self._initialize_resources()
+        self.sessions = SessionAgentPool(
+            self.create_agent,
+            max_sessions=self.settings.max_sessions,
+            max_memory_bytes=self.settings.max_session_pool_mb * 1024 * 1024,
+            idle_ttl=self.settings.session_idle_ttl,
+        )
         
-    def _initialize_agent(self) -> Agent:
-        """Initialize the supervisor agent with memory and tools"""
+    def _initialize_resources(self):
+        """Initialize the memory, tools and model shared by every session agent"""
         
         # Initialize memory
         memory_manager = MemoryManager(
             region_name=self.settings.aws_region,
-            memory_name=self.settings.memory_name
+            memory_name=self.settings.memory_name,
+            memory_id=self.settings.memory_id,
+            registry_path=self.settings.memory_registry_path,
+            validate_interval=self.settings.memory_validate_interval,
         )
         memory_id = memory_manager.initialize_memory()
+        write_buffer = MemoryWriteBuffer(
+            memory_manager.client,
+            memory_id,
+            batch_size=self.settings.memory_flush_batch_size,
+            flush_interval=self.settings.memory_flush_interval,
+        )
+        conversation_cache = ConversationCache(
+            max_bytes=self.settings.conversation_cache_mb * 1024 * 1024
+        )
+        self.compactor = HistoryCompactor(
+            token_budget=self.settings.history_token_budget,
+            max_message_tokens=self.settings.history_max_message_tokens,
+        )
+        self.memory_hooks = MemoryHookProvider(
+            memory_manager.client, memory_id, write_buffer, conversation_cache, self.compactor
+        )
+        self.metrics_hooks = MetricsHookProvider("SupervisorAgent")
+        get_metrics_registry().register_cache("conversation_history", conversation_cache)
         
-        # Initialize A2A client tool provider
-        provider = A2AClientToolProvider(self.settings.agent_urls)
-        
-        # Initialize Bedrock model
-        session = boto3.Session()
-        bedrock_model = BedrockModel(
-            model_id="anthropic.claude-3-haiku-20240307-v1:0", 
-            boto_session=session
+        # Reach the specialist agents over A2A, or call them in-process when colocated
+        colocated = self.settings.deployment_mode == "colocated"
+        if colocated:
+            provider = ColocatedAgentProvider.from_settings(self.settings)
+        else:
+            provider = PooledA2AClient(
+                self.settings.agent_urls,
+                call_timeout=self.settings.subagent_call_timeout,
+                pool_size=self.settings.a2a_pool_size,
+                card_ttl=self.settings.a2a_card_ttl,
+                probe_interval=self.settings.a2a_probe_interval,
+            )
+        # Deadlines, hedging, circuit breakers and single-flight around every sub-agent call
+        self.agent_calls = ResilientAgentCaller(
+            provider.send_message,
+            self.settings.get_agent_name,
+            call_timeout=self.settings.subagent_call_timeout,
+            failure_threshold=self.settings.circuit_failure_threshold,
+            reset_timeout=self.settings.circuit_reset_timeout,
+            # A colocated agent serves one call at a time, so a hedge would only queue
+            hedge_agents=[] if colocated else self.settings.hedge_agents,
+            hedge_percentile=self.settings.hedge_percentile,
+            hedge_min_samples=self.settings.hedge_min_samples,
+            coalesce_agents=self.settings.coalesce_agents,
         )
+        self.send_message = self.agent_calls.send_message
+        self.tools = [self.agent_calls.a2a_send_message, provider.a2a_list_discovered_agents]
+        if self.settings.parallel_dispatch:
+            dispatcher = ParallelDispatcher(
+                self.send_message, call_timeout=self.settings.subagent_call_timeout
+            )
+            self.tools.append(dispatcher.dispatch_parallel_calls)
+        
+        # Local fast path for requests that are easy to classify
+        self.router = None
+        if self.settings.local_router:
+            classifier = None
+            if self.settings.router_training_path:
+                classifier = NaiveBayesClassifier.from_file(self.settings.router_training_path)
+            self.router = IntentRouter(classifier=classifier, threshold=self.settings.router_confidence_threshold)
+        
+        # Claude Haiku on Bedrock by default, see Settings.model_registry
+        self.model = get_model_registry().get("SupervisorAgent")
         
-        # Create agent with memory hooks
+    def create_agent(self, actor_id: str, session_id: str) -> Agent:
+        """Create the supervisor agent for one conversation session"""
+        
+        # Create agent with memory hooks; history is loaded from memory on init
+        # and the live conversation is kept within the same token budget
         agent = Agent(
-            model=bedrock_model,
-            tools=provider.tools,
+            model=self.model,
+            tools=self.tools,
             system_prompt=self._get_system_prompt(),
-            hooks=[MemoryHookProvider(memory_manager.client, memory_id)],
+            conversation_manager=CompactingConversationManager(self.compactor),
+            hooks=[self.memory_hooks, self.metrics_hooks],
             state={
-                "actor_id": self.settings.actor_id, 
-                "session_id": self.settings.session_id
+                "actor_id": actor_id, 
+                "session_id": session_id
             },
         )
         
@@ -87,17 +164,105 @@ Guidelines:
 - Always provide a cohesive summary if multiple agents are involved.
 - Always prioritize accuracy and context-awareness. Do not guess if the users request is ambiguous; instead, ask a clarifying question before routing.
 - Never answer questions yourself unless no agent is appropriate.
-
+{self._get_dispatch_guidelines()}
 Today's date: {datetime.today().strftime('%Y-%m-%d')}
 """
     
-    async def process_request(self, question: str):
-        """Process a user request through the supervisor agent"""
+    def _get_dispatch_guidelines(self) -> str:
+        """Plan-then-execute instructions, included when parallel dispatch is enabled"""
+        if not self.settings.parallel_dispatch:
+            return ""
+        return """
+Parallel execution:
+- Before calling any agent, plan every agent call the request needs.
+- Calls that do not depend on each other's results (e.g. the policy lookup with GuestAdvisoryAgent and the
+  reservation lookup with ReservationAgent before a cancellation) must be sent together in ONE
+  dispatch_parallel_calls call, not as consecutive a2a_send_message calls.
+- Only use a2a_send_message for a call that needs the result of an earlier call (e.g. sending the
+  notification after the booking has been created).
+"""
+
+    async def process_request(
+        self, question: str, actor_id: Optional[str] = None, session_id: Optional[str] = None
+    ):
+        """Process a user request through the supervisor agent for its session"""
+        actor_id = actor_id or self.settings.actor_id
+        session_id = session_id or self.settings.session_id
         try:
             logger.info(f"Processing request: {question}")
-            response = await self.agent.invoke_async(question)
+            with request_deadline(self.settings.request_budget):
+                async with self.sessions.session(actor_id, session_id) as agent:
+                    response = None
+                    decision = self._route(agent, question)
+                    if decision:
+                        response = await self._route_directly(agent, question, decision)
+                    if response is None:
+                        response = await agent.invoke_async(question)
             logger.info("Request processed successfully")
             return response
         except Exception as e:
             logger.error(f"Error processing request: {e}")
             raise
+
+    async def stream_request(
+        self, question: str, actor_id: Optional[str] = None, session_id: Optional[str] = None
+    ) -> AsyncIterator[StreamEvent]:
+        """Process a request, yielding text chunks and progress events as they happen"""
+        actor_id = actor_id or self.settings.actor_id
+        session_id = session_id or self.settings.session_id
+        logger.info(f"Streaming request: {question}")
+        with request_deadline(self.settings.request_budget):
+            async with self.sessions.session(actor_id, session_id) as agent:
+                decision = self._route(agent, question)
+                if decision:
+                    yield progress_event(f"Calling {decision.agent}…")
+                    response = await self._route_directly(agent, question, decision)
+                    if response is not None:
+                        text = str(response)
+                        yield text_event(text)
+                        yield done_event(text, agent=response.agent)
+                        return
+
+                async for event in agent.stream_async(question):
+                    if "data" in event:
+                        yield text_event(event["data"])
+                    elif "message" in event:
+                        for progress in tool_progress(event["message"], self.settings.get_agent_name):
+                            yield progress
+                    elif "result" in event:
+                        yield done_event(str(event["result"]))
+        logger.info("Request streamed successfully")
+
+    def _route(self, agent: Agent, question: str) -> Optional[RouteDecision]:
+        """Local routing decision; follow-ups in a conversation are judged with that in mind"""
+        if not self.router:
+            return None
+        has_history = bool(agent.messages) or bool(agent.state.get("loaded_turns"))
+        return self.router.route(question, has_history=has_history)
+
+    async def _route_directly(
+        self, agent: Agent, question: str, decision: RouteDecision
+    ) -> Optional[RoutedResponse]:
+        """Send a locally routed request straight to its sub-agent, skipping the supervisor LLM"""
+        result = await self.send_message(
+            decision.to_message(question), self.settings.get_agent_url(decision.agent)
+        )
+        text = extract_a2a_text(result) if result.get("status") == "success" else ""
+        if result.get("error_type") == "circuit_open":
+            # The supervisor LLM would only call the same failing agent again
+            text = unavailable_message(result)
+        if not text:
+            logger.warning(f"Direct route to {decision.agent} failed, falling back to supervisor")
+            return None
+        
+        # Keep the session's history as if the supervisor had answered
+        user_message = {"role": "user", "content": [{"text": question}]}
+        assistant_message = {"role": "assistant", "content": [{"text": text}]}
+        agent.messages.extend([user_message, assistant_message])
+        agent.conversation_manager.apply_management(agent)
+        actor_id = agent.state.get("actor_id")
+        session_id = agent.state.get("session_id")
+        self.memory_hooks.record_message(actor_id, session_id, question, "user")
+        self.memory_hooks.record_message(actor_id, session_id, text, "assistant")
+        
+        return RoutedResponse(message=assistant_message, agent=decision.agent)
@@ -1,37 +1,151 @@
-import os
+import time
 import logging
-from datetime import datetime
-from bedrock_agentcore.runtime import BedrockAgentCoreApp
+from contextlib import asynccontextmanager
 from dotenv import load_dotenv
 
-from .core.supervisor import SupervisorAgent
+# Settings read the environment when first imported
+load_dotenv(override=True)
+
+from bedrock_agentcore.runtime import BedrockAgentCoreApp, PingStatus
+
+from .core.batch import BatchRunner
+from .core.startup import BackgroundInitializer
+from .core.streaming import error_event, item_event, summary_event
 from .config.settings import Settings
+from .utils.tracing import setup_tracing, traced
+from .utils.metrics import add_metrics_route
 
-load_dotenv(override=True)
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("hotel-booking-system")
+setup_tracing("hotel-booking-supervisor")
 
-app = BedrockAgentCoreApp()
 settings = Settings()
 
-# Initialize supervisor agent
-supervisor = SupervisorAgent(settings)
+
+def create_supervisor():
+    """Build the supervisor: memory provisioning, Bedrock client and agent wiring"""
+    # Deferred so the app binds before strands, boto3 and the A2A SDK are loaded
+    from .core.supervisor import SupervisorAgent
+
+    return SupervisorAgent(settings)
+
+
+supervisor_init = BackgroundInitializer(create_supervisor, name="SupervisorAgent")
+
+
+@asynccontextmanager
+async def lifespan(app):
+    # Warm up in the background; requests that arrive first wait for it
+    supervisor_init.start()
+    yield
+
+
+app = BedrockAgentCoreApp(lifespan=lifespan)
+# Prometheus scrape endpoint next to /invocations and /ping
+add_metrics_route(app)
+
+
+@app.ping
+def ping():
+    """Report busy until the supervisor is ready to take requests"""
+    return PingStatus.HEALTHY if supervisor_init.ready else PingStatus.HEALTHY_BUSY
 
 
 @app.entrypoint
 async def send_message(request):
     """Main entry point for the hotel booking system"""
     try:
+        if request.get("batch") is not None:
+            return start_batch(request)
+
         question = request.get("question")
         if not question:
             return {"error": "No question provided"}
 
-        response = await supervisor.process_request(question)
+        if request.get("stream"):
+            return stream_message(question, request)
+
+        # Each conversation is served by its own pooled supervisor agent
+        with traced("send_message", **request_attributes(request)):
+            supervisor = await supervisor_init.get()
+            response = await supervisor.process_request(
+                question,
+                actor_id=request.get("actor_id"),
+                session_id=request.get("session_id"),
+            )
         return response.message["content"]
     except Exception as e:
         logger.error(f"Failed to process request: {str(e)}")
         return {"error": f"Failed to process request: {str(e)}"}
 
 
+def request_attributes(request) -> dict:
+    """Span attributes identifying the conversation"""
+    return {"actor_id": request.get("actor_id"), "session_id": request.get("session_id")}
+
+
+async def stream_message(question, request):
+    """Stream text chunks and progress events, sent to the client as SSE"""
+    try:
+        with traced("send_message", streaming=True, **request_attributes(request)):
+            supervisor = await supervisor_init.get()
+            async for event in supervisor.stream_request(
+                question,
+                actor_id=request.get("actor_id"),
+                session_id=request.get("session_id"),
+            ):
+                yield event
+    except Exception as e:
+        logger.error(f"Failed to stream request: {str(e)}")
+        yield error_event(f"Failed to process request: {str(e)}")
+
+
+def start_batch(request):
+    """Validate a batch request; its results are streamed as they complete"""
+    items = request["batch"]
+    if not isinstance(items, list) or not all(isinstance(item, dict) for item in items):
+        return {"error": "batch must be a list of objects with a question"}
+    if len(items) > settings.batch_max_items:
+        return {"error": f"batch has {len(items)} items; the limit is {settings.batch_max_items}"}
+    return batch_message(items, request)
+
+
+def batch_limits(request) -> dict:
+    """The limits a batch asked for, within the server's caps"""
+    concurrency = int(request.get("max_concurrency") or settings.batch_max_concurrency)
+    tokens_per_minute = int(request.get("tokens_per_minute") or settings.batch_tokens_per_minute)
+    if settings.batch_tokens_per_minute:
+        tokens_per_minute = min(tokens_per_minute, settings.batch_tokens_per_minute)
+    return {
+        "max_concurrency": min(concurrency, settings.batch_max_concurrency),
+        "tokens_per_minute": tokens_per_minute,
+    }
+
+
+async def batch_message(items, request):
+    """Run a batch of questions, sending each item's result as an SSE event when it finishes"""
+    start = time.perf_counter()
+    succeeded = failed = 0
+    try:
+        with traced("send_batch", items=len(items), **request_attributes(request)):
+            supervisor = await supervisor_init.get()
+            runner = BatchRunner(
+                supervisor.process_request,
+                estimated_tokens=settings.batch_estimated_tokens,
+                **batch_limits(request),
+            )
+            actor_id = request.get("actor_id")
+            async for result in runner.run(dict({"actor_id": actor_id}, **item) for item in items):
+                if result["status"] == "success":
+                    succeeded += 1
+                else:
+                    failed += 1
+                yield item_event(result)
+        yield summary_event(succeeded, failed, time.perf_counter() - start)
+    except Exception as e:
+        logger.error(f"Failed to run batch: {str(e)}")
+        yield error_event(f"Failed to run batch: {str(e)}")
+
+
 if __name__ == "__main__":
     app.run()
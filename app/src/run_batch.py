@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Run a JSONL file of inquiries through the supervisor, in-process
+
+Each input line is {"question": ..., "id": ..., "session_id": ..., "actor_id": ...};
+only "question" is required. Each result is appended to the output file as
+a JSON line as soon as it completes. A rerun skips the items already
+answered successfully, so a large run can be resumed after an interruption.
+When a run finishes, the output is rewritten with one record per id, the
+last one written, so failures a rerun has since answered are dropped.
+
+    python -m src.run_batch saved_searches.jsonl results.jsonl --concurrency 8 --tokens-per-minute 200000
+"""
+import sys
+import json
+import time
+import asyncio
+import logging
+import argparse
+from dotenv import load_dotenv
+
+load_dotenv(override=True)
+
+from .config.settings import Settings
+from .core.batch import BatchRunner, compact_output, completed_ids, read_jsonl
+
+logger = logging.getLogger("hotel-booking-batch")
+
+
+async def run(args) -> int:
+    """Run the batch and return the number of failed items"""
+    from .core.supervisor import SupervisorAgent
+
+    settings = Settings()
+    supervisor = SupervisorAgent(settings)
+    skip_ids = set() if args.no_resume else completed_ids(args.output)
+    if skip_ids:
+        logger.info(f"Resuming: {len(skip_ids)} items already answered")
+
+    runner = BatchRunner(
+        supervisor.process_request,
+        max_concurrency=args.concurrency,
+        tokens_per_minute=args.tokens_per_minute,
+        estimated_tokens=args.estimated_tokens,
+    )
+    start = time.perf_counter()
+    succeeded = failed = 0
+    with open(args.output, "w" if args.no_resume else "a") as out:
+        async for result in runner.run(read_jsonl(args.input, skip_ids)):
+            out.write(json.dumps(result, default=str) + "\n")
+            out.flush()
+            if result["status"] == "success":
+                succeeded += 1
+            else:
+                failed += 1
+            if (succeeded + failed) % args.log_every == 0:
+                logger.info(f"{succeeded + failed} items done ({failed} failed)")
+
+    dropped = compact_output(args.output)
+    if dropped:
+        logger.info(f"Dropped {dropped} superseded records from {args.output}")
+    logger.info(f"Batch finished in {time.perf_counter() - start:.1f}s: {succeeded} succeeded, {failed} failed")
+    return failed
+
+
+def main():
+    settings = Settings()
+    parser = argparse.ArgumentParser(description="Run a JSONL batch of inquiries through the supervisor")
+    parser.add_argument("input", help="JSONL file of items with a question")
+    parser.add_argument("output", help="JSONL file the results are appended to; one record per id after the run")
+    parser.add_argument("--concurrency", type=int, default=settings.batch_max_concurrency, help="Items run at once")
+    parser.add_argument(
+        "--tokens-per-minute", type=int, default=settings.batch_tokens_per_minute,
+        help="Supervisor token budget per minute; 0 for no limit",
+    )
+    parser.add_argument(
+        "--estimated-tokens", type=int, default=settings.batch_estimated_tokens,
+        help="Tokens reserved per item until its usage is known",
+    )
+    parser.add_argument("--no-resume", action="store_true", help="Overwrite the output instead of resuming")
+    parser.add_argument("--log-every", type=int, default=50, help="Log progress every N items")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    failed = asyncio.run(run(args))
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
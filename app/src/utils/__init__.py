@@ -1,4 +1,44 @@
-from .auth import TokenManager
-from .mcp_client import create_mcp_client
+from importlib import import_module
 
-__all__ = ["TokenManager", "create_mcp_client"]
+# Exports are imported on first use, so the entrypoint can load metrics and
+# tracing without pulling in the MCP client and strands
+_EXPORTS = {
+    "TokenManager": ".auth",
+    "get_token_manager": ".auth",
+    "MCPSession": ".mcp_client",
+    "create_mcp_client": ".mcp_client",
+    "get_mcp_session": ".mcp_client",
+    "EmailOutbox": ".smtp_outbox",
+    "SMTPConnectionPool": ".smtp_outbox",
+    "get_email_outbox": ".smtp_outbox",
+    "CachingMCPTool": ".tool_cache",
+    "ToolResultCache": ".tool_cache",
+    "get_tool_result_cache": ".tool_cache",
+    "MetricsHookProvider": ".metrics",
+    "MetricsRegistry": ".metrics",
+    "add_metrics_route": ".metrics",
+    "get_metrics_registry": ".metrics",
+    "FallbackModel": ".model_registry",
+    "ModelRegistry": ".model_registry",
+    "get_model_registry": ".model_registry",
+    "CircuitBreaker": ".resilience",
+    "DeadlineMiddleware": ".resilience",
+    "GuardedMCPTool": ".resilience",
+    "SingleFlight": ".resilience",
+    "get_circuit_breaker": ".resilience",
+    "request_deadline": ".resilience",
+    "TraceContextMiddleware": ".tracing",
+    "get_tracer": ".tracing",
+    "setup_tracing": ".tracing",
+    "traced": ".tracing",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
@@ -1,27 +1,79 @@
 import os
+import json
+import time
+import threading
 import requests
 import logging
 from typing import Optional
 
 logger = logging.getLogger(__name__)
 
+# Refresh this many seconds before the token actually lapses
+DEFAULT_REFRESH_MARGIN_SECONDS = 300
+# Retry delay for a failed background refresh while the old token is still valid
+REFRESH_RETRY_SECONDS = 15
+# Never schedule background refreshes closer together than this
+MIN_REFRESH_DELAY_SECONDS = 30
+
+
 class TokenManager:
     """Manages Cognito authentication tokens for AgentCore gateway access"""
-    
-    def __init__(self):
+
+    def __init__(self, cache_path: Optional[str] = None):
         self.client_id = os.getenv("USER_POOL_CLIENT_ID")
         self.client_secret = os.getenv("USER_POOL_CLIENT_SECRET")
         self.user_pool_id = os.getenv("USER_POOL_ID")
         self.resource_server_id = os.getenv("AGENTCORE_RESOURCE_SERVER_ID")
         self.cognito_domain_url = os.getenv("COGNITO_DOMAIN_URL")
         self.scope_string = f"{self.resource_server_id}/gateway:read {self.resource_server_id}/gateway:write"
+        self.refresh_margin = int(
+            os.getenv("TOKEN_REFRESH_MARGIN_SECONDS", DEFAULT_REFRESH_MARGIN_SECONDS)
+        )
+        self.cache_path = cache_path or os.getenv("TOKEN_CACHE_PATH")
+
+        # Pooled HTTP session so refreshes reuse the TLS connection to Cognito
+        self._session = requests.Session()
+        self._refresh_lock = threading.Lock()
+        self._timer: Optional[threading.Timer] = None
+        self._token: Optional[str] = None
+        self._expires_at = 0.0
+        self._lifetime = 0.0
+
+        self._load_cached_token()
+
+    def get_token(self) -> Optional[str]:
+        """Return a valid access token, refreshing it only when it has expired"""
+        if self._is_valid():
+            return self._token
+
+        # Concurrent callers queue on the lock and share the single refresh
+        with self._refresh_lock:
+            if self._is_valid():
+                return self._token
+            return self._refresh()
 
     def get_fresh_token(self) -> Optional[str]:
         """Get a fresh access token from Cognito"""
+        with self._refresh_lock:
+            return self._refresh()
+
+    def close(self):
+        """Cancel the background refresh and release pooled connections"""
+        if self._timer:
+            self._timer.cancel()
+            self._timer = None
+        self._session.close()
+
+    def _is_valid(self) -> bool:
+        # Keep a small skew so a token is never handed out as it lapses
+        return self._token is not None and time.time() < self._expires_at - 30
+
+    def _refresh(self) -> Optional[str]:
+        """Request a new token; caller must hold the refresh lock"""
         try:
             url = f"{self.cognito_domain_url}/oauth2/token"
 
-            response = requests.post(
+            response = self._session.post(
                 url,
                 headers={"Content-Type": "application/x-www-form-urlencoded"},
                 data={
@@ -30,11 +82,98 @@ class TokenManager:
                     "client_secret": self.client_secret,
                     "scope": self.scope_string,
                 },
+                timeout=10,
             )
             response.raise_for_status()
-            token = response.json()["access_token"]
+            payload = response.json()
+            self._token = payload["access_token"]
+            self._lifetime = float(payload.get("expires_in", 3600))
+            self._expires_at = time.time() + self._lifetime
             logger.info("Successfully obtained fresh token")
-            return token
+
+            self._save_cached_token()
+            self._schedule_refresh()
+            return self._token
         except requests.exceptions.RequestException as err:
             logger.error(f"Failed to get token: {str(err)}")
+            if self._is_valid():
+                # Old token still usable; try again shortly in the background
+                self._schedule_refresh(delay=REFRESH_RETRY_SECONDS)
+                return self._token
             return None
+
+    def _schedule_refresh(self, delay: Optional[float] = None):
+        """Refresh proactively in the background before the token lapses"""
+        if self._timer:
+            self._timer.cancel()
+
+        if delay is None:
+            # Short-lived tokens refresh halfway through their lifetime instead
+            margin = min(self.refresh_margin, self._lifetime / 2)
+            delay = max(self._expires_at - margin - time.time(), MIN_REFRESH_DELAY_SECONDS)
+
+        self._timer = threading.Timer(delay, self._background_refresh)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _background_refresh(self):
+        with self._refresh_lock:
+            self._refresh()
+
+    def _load_cached_token(self):
+        """Reuse a persisted token so a quick restart skips the network round-trip"""
+        if not self.cache_path or not os.path.exists(self.cache_path):
+            return
+
+        try:
+            with open(self.cache_path) as f:
+                cached = json.load(f)
+
+            # Never reuse a token minted for different credentials or scopes
+            if cached.get("client_id") != self.client_id or cached.get("scope") != self.scope_string:
+                return
+
+            self._token = cached["access_token"]
+            self._expires_at = float(cached["expires_at"])
+            self._lifetime = self._expires_at - time.time()
+            if self._is_valid():
+                logger.info("Loaded cached token from disk")
+                self._schedule_refresh()
+            else:
+                self._token = None
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Ignoring unreadable token cache: {e}")
+
+    def _save_cached_token(self):
+        if not self.cache_path:
+            return
+
+        try:
+            tmp_path = f"{self.cache_path}.{os.getpid()}.tmp"
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "w") as f:
+                json.dump(
+                    {
+                        "access_token": self._token,
+                        "expires_at": self._expires_at,
+                        "client_id": self.client_id,
+                        "scope": self.scope_string,
+                    },
+                    f,
+                )
+            os.replace(tmp_path, self.cache_path)
+        except OSError as e:
+            logger.warning(f"Failed to persist token cache: {e}")
+
+
+_token_manager: Optional[TokenManager] = None
+_token_manager_lock = threading.Lock()
+
+
+def get_token_manager() -> TokenManager:
+    """Return the process-wide token manager shared by all MCP clients"""
+    global _token_manager
+    with _token_manager_lock:
+        if _token_manager is None:
+            _token_manager = TokenManager()
+        return _token_manager
@@ -1,18 +1,196 @@
 import os
+import json
+import logging
+import threading
+from typing import Callable, List, Optional
 from mcp.client.streamable_http import streamablehttp_client
+from mcp.types import Tool as MCPTool
+from strands.tools.mcp.mcp_agent_tool import MCPAgentTool
 from strands.tools.mcp.mcp_client import MCPClient
-from .auth import TokenManager
+from strands.types.exceptions import MCPClientInitializationError
+from .auth import get_token_manager
+
+logger = logging.getLogger(__name__)
+
+# Bump when the on-disk layout of the schema cache changes
+SCHEMA_CACHE_VERSION = 1
 
 def create_mcp_client() -> MCPClient:
     """Create an MCP client with authentication"""
     gateway_url = os.getenv("AGENTCORE_GATEWAY_URL")
-    token_manager = TokenManager()
-    token = token_manager.get_fresh_token()
-    
+    token_manager = get_token_manager()
+
     def create_mcp_transport():
+        # Resolve the token per connection so reconnects pick up refreshed tokens
+        token = token_manager.get_token()
         return streamablehttp_client(
-            gateway_url, 
+            gateway_url,
             headers={"Authorization": f"Bearer {token}"}
         )
-    
+
     return MCPClient(create_mcp_transport)
+
+
+class MCPSession:
+    """Long-lived MCP session shared by every agent in the process
+
+    Tools returned by get_tools() are bound to the session rather than to a
+    raw MCPClient, so a dropped connection is re-established transparently
+    on the next tool call.
+    """
+
+    def __init__(self, schema_cache_path: Optional[str] = None):
+        self.gateway_url = os.getenv("AGENTCORE_GATEWAY_URL")
+        self.schema_cache_path = schema_cache_path or os.getenv("MCP_SCHEMA_CACHE_PATH")
+        self.client = create_mcp_client()
+        self._lock = threading.Lock()
+        self._connected = False
+        self._tools: Optional[List[MCPAgentTool]] = None
+        self._from_cache = False
+
+    def connect(self):
+        """Open the gateway session if it is not already running"""
+        with self._lock:
+            if not self._connected:
+                self.client.start()
+                self._connected = True
+                logger.info("MCP session connected")
+
+    def reconnect(self):
+        """Tear down and re-open the gateway session"""
+        with self._lock:
+            self._stop_client()
+            self.client.start()
+            self._connected = True
+            logger.info("MCP session reconnected")
+
+    def close(self):
+        with self._lock:
+            self._stop_client()
+
+    def _stop_client(self):
+        if self._connected:
+            try:
+                self.client.stop(None, None, None)
+            except Exception as e:
+                logger.warning(f"Error closing MCP session: {e}")
+            self._connected = False
+
+    async def call_tool_async(self, **kwargs):
+        """Proxy used by session-bound tools; reconnects once on a dead session"""
+        self.connect()
+        try:
+            return await self.client.call_tool_async(**kwargs)
+        except MCPClientInitializationError:
+            logger.warning("MCP session is not running, reconnecting")
+            self.reconnect()
+            return await self.client.call_tool_async(**kwargs)
+
+    def get_tools(self) -> List[MCPAgentTool]:
+        """Return the gateway tools, from the schema cache when one is available"""
+        if self._tools is not None:
+            return self._tools
+
+        cached = self._load_schemas()
+        if cached is not None:
+            self._tools = self._bind_tools(cached)
+            self._from_cache = True
+            logger.info(f"Loaded {len(cached)} tool schemas from cache")
+        else:
+            schemas = self._list_schemas()
+            self._save_schemas(schemas)
+            self._tools = self._bind_tools(schemas)
+        return self._tools
+
+    def validate_tools(self, on_change: Callable[[List[MCPAgentTool]], None]):
+        """Check cached schemas against the gateway in the background
+
+        on_change is called with the new tool list if the gateway's schemas
+        differ from the cached ones.
+        """
+        if not self._from_cache:
+            return
+
+        def _validate():
+            try:
+                schemas = self._list_schemas()
+            except Exception as e:
+                logger.warning(f"Tool schema validation failed: {e}")
+                return
+
+            current = [tool.mcp_tool for tool in self._tools or []]
+            if self._dump(schemas) == self._dump(current):
+                logger.info("Cached tool schemas are up to date")
+                return
+
+            logger.info("Gateway tool schemas changed, refreshing tools")
+            self._save_schemas(schemas)
+            self._tools = self._bind_tools(schemas)
+            on_change(self._tools)
+
+        self._from_cache = False
+        threading.Thread(target=_validate, name="mcp-schema-validate", daemon=True).start()
+
+    def _list_schemas(self) -> List[MCPTool]:
+        self.connect()
+        schemas = []
+        pagination_token = None
+        while True:
+            page = self.client.list_tools_sync(pagination_token=pagination_token)
+            schemas.extend(tool.mcp_tool for tool in page)
+            pagination_token = page.pagination_token
+            if not pagination_token:
+                return schemas
+
+    def _bind_tools(self, schemas: List[MCPTool]) -> List[MCPAgentTool]:
+        return [MCPAgentTool(schema, self) for schema in schemas]
+
+    @staticmethod
+    def _dump(schemas: List[MCPTool]) -> list:
+        return [s.model_dump(mode="json", by_alias=True, exclude_none=True) for s in schemas]
+
+    def _load_schemas(self) -> Optional[List[MCPTool]]:
+        if not self.schema_cache_path or not os.path.exists(self.schema_cache_path):
+            return None
+
+        try:
+            with open(self.schema_cache_path) as f:
+                cached = json.load(f)
+            if cached.get("version") != SCHEMA_CACHE_VERSION or cached.get("gateway_url") != self.gateway_url:
+                return None
+            return [MCPTool.model_validate(tool) for tool in cached["tools"]]
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Ignoring unreadable tool schema cache: {e}")
+            return None
+
+    def _save_schemas(self, schemas: List[MCPTool]):
+        if not self.schema_cache_path:
+            return
+
+        try:
+            tmp_path = f"{self.schema_cache_path}.{os.getpid()}.tmp"
+            with open(tmp_path, "w") as f:
+                json.dump(
+                    {
+                        "version": SCHEMA_CACHE_VERSION,
+                        "gateway_url": self.gateway_url,
+                        "tools": self._dump(schemas),
+                    },
+                    f,
+                )
+            os.replace(tmp_path, self.schema_cache_path)
+        except OSError as e:
+            logger.warning(f"Failed to persist tool schema cache: {e}")
+
+
+_mcp_session: Optional[MCPSession] = None
+_mcp_session_lock = threading.Lock()
+
+
+def get_mcp_session() -> MCPSession:
+    """Return the process-wide MCP session"""
+    global _mcp_session
+    with _mcp_session_lock:
+        if _mcp_session is None:
+            _mcp_session = MCPSession()
+        return _mcp_session
@@ -0,0 +1,293 @@
+import os
+import json
+import time
+import bisect
+import logging
+import threading
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.routing import Route
+
+logger = logging.getLogger(__name__)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+METRICS_PATH = "/metrics"
+
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2, 5, 10, 30, 60)
+TOOL_LATENCY_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2, 5, 10)
+
+# USD per million (input, output) tokens; MODEL_PRICES (JSON) adds or overrides entries
+DEFAULT_MODEL_PRICES = {
+    "anthropic.claude-3-haiku-20240307-v1:0": (0.25, 1.25),
+    "gemini/gemini-2.5-flash": (0.30, 2.50),
+    "gemini/gemini-2.5-flash-lite": (0.10, 0.40),
+}
+
+Labels = Tuple[Tuple[str, str], ...]
+# (metric name, labels, value) as produced by a collector at scrape time
+Sample = Tuple[str, Dict[str, str], float]
+
+
+def _labels(labels: Dict[str, Any]) -> Labels:
+    return tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+def _format_labels(labels: Labels, extra: Optional[Tuple[str, str]] = None) -> str:
+    pairs = list(labels) + ([extra] if extra else [])
+    if not pairs:
+        return ""
+    escaped = (v.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") for _, v in pairs)
+    return "{" + ",".join(f'{k}="{v}"' for (k, _), v in zip(pairs, escaped)) + "}"
+
+
+class _Histogram:
+    __slots__ = ("buckets", "counts", "sum", "count")
+
+    def __init__(self, buckets: Tuple[float, ...]):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+class MetricsRegistry:
+    """In-process counters and histograms rendered in the Prometheus text format
+
+    Recording is a dict update under one lock, so it is cheap enough for the
+    hook path. Gauges such as cache hit ratios are read from registered
+    collectors only when /metrics is scraped.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._meta: Dict[str, Tuple[str, str, Tuple[float, ...]]] = {}
+        self._counters: Dict[Tuple[str, Labels], float] = {}
+        self._histograms: Dict[Tuple[str, Labels], _Histogram] = {}
+        self._collectors: Dict[str, Callable[[], Iterable[Sample]]] = {}
+
+    def describe(self, name: str, kind: str, help_text: str, buckets: Tuple[float, ...] = LATENCY_BUCKETS):
+        self._meta[name] = (kind, help_text, buckets)
+
+    def inc(self, name: str, value: float = 1, **labels):
+        key = (name, _labels(labels))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def observe(self, name: str, value: float, **labels):
+        key = (name, _labels(labels))
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = _Histogram(self._meta.get(name, ("", "", LATENCY_BUCKETS))[2])
+            histogram.observe(value)
+
+    def register_collector(self, name: str, collector: Callable[[], Iterable[Sample]]):
+        """Add a callable that yields gauge samples at scrape time; replaces one of the same name"""
+        self._collectors[name] = collector
+
+    def register_cache(self, name: str, cache: Any):
+        """Export hits, misses and hit ratio from any cache with a metrics() dict"""
+
+        def collect():
+            stats = cache.metrics()
+            hits = stats.get("hits", 0) + stats.get("similar_hits", 0)
+            misses = stats.get("misses", 0)
+            lookups = hits + misses
+            yield "cache_hits", {"cache": name}, hits
+            yield "cache_misses", {"cache": name}, misses
+            yield "cache_hit_ratio", {"cache": name}, hits / lookups if lookups else 0.0
+
+        self.register_collector(f"cache:{name}", collect)
+
+    def value(self, name: str, **labels) -> float:
+        with self._lock:
+            return self._counters.get((name, _labels(labels)), 0)
+
+    def render(self) -> str:
+        with self._lock:
+            counters = dict(self._counters)
+            histograms = {
+                key: (list(h.buckets), list(h.counts), h.sum, h.count) for key, h in self._histograms.items()
+            }
+
+        gauges: Dict[str, List[Tuple[Labels, float]]] = {}
+        for collector in list(self._collectors.values()):
+            try:
+                for name, labels, value in collector():
+                    gauges.setdefault(name, []).append((_labels(labels), value))
+            except Exception as e:
+                logger.debug(f"Metrics collector failed: {e}")
+
+        lines: List[str] = []
+
+        def header(name: str, default_kind: str):
+            kind, help_text, _ = self._meta.get(name, (default_kind, "", ()))
+            if help_text:
+                lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind or default_kind}")
+
+        for name in sorted({name for name, _ in counters}):
+            header(name, "counter")
+            for (n, labels), value in sorted(counters.items()):
+                if n == name:
+                    lines.append(f"{name}{_format_labels(labels)} {value:g}")
+
+        for name in sorted({name for name, _ in histograms}):
+            header(name, "histogram")
+            for (n, labels), (buckets, counts, total, count) in sorted(histograms.items()):
+                if n != name:
+                    continue
+                cumulative = 0
+                for bound, bucket_count in zip(list(buckets) + [float("inf")], counts):
+                    cumulative += bucket_count
+                    le = "+Inf" if bound == float("inf") else f"{bound:g}"
+                    lines.append(f"{name}_bucket{_format_labels(labels, ('le', le))} {cumulative}")
+                lines.append(f"{name}_sum{_format_labels(labels)} {total:g}")
+                lines.append(f"{name}_count{_format_labels(labels)} {count}")
+
+        for name in sorted(gauges):
+            header(name, "gauge")
+            for labels, value in sorted(gauges[name]):
+                lines.append(f"{name}{_format_labels(labels)} {value:g}")
+
+        return "\n".join(lines) + "\n"
+
+
+def _describe_defaults(registry: MetricsRegistry):
+    registry.describe("agent_model_calls_total", "counter", "Model invocations per agent and model")
+    registry.describe("agent_model_errors_total", "counter", "Model invocations that raised")
+    registry.describe("agent_input_tokens_total", "counter", "Prompt tokens sent to the model")
+    registry.describe("agent_output_tokens_total", "counter", "Completion tokens returned by the model")
+    registry.describe("agent_cost_usd_total", "counter", "Estimated model cost in USD")
+    registry.describe("agent_model_latency_seconds", "histogram", "Wall-clock model call latency")
+    registry.describe("agent_tool_calls_total", "counter", "Tool calls per agent and tool")
+    registry.describe("agent_tool_errors_total", "counter", "Tool calls that failed")
+    registry.describe(
+        "agent_tool_latency_seconds", "histogram", "Wall-clock tool call latency", buckets=TOOL_LATENCY_BUCKETS
+    )
+    registry.describe("cache_hits", "gauge", "Cache hits since start")
+    registry.describe("cache_misses", "gauge", "Cache misses since start")
+    registry.describe("cache_hit_ratio", "gauge", "Hits over lookups since start")
+    registry.describe("server_requests_in_flight", "gauge", "Requests being served by this worker")
+    registry.describe("server_requests_queued", "gauge", "Requests waiting for a worker slot")
+    registry.describe("server_requests_rejected", "gauge", "Requests rejected with 503 since start")
+    registry.describe("subagent_calls_total", "counter", "Sub-agent calls by outcome")
+    registry.describe("subagent_hedges_total", "counter", "Hedged sub-agent calls by the request that won")
+    registry.describe("circuit_rejections_total", "counter", "Calls failed fast by an open circuit breaker")
+    registry.describe("circuit_open", "gauge", "1 while a dependency's circuit breaker is open or half-open")
+    registry.describe("singleflight_coalesced_total", "counter", "Calls served by an identical call in flight")
+    registry.describe("notification_events_total", "counter", "Booking events received by the notification buffer")
+    registry.describe("notification_emails_sent_total", "counter", "Notification emails sent after collapsing")
+    registry.describe("notification_emails_saved_total", "counter", "Emails not sent because events were collapsed")
+    registry.describe("notification_urgent_total", "counter", "Events sent at once, bypassing the quiet window")
+    registry.describe("notification_failed_total", "counter", "Notification emails that could not be queued")
+    registry.describe("notification_pending_events", "gauge", "Events waiting for their quiet window to end")
+
+
+def load_model_prices() -> Dict[str, Tuple[float, float]]:
+    prices = dict(DEFAULT_MODEL_PRICES)
+    raw = os.getenv("MODEL_PRICES")
+    if raw:
+        try:
+            prices.update({model: tuple(price) for model, price in json.loads(raw).items()})
+        except (ValueError, TypeError) as e:
+            logger.warning(f"Ignoring invalid MODEL_PRICES: {e}")
+    return prices
+
+
+def model_id_of(agent) -> str:
+    config = agent.model.get_config() if hasattr(agent.model, "get_config") else {}
+    return str(config.get("model_id") or type(agent.model).__name__)
+
+
+class MetricsHookProvider:
+    """Records model tokens, cost and latency, and tool calls, for one agent name
+
+    Implements strands' HookProvider protocol; strands is imported only when
+    the hooks are registered, so the entrypoint can serve /metrics without it.
+    """
+
+    START_KEY = "_metrics_model_started_at"
+
+    # Models already reported as missing a price, across every agent in the process
+    _unpriced: set = set()
+
+    def __init__(self, agent_name: str, registry: Optional["MetricsRegistry"] = None):
+        self.agent_name = agent_name
+        self.registry = registry or get_metrics_registry()
+        self.prices = load_model_prices()
+
+    def on_before_model_call(self, event):
+        event.invocation_state[self.START_KEY] = time.perf_counter()
+
+    def on_after_model_call(self, event):
+        started_at = event.invocation_state.pop(self.START_KEY, None)
+        model = model_id_of(event.agent)
+        labels = {"agent": self.agent_name, "model": model}
+        self.registry.inc("agent_model_calls_total", **labels)
+        if started_at is not None:
+            self.registry.observe("agent_model_latency_seconds", time.perf_counter() - started_at, **labels)
+        if event.exception is not None or event.stop_response is None:
+            self.registry.inc("agent_model_errors_total", **labels)
+            return
+
+        usage = event.stop_response.message.get("metadata", {}).get("usage", {})
+        input_tokens = usage.get("inputTokens", 0)
+        output_tokens = usage.get("outputTokens", 0)
+        self.registry.inc("agent_input_tokens_total", input_tokens, **labels)
+        self.registry.inc("agent_output_tokens_total", output_tokens, **labels)
+        if model in self.prices:
+            input_price, output_price = self.prices[model]
+            cost = (input_tokens * input_price + output_tokens * output_price) / 1_000_000
+            self.registry.inc("agent_cost_usd_total", cost, **labels)
+        elif model not in self._unpriced:
+            self._unpriced.add(model)
+            logger.warning(f"No price for model {model}; its cost is not recorded. Add it to MODEL_PRICES")
+
+    def on_after_tool_call(self, event):
+        labels = {"agent": self.agent_name, "tool": event.tool_use["name"]}
+        self.registry.inc("agent_tool_calls_total", **labels)
+        if event.duration is not None:
+            self.registry.observe("agent_tool_latency_seconds", event.duration, **labels)
+        if event.exception is not None or event.result.get("status") == "error":
+            self.registry.inc("agent_tool_errors_total", **labels)
+
+    def register_hooks(self, registry):
+        from strands.hooks import AfterModelCallEvent, AfterToolCallEvent, BeforeModelCallEvent
+
+        registry.add_callback(BeforeModelCallEvent, self.on_before_model_call)
+        registry.add_callback(AfterModelCallEvent, self.on_after_model_call)
+        registry.add_callback(AfterToolCallEvent, self.on_after_tool_call)
+
+
+_registry: Optional[MetricsRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_metrics_registry() -> MetricsRegistry:
+    """Process-wide registry shared by every agent in the process"""
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                registry = MetricsRegistry()
+                _describe_defaults(registry)
+                _registry = registry
+    return _registry
+
+
+def add_metrics_route(app, registry: Optional[MetricsRegistry] = None):
+    """Serve the registry in the Prometheus text format at /metrics"""
+    registry = registry or get_metrics_registry()
+
+    async def metrics(request: Request) -> Response:
+        return Response(registry.render(), media_type=CONTENT_TYPE)
+
+    app.router.routes.insert(0, Route(METRICS_PATH, metrics, methods=["GET"]))
@@ -0,0 +1,184 @@
+import os
+import asyncio
+import logging
+import threading
+from contextvars import ContextVar
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional
+
+from strands.models import Model
+from strands.types.exceptions import ModelThrottledException
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ROLE = "default"
+BEDROCK_PREFIX = "bedrock/"
+
+# Exception class names (anywhere in the MRO) that mean "try the next model"
+FALLBACK_ERROR_NAMES = {
+    "RateLimitError",
+    "ServiceUnavailableError",
+    "Timeout",
+    "APITimeoutError",
+    "ReadTimeoutError",
+    "ConnectTimeoutError",
+    "TimeoutError",
+}
+
+# Model that served the current call, so metrics can label it
+_served_model: ContextVar[Optional[str]] = ContextVar("served_model", default=None)
+
+
+def should_fall_back(error: BaseException) -> bool:
+    """Throttling and timeouts are worth another model; bad requests are not"""
+    if isinstance(error, (ModelThrottledException, asyncio.TimeoutError)):
+        return True
+    return any(cls.__name__ in FALLBACK_ERROR_NAMES for cls in type(error).__mro__)
+
+
+def build_model(spec: str, aws_region: Optional[str] = None) -> Model:
+    """Build the client for a model spec: ``bedrock/<model id>`` or any LiteLLM model name"""
+    if spec.startswith(BEDROCK_PREFIX):
+        import boto3
+        from strands.models import BedrockModel
+
+        return BedrockModel(
+            model_id=spec[len(BEDROCK_PREFIX):],
+            boto_session=boto3.Session(region_name=aws_region),
+        )
+
+    from strands.models.litellm import LiteLLMModel
+
+    client_args = {"api_key": os.getenv("GOOGLE_API_KEY")} if spec.startswith("gemini/") else {}
+    return LiteLLMModel(client_args=client_args, model_id=spec)
+
+
+class FallbackModel(Model):
+    """Streams from the first model in a chain that is not throttled or timing out
+
+    The primary client is built up front and fallbacks on first use, all
+    through the registry so clients are shared. A model that raises one of
+    the fallback errors, or sends nothing within ``first_event_timeout``
+    seconds, is skipped. Once a model has started streaming, its errors
+    propagate. Strands' own retry then starts again from the primary.
+    """
+
+    def __init__(self, chain: List[str], client_for: Callable[[str], Model], first_event_timeout: float = 30):
+        self.chain = chain
+        self.client_for = client_for
+        self.first_event_timeout = first_event_timeout
+        self.primary = client_for(chain[0])
+
+    def update_config(self, **model_config: Any):
+        self.primary.update_config(**model_config)
+
+    def get_config(self) -> Dict[str, Any]:
+        served = _served_model.get()
+        return {"model_id": served or self._model_id(self.primary, self.chain[0]), "fallbacks": self.chain[1:]}
+
+    @staticmethod
+    def _model_id(model: Model, spec: str) -> str:
+        config = model.get_config()
+        return config.get("model_id", spec) if isinstance(config, dict) else spec
+
+    async def _first_event(self, events: AsyncIterator[Any]) -> Optional[Any]:
+        try:
+            if self.first_event_timeout:
+                return await asyncio.wait_for(events.__anext__(), timeout=self.first_event_timeout)
+            return await events.__anext__()
+        except StopAsyncIteration:
+            return None
+
+    async def _fall_through(self, call: Callable[[Model], AsyncIterator[Any]]) -> AsyncIterator[Any]:
+        for index, spec in enumerate(self.chain):
+            model = self.primary if index == 0 else self.client_for(spec)
+            events = call(model)
+            try:
+                first = await self._first_event(events)
+            except Exception as e:
+                await events.aclose()
+                if index + 1 < len(self.chain) and should_fall_back(e):
+                    logger.warning(f"Model {spec} unavailable ({type(e).__name__}); falling back to {self.chain[index + 1]}")
+                    continue
+                raise
+
+            _served_model.set(self._model_id(model, spec))
+            if first is not None:
+                yield first
+            async for event in events:
+                yield event
+            return
+
+    async def stream(self, messages, tool_specs=None, system_prompt=None, **kwargs) -> AsyncIterator[Any]:
+        async for event in self._fall_through(lambda model: model.stream(messages, tool_specs, system_prompt, **kwargs)):
+            yield event
+
+    async def structured_output(self, output_model, prompt, system_prompt=None, **kwargs) -> AsyncIterator[Any]:
+        async for event in self._fall_through(
+            lambda model: model.structured_output(output_model, prompt, system_prompt=system_prompt, **kwargs)
+        ):
+            yield event
+
+
+class ModelRegistry:
+    """Maps agents and tools to a model chain and shares one client per model
+
+    ``routes`` maps a role (an agent or helper name) to its primary model
+    followed by fallbacks; roles without an entry use ``default``.
+    """
+
+    def __init__(
+        self,
+        routes: Dict[str, List[str]],
+        aws_region: Optional[str] = None,
+        first_event_timeout: float = 30,
+    ):
+        if not routes.get(DEFAULT_ROLE):
+            raise ValueError("The model registry needs a non-empty 'default' chain")
+        self.routes = routes
+        self.aws_region = aws_region
+        self.first_event_timeout = first_event_timeout
+        self._clients: Dict[str, Model] = {}
+        self._models: Dict[str, Model] = {}
+        self._lock = threading.RLock()
+
+    def chain(self, role: str) -> List[str]:
+        return list(self.routes.get(role) or self.routes[DEFAULT_ROLE])
+
+    def client(self, spec: str) -> Model:
+        """The shared client for one model spec"""
+        with self._lock:
+            if spec not in self._clients:
+                self._clients[spec] = build_model(spec, self.aws_region)
+            return self._clients[spec]
+
+    def get(self, role: str) -> Model:
+        """The shared model for a role; a FallbackModel when it has fallbacks"""
+        with self._lock:
+            if role not in self._models:
+                chain = self.chain(role)
+                if len(chain) == 1:
+                    self._models[role] = self.client(chain[0])
+                else:
+                    self._models[role] = FallbackModel(chain, self.client, self.first_event_timeout)
+                logger.info(f"Model chain for {role}: {' -> '.join(chain)}")
+            return self._models[role]
+
+
+_model_registry: Optional[ModelRegistry] = None
+_model_registry_lock = threading.Lock()
+
+
+def get_model_registry() -> ModelRegistry:
+    """Return the process-wide model registry, configured from Settings"""
+    global _model_registry
+    with _model_registry_lock:
+        if _model_registry is None:
+            from ..config.settings import Settings
+
+            settings = Settings()
+            _model_registry = ModelRegistry(
+                settings.model_registry,
+                aws_region=settings.aws_region,
+                first_event_timeout=settings.model_first_event_timeout,
+            )
+        return _model_registry
@@ -0,0 +1,338 @@
+import os
+import copy
+import time
+import asyncio
+import logging
+import threading
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Hashable, Iterator, Optional, Tuple
+
+from strands.types._events import ToolResultEvent
+from strands.types.tools import AgentTool, ToolGenerator, ToolResult, ToolSpec, ToolUse
+
+from .metrics import get_metrics_registry
+from .tool_cache import GUEST_ADVISORY_KB, SEARCH_HOTEL, canonical_args, failed_status, match_target
+
+logger = logging.getLogger(__name__)
+
+# Remaining request budget in milliseconds, passed along to the agents we call
+DEADLINE_HEADER = "x-request-budget-ms"
+
+# Absolute time.monotonic() by which the current request must be answered
+_deadline: ContextVar[Optional[float]] = ContextVar("request_deadline", default=None)
+
+
+@contextmanager
+def request_deadline(budget: float) -> Iterator[float]:
+    """Give the enclosed work ``budget`` seconds in total; a nested budget can only shrink it"""
+    deadline = time.monotonic() + budget
+    current = _deadline.get()
+    if current is not None:
+        deadline = min(deadline, current)
+    token = _deadline.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _deadline.reset(token)
+
+
+def remaining(cap: Optional[float] = None) -> Optional[float]:
+    """Seconds left of the request budget, at most ``cap``; ``cap`` when there is no budget"""
+    deadline = _deadline.get()
+    if deadline is None:
+        return cap
+    left = deadline - time.monotonic()
+    return left if cap is None else min(left, cap)
+
+
+async def inject_deadline(request):
+    """httpx request hook that tells the called agent how much of the budget is left"""
+    left = remaining()
+    if left is not None:
+        request.headers[DEADLINE_HEADER] = str(max(0, int(left * 1000)))
+
+
+class DeadlineMiddleware:
+    """ASGI middleware that applies the caller's remaining budget to the request"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        budget = None
+        if scope["type"] == "http":
+            for key, value in scope.get("headers", []):
+                if key.decode("latin-1").lower() == DEADLINE_HEADER:
+                    try:
+                        budget = int(value) / 1000
+                    except ValueError:
+                        pass
+        if budget is None:
+            await self.app(scope, receive, send)
+            return
+        with request_deadline(budget):
+            await self.app(scope, receive, send)
+
+
+class CircuitBreaker:
+    """Fails calls fast after ``failure_threshold`` consecutive failures
+
+    While open, ``allow()`` is False for ``reset_timeout`` seconds. After
+    that the breaker is half-open: one trial call goes through, and its
+    outcome closes or re-opens the breaker.
+    """
+
+    CLOSED, OPEN, HALF_OPEN = "closed", "open", "half_open"
+
+    def __init__(self, name: str, failure_threshold: int = 5, reset_timeout: float = 30):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self.opened_at = 0.0
+        self._trial_started_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+            now = time.monotonic()
+            if self.state == self.OPEN:
+                if now - self.opened_at < self.reset_timeout:
+                    return False
+                self.state = self.HALF_OPEN
+            # One trial at a time; a trial that never reported back is replaced
+            if self._trial_started_at is None or now - self._trial_started_at > self.reset_timeout:
+                self._trial_started_at = now
+                return True
+            return False
+
+    def record(self, ok: bool):
+        with self._lock:
+            self._trial_started_at = None
+            if ok:
+                if self.state != self.CLOSED:
+                    logger.info(f"Circuit for {self.name} closed")
+                self.state = self.CLOSED
+                self.consecutive_failures = 0
+                return
+            self.consecutive_failures += 1
+            if self.state == self.HALF_OPEN or (
+                self.state == self.CLOSED and self.consecutive_failures >= self.failure_threshold
+            ):
+                self.state = self.OPEN
+                self.opened_at = time.monotonic()
+                logger.warning(f"Circuit for {self.name} opened after {self.consecutive_failures} failures")
+
+    def retry_after(self) -> float:
+        """Seconds until the next trial call is allowed"""
+        if self.state == self.CLOSED:
+            return 0.0
+        return max(0.0, self.reset_timeout - (time.monotonic() - self.opened_at))
+
+
+class LatencyTracker:
+    """Percentiles over the most recent ``window`` latencies"""
+
+    def __init__(self, window: int = 200):
+        self._samples = deque(maxlen=window)
+
+    def observe(self, seconds: float):
+        self._samples.append(seconds)
+
+    def percentile(self, p: float, min_samples: int = 1) -> Optional[float]:
+        if len(self._samples) < max(1, min_samples):
+            return None
+        ordered = sorted(self._samples)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * p / 100))]
+
+
+@dataclass
+class _Flight:
+    task: asyncio.Task
+    waiters: int = 0
+
+
+class SingleFlight:
+    """Runs one call per key at a time; concurrent callers with the same key share its result
+
+    The call runs as its own task, so a caller that gives up does not cancel
+    it for the others; it is cancelled only when every caller has gone.
+    Callers must not mutate the shared result.
+    """
+
+    def __init__(self):
+        self._flights: Dict[Tuple[int, Hashable], _Flight] = {}
+
+    def in_flight(self) -> int:
+        return len(self._flights)
+
+    async def do(self, key: Hashable, call: Callable[[], Awaitable[Any]]) -> Tuple[Any, bool]:
+        """Return the call's result and whether it was shared with an earlier caller"""
+        loop = asyncio.get_running_loop()
+        scoped = (id(loop), key)
+        flight = self._flights.get(scoped)
+        shared = flight is not None
+        if flight is None:
+            flight = _Flight(loop.create_task(call()))
+            self._flights[scoped] = flight
+            flight.task.add_done_callback(lambda task: self._finished(scoped, flight))
+        flight.waiters += 1
+        try:
+            return await asyncio.shield(flight.task), shared
+        finally:
+            flight.waiters -= 1
+            if flight.waiters == 0 and not flight.task.done():
+                flight.task.cancel()
+
+    def _finished(self, scoped: Tuple[int, Hashable], flight: _Flight):
+        if self._flights.get(scoped) is flight:
+            del self._flights[scoped]
+        if not flight.task.cancelled():
+            # Mark the exception retrieved when every caller has already left
+            flight.task.exception()
+
+
+def _error_result(tool_use_id: str, text: str) -> ToolResult:
+    return {"toolUseId": tool_use_id, "status": "error", "content": [{"text": text}]}
+
+
+class GuardedMCPTool(AgentTool):
+    """Runs an MCP tool within the request deadline, behind its gateway target's circuit breaker
+
+    Calls to targets in ``coalesce_targets`` (shared data, never per-guest
+    lookups) are single-flighted: identical concurrent calls run once and
+    every caller gets the result.
+    """
+
+    def __init__(
+        self,
+        tool: AgentTool,
+        breaker: CircuitBreaker,
+        timeout: Optional[float] = None,
+        single_flight: Optional[SingleFlight] = None,
+        coalesce_targets: Tuple[str, ...] = (),
+    ):
+        super().__init__()
+        self.tool = tool
+        self.breaker = breaker
+        self.timeout = timeout
+        self.single_flight = single_flight
+        self.coalesce = single_flight is not None and match_target(tool.tool_name, coalesce_targets) is not None
+
+    @property
+    def tool_name(self) -> str:
+        return self.tool.tool_name
+
+    @property
+    def tool_spec(self) -> ToolSpec:
+        return self.tool.tool_spec
+
+    @property
+    def tool_type(self) -> str:
+        return self.tool.tool_type
+
+    async def _call(self, tool_use: ToolUse, invocation_state: Dict[str, Any], **kwargs: Any) -> ToolResult:
+        result = None
+        async for event in self.tool.stream(tool_use, invocation_state, **kwargs):
+            if isinstance(event, ToolResultEvent):
+                result = event.tool_result
+        if result is None:
+            raise RuntimeError(f"{self.tool_name} returned no result")
+        return result
+
+    async def stream(self, tool_use: ToolUse, invocation_state: Dict[str, Any], **kwargs: Any) -> ToolGenerator:
+        tool_use_id = tool_use["toolUseId"]
+        timeout = remaining(self.timeout)
+        if timeout is not None and timeout <= 0:
+            yield ToolResultEvent(_error_result(tool_use_id, "The request ran out of time before this tool could run."))
+            return
+        if not self.breaker.allow():
+            get_metrics_registry().inc("circuit_rejections_total", target=self.breaker.name)
+            yield ToolResultEvent(_error_result(
+                tool_use_id,
+                f"{self.tool_name} is temporarily unavailable; retry in {self.breaker.retry_after():.0f}s. "
+                "Tell the user instead of calling it again.",
+            ))
+            return
+
+        async def call() -> ToolResult:
+            # Reported once per execution, however many callers share it
+            try:
+                async with asyncio.timeout(timeout):
+                    result = await self._call(tool_use, invocation_state, **kwargs)
+            except Exception:
+                self.breaker.record(ok=False)
+                raise
+            # A 4xx payload is a bad request, not a failing dependency
+            status = failed_status(result)
+            self.breaker.record(ok=result.get("status") != "error" and (status is None or status < 500))
+            return result
+
+        try:
+            if self.coalesce:
+                key = (self.tool_name, canonical_args(tool_use.get("input") or {}))
+                result, shared = await self.single_flight.do(key, call)
+                if shared:
+                    get_metrics_registry().inc("singleflight_coalesced_total", scope="mcp_tool", target=self.tool_name)
+                result = dict(copy.deepcopy(result), toolUseId=tool_use_id)
+            else:
+                result = await call()
+        except TimeoutError:
+            yield ToolResultEvent(_error_result(tool_use_id, f"{self.tool_name} did not respond within {timeout:.1f}s"))
+            return
+        except Exception as e:
+            logger.error(f"{self.tool_name} failed: {e}")
+            yield ToolResultEvent(_error_result(tool_use_id, f"{self.tool_name} failed: {e}"))
+            return
+
+        yield ToolResultEvent(result)
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+_single_flight = SingleFlight()
+
+
+def _circuit_samples():
+    for name, breaker in list(_breakers.items()):
+        yield "circuit_open", {"target": name}, 0.0 if breaker.state == CircuitBreaker.CLOSED else 1.0
+
+
+def get_circuit_breaker(
+    name: str, failure_threshold: Optional[int] = None, reset_timeout: Optional[float] = None
+) -> CircuitBreaker:
+    """Return the process-wide breaker for a dependency; defaults come from CIRCUIT_* variables"""
+    with _breakers_lock:
+        if not _breakers:
+            get_metrics_registry().register_collector("circuits", _circuit_samples)
+        if name not in _breakers:
+            _breakers[name] = CircuitBreaker(
+                name,
+                failure_threshold=failure_threshold or int(os.getenv("CIRCUIT_FAILURE_THRESHOLD", "5")),
+                reset_timeout=reset_timeout or float(os.getenv("CIRCUIT_RESET_TIMEOUT", "30")),
+            )
+        return _breakers[name]
+
+
+def guard_mcp_tool(tool: AgentTool) -> GuardedMCPTool:
+    """Wrap an MCP tool with its gateway target's breaker, MCP_TOOL_TIMEOUT and single-flight
+
+    MCP_SINGLE_FLIGHT_TARGETS lists the targets whose identical concurrent
+    calls are coalesced; per-guest targets such as query-reservations must
+    not be listed.
+    """
+    target = tool.tool_name.split("___", 1)[0]
+    coalesce_targets = os.getenv("MCP_SINGLE_FLIGHT_TARGETS", f"{SEARCH_HOTEL},{GUEST_ADVISORY_KB}")
+    return GuardedMCPTool(
+        tool,
+        get_circuit_breaker(f"mcp:{target}"),
+        timeout=float(os.getenv("MCP_TOOL_TIMEOUT", "30")) or None,
+        single_flight=_single_flight,
+        coalesce_targets=tuple(t.strip() for t in coalesce_targets.split(",") if t.strip()),
+    )
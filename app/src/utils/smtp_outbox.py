@@ -0,0 +1,451 @@
+import os
+import time
+import queue
+import uuid
+import fcntl
+import atexit
+import socket
+import logging
+import smtplib
+import threading
+from email import message_from_bytes, policy
+from email.message import Message
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class OutboxFullError(Exception):
+    """Raised when the outbox queue cannot accept another email"""
+
+
+def is_permanent(error: Exception) -> bool:
+    """Whether an SMTP error is a 5xx reply that a retry would only repeat"""
+    if isinstance(error, smtplib.SMTPRecipientsRefused):
+        return all(code >= 500 for code, _ in error.recipients.values())
+    return isinstance(error, smtplib.SMTPResponseException) and error.smtp_code >= 500
+
+
+class SMTPConnectionPool:
+    """Pool of persistent, authenticated SMTP connections
+
+    Connections idle for longer than ``health_check_after`` seconds are probed
+    with NOOP before reuse and replaced if the server has dropped them.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+        size: int = 2,
+        starttls: bool = True,
+        timeout: float = 30,
+        health_check_after: float = 30,
+    ):
+        self.host = host
+        self.port = port
+        self.username = username
+        self.password = password
+        self.size = size
+        self.starttls = starttls
+        self.timeout = timeout
+        self.health_check_after = health_check_after
+        self._idle: "queue.LifoQueue[Tuple[smtplib.SMTP, float]]" = queue.LifoQueue()
+        self._semaphore = threading.BoundedSemaphore(size)
+
+    def _connect(self) -> smtplib.SMTP:
+        conn = smtplib.SMTP(self.host, self.port, timeout=self.timeout)
+        if self.starttls:
+            conn.starttls()
+        if self.username and self.password:
+            conn.login(self.username, self.password)
+        return conn
+
+    @staticmethod
+    def _is_healthy(conn: smtplib.SMTP) -> bool:
+        try:
+            return conn.noop()[0] == 250
+        except smtplib.SMTPException:
+            return False
+        except OSError:
+            return False
+
+    def acquire(self) -> smtplib.SMTP:
+        """Get a live connection, reusing an idle one when it passes the health check"""
+        self._semaphore.acquire()
+        try:
+            while True:
+                try:
+                    conn, last_used = self._idle.get_nowait()
+                except queue.Empty:
+                    return self._connect()
+                if time.monotonic() - last_used < self.health_check_after or self._is_healthy(conn):
+                    return conn
+                self._close(conn)
+        except Exception:
+            self._semaphore.release()
+            raise
+
+    def release(self, conn: smtplib.SMTP, healthy: bool = True):
+        """Return a connection; broken connections are closed instead of pooled"""
+        if healthy:
+            self._idle.put((conn, time.monotonic()))
+        else:
+            self._close(conn)
+        self._semaphore.release()
+
+    @staticmethod
+    def _close(conn: smtplib.SMTP):
+        try:
+            conn.quit()
+        except Exception:
+            conn.close()
+
+    def close(self):
+        while True:
+            try:
+                conn, _ = self._idle.get_nowait()
+            except queue.Empty:
+                return
+            self._close(conn)
+
+
+class EmailOutbox:
+    """Background email sender with a bounded queue, batching and retries
+
+    With a spool directory configured, each email is written to disk before
+    submit() returns and removed only after delivery, so queued mail
+    survives a restart. Each outbox keeps its emails in its own claim
+    directory, locked for as long as the process lives, so several
+    processes can share the spool: at startup an outbox takes over only
+    loose emails and the claims of processes that have exited.
+    """
+
+    def __init__(
+        self,
+        pool: SMTPConnectionPool,
+        max_queue_size: int = 100,
+        batch_size: int = 10,
+        batch_wait: float = 0.2,
+        max_retries: int = 3,
+        retry_backoff: float = 1.0,
+        spool_dir: Optional[str] = None,
+    ):
+        self.pool = pool
+        self.batch_size = batch_size
+        self.batch_wait = batch_wait
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self.spool_dir = spool_dir
+        self._queue: "queue.Queue[Tuple[str, Message, int]]" = queue.Queue(maxsize=max_queue_size)
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+        # Retries waiting out their backoff, by message id
+        self._retries: Dict[str, Tuple[threading.Timer, Tuple[str, Message, int]]] = {}
+        self._closing = False
+        self._metrics = {"queued": 0, "sent": 0, "retried": 0, "failed": 0, "rejected": 0, "batches": 0}
+
+        self._claim_dir: Optional[str] = None
+        self._claim_lock: Optional[int] = None
+
+        if self.spool_dir:
+            self._open_claim()
+            self._recover_spool()
+
+        self._worker = threading.Thread(target=self._run, name="email-outbox", daemon=True)
+        self._worker.start()
+        atexit.register(self.close)
+
+    def submit(self, msg: Message) -> str:
+        """Queue an email for delivery and return its outbox id"""
+        message_id = uuid.uuid4().hex
+        self._spool(message_id, msg)
+        try:
+            self._queue.put_nowait((message_id, msg, 0))
+        except queue.Full as e:
+            self._unspool(message_id)
+            self._count("rejected")
+            raise OutboxFullError("Email outbox is full") from e
+        self._count("queued")
+        return message_id
+
+    def metrics(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._metrics, pending=self._queue.qsize())
+
+    def close(self, timeout: float = 10):
+        """Drain the queue and pending retries, stop the worker and close pooled connections"""
+        deadline = time.monotonic() + timeout
+        with self._lock:
+            self._closing = True
+            retries = list(self._retries.values())
+            self._retries.clear()
+        # Retries still in their backoff go out with the final drain instead of being dropped
+        for timer, item in retries:
+            timer.cancel()
+            try:
+                self._queue.put(item, timeout=max(deadline - time.monotonic(), 0))
+            except queue.Full:
+                self._abandon(item[0])
+
+        while not self._queue.empty() and time.monotonic() < deadline:
+            time.sleep(0.05)
+        self._stop.set()
+        self._worker.join(max(deadline - time.monotonic(), 0))
+        while True:
+            try:
+                message_id, _, _ = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            self._abandon(message_id)
+        self.pool.close()
+        self._release_claim()
+
+    def _count(self, name: str, n: int = 1):
+        with self._lock:
+            self._metrics[name] += n
+
+    def _next_batch(self) -> List[Tuple[str, Message, int]]:
+        try:
+            batch = [self._queue.get(timeout=0.5)]
+        except queue.Empty:
+            return []
+
+        deadline = time.monotonic() + self.batch_wait
+        while len(batch) < self.batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                batch = self._next_batch()
+                if batch:
+                    self._send_batch(batch)
+            except Exception:
+                # Spooled emails in the batch are picked up again after a restart
+                logger.exception("Email outbox worker failed to send a batch")
+
+    def _send_batch(self, batch: List[Tuple[str, Message, int]]):
+        """Send a batch over one pooled connection"""
+        self._count("batches")
+        try:
+            conn = self.pool.acquire()
+        except Exception as e:
+            logger.warning(f"SMTP connection failed: {e}")
+            for item in batch:
+                self._retry(item, e)
+            return
+
+        healthy = True
+        try:
+            for index, item in enumerate(batch):
+                message_id, msg, _ = item
+                try:
+                    conn.send_message(msg)
+                except Exception as e:
+                    if is_permanent(e):
+                        # smtplib has reset the transaction, so the connection is still usable
+                        self._give_up(message_id, e)
+                        continue
+                    healthy = False
+                    self._retry(item, e)
+                    # The rest of the batch was never attempted
+                    for pending in batch[index + 1:]:
+                        self._requeue(pending)
+                    break
+                self._unspool(message_id)
+                self._count("sent")
+        except Exception:
+            healthy = False
+            raise
+        finally:
+            self.pool.release(conn, healthy=healthy)
+
+    def _retry(self, item: Tuple[str, Message, int], error: Exception):
+        """Requeue a failed email after exponential backoff, or give up"""
+        message_id, msg, attempts = item
+        if attempts + 1 >= self.max_retries:
+            self._give_up(message_id, error)
+            return
+        self._count("retried")
+        item = (message_id, msg, attempts + 1)
+        with self._lock:
+            if not self._closing:
+                delay = min(self.retry_backoff * (2 ** attempts), 30)
+                timer = threading.Timer(delay, self._retry_due, args=(item,))
+                timer.daemon = True
+                self._retries[message_id] = (timer, item)
+                timer.start()
+                return
+        # Shutting down: retry without backoff while the queue drains
+        self._requeue(item)
+
+    def _retry_due(self, item: Tuple[str, Message, int]):
+        with self._lock:
+            # close() may have taken the retry over already
+            if self._retries.pop(item[0], None) is None:
+                return
+        self._requeue(item)
+
+    def _abandon(self, message_id: str):
+        """Leave an email undelivered at shutdown; a spooled copy is recovered on restart"""
+        if self.spool_dir:
+            logger.warning(f"Email {message_id} left in the spool at shutdown")
+        else:
+            self._give_up(message_id, OutboxFullError("Email outbox closed before delivery"))
+
+    def _give_up(self, message_id: str, error: Exception):
+        logger.error(f"Failed to deliver email {message_id}: {error}")
+        self._unspool(message_id)
+        self._count("failed")
+
+    def _requeue(self, item: Tuple[str, Message, int]):
+        try:
+            self._queue.put_nowait(item)
+        except queue.Full:
+            self._give_up(item[0], OutboxFullError("Email outbox is full"))
+
+    def _spool_path(self, message_id: str) -> str:
+        return os.path.join(self._claim_dir, f"{message_id}.eml")
+
+    def _spool(self, message_id: str, msg: Message):
+        if not self.spool_dir:
+            return
+        path = self._spool_path(message_id)
+        with open(f"{path}.tmp", "wb") as f:
+            f.write(msg.as_bytes())
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(f"{path}.tmp", path)
+
+    def _unspool(self, message_id: str):
+        if not self.spool_dir:
+            return
+        try:
+            os.remove(self._spool_path(message_id))
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning(f"Could not remove spooled email {message_id}: {e}")
+
+    def _open_claim(self):
+        """Create this process's claim directory and hold its lock until exit"""
+        claims = os.path.join(self.spool_dir, "claims")
+        os.makedirs(claims, exist_ok=True)
+        name = f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        # Locked before it gets its visible name, so no one can take it for an orphan
+        staging = os.path.join(claims, f".{name}")
+        os.makedirs(staging)
+        self._claim_lock = os.open(os.path.join(staging, ".lock"), os.O_RDWR | os.O_CREAT, 0o644)
+        fcntl.flock(self._claim_lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        self._claim_dir = os.path.join(claims, name)
+        os.rename(staging, self._claim_dir)
+
+    def _release_claim(self):
+        """Remove the claim directory once everything in it was delivered"""
+        if self._claim_lock is None:
+            return
+        try:
+            if not any(name.endswith(".eml") for name in os.listdir(self._claim_dir)):
+                self._remove_claim(self._claim_dir)
+        except OSError as e:
+            logger.warning(f"Could not remove email spool claim {self._claim_dir}: {e}")
+        os.close(self._claim_lock)
+        self._claim_lock = None
+
+    @staticmethod
+    def _remove_claim(claim_dir: str):
+        """Delete an empty claim directory; the caller holds its lock"""
+        for name in os.listdir(claim_dir):
+            os.remove(os.path.join(claim_dir, name))
+        os.rmdir(claim_dir)
+
+    def _claim(self, path: str) -> Optional[str]:
+        """Move a spooled email into this process's claim; None if another process took it first"""
+        message_id = os.path.basename(path)[:-len(".eml")]
+        try:
+            os.rename(path, self._spool_path(message_id))
+        except FileNotFoundError:
+            return None
+        return message_id
+
+    def _orphaned_emails(self) -> List[str]:
+        """Loose spooled emails, plus those claimed by processes that have exited"""
+        paths = [os.path.join(self.spool_dir, n) for n in sorted(os.listdir(self.spool_dir)) if n.endswith(".eml")]
+        claims = os.path.join(self.spool_dir, "claims")
+        for name in sorted(os.listdir(claims)):
+            claim_dir = os.path.join(claims, name)
+            if name.startswith(".") or claim_dir == self._claim_dir:
+                continue
+            try:
+                lock = os.open(os.path.join(claim_dir, ".lock"), os.O_RDWR)
+            except FileNotFoundError:
+                continue
+            try:
+                try:
+                    fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                except BlockingIOError:
+                    # Its owner is alive and still sending these
+                    continue
+                try:
+                    names = sorted(os.listdir(claim_dir))
+                except FileNotFoundError:
+                    continue
+                emails = [os.path.join(claim_dir, n) for n in names if n.endswith(".eml")]
+                if not emails:
+                    # Emptied by an earlier recovery
+                    self._remove_claim(claim_dir)
+                paths.extend(emails)
+            finally:
+                os.close(lock)
+        return paths
+
+    def _recover_spool(self):
+        """Re-queue spooled emails that no running process is sending"""
+        recovered = 0
+        for path in self._orphaned_emails():
+            if self._queue.full():
+                break
+            message_id = self._claim(path)
+            if message_id is None:
+                continue
+            with open(self._spool_path(message_id), "rb") as f:
+                msg = message_from_bytes(f.read(), policy=policy.SMTP)
+            self._queue.put_nowait((message_id, msg, 0))
+            recovered += 1
+        if recovered:
+            logger.info(f"Recovered {recovered} spooled emails")
+
+
+_outbox: Optional[EmailOutbox] = None
+_outbox_lock = threading.Lock()
+
+
+def get_email_outbox() -> EmailOutbox:
+    """Return the process-wide email outbox, configured from the environment"""
+    global _outbox
+    with _outbox_lock:
+        if _outbox is None:
+            pool = SMTPConnectionPool(
+                host=os.getenv("SMTP_HOST", "smtp.gmail.com"),
+                port=int(os.getenv("SMTP_PORT", "587")),
+                username=os.getenv("GMAIL_USER"),
+                password=os.getenv("GMAIL_APP_PASSWORD"),
+                size=int(os.getenv("SMTP_POOL_SIZE", "2")),
+                starttls=os.getenv("SMTP_STARTTLS", "true").lower() == "true",
+            )
+            _outbox = EmailOutbox(
+                pool,
+                max_queue_size=int(os.getenv("EMAIL_OUTBOX_QUEUE_SIZE", "100")),
+                spool_dir=os.getenv("EMAIL_OUTBOX_SPOOL_DIR"),
+            )
+        return _outbox
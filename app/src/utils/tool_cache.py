@@ -0,0 +1,239 @@
+import os
+import copy
+import json
+import time
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+from strands.types._events import ToolResultEvent
+from strands.types.tools import AgentTool, ToolGenerator, ToolResult, ToolSpec, ToolUse
+
+logger = logging.getLogger(__name__)
+
+# Gateway targets, matched against tool names by prefix ("<target>___<tool>")
+SEARCH_HOTEL = "search-hotel"
+GUEST_ADVISORY_KB = "guest-advisory-kb"
+QUERY_RESERVATIONS = "query-reservations"
+ROOM_RESERVATION = "room-reservation"
+MODIFY_RESERVATION = "modify-reservation"
+
+DEFAULT_TOOL_TTLS = {SEARCH_HOTEL: 60.0, GUEST_ADVISORY_KB: 900.0, QUERY_RESERVATIONS: 30.0}
+
+# Results a reservation change can make stale: availability and the guest's bookings
+MUTATING_TOOLS = {ROOM_RESERVATION, MODIFY_RESERVATION}
+INVALIDATED_BY_MUTATION = (SEARCH_HOTEL, QUERY_RESERVATIONS)
+# Arguments that narrow an invalidation when both calls carry them
+SCOPE_ARGS = ("guest_email", "hotel_id", "city")
+# Arguments whose case never changes the result; every other string is kept as given
+CASE_INSENSITIVE_ARGS = ("guest_email", "city")
+
+CacheKey = Tuple[str, str]
+
+
+def match_target(tool_name: str, targets) -> Optional[str]:
+    """Return the gateway target a tool name belongs to, or None"""
+    normalized = tool_name.lower().replace("_", "-")
+    for target in targets:
+        if normalized.startswith(target):
+            return target
+    return None
+
+
+def canonical_args(args: Dict[str, Any]) -> str:
+    """Stable text form of tool arguments, independent of key order and whitespace
+
+    Only CASE_INSENSITIVE_ARGS are lower-cased, so booking ids and other
+    identifiers that differ in case never share a cache entry.
+    """
+
+    def normalize(value, key=None):
+        if isinstance(value, dict):
+            return {k: normalize(v, k) for k, v in value.items()}
+        if isinstance(value, list):
+            return [normalize(v, key) for v in value]
+        if isinstance(value, str):
+            return value.strip().lower() if key in CASE_INSENSITIVE_ARGS else value.strip()
+        return value
+
+    return json.dumps(normalize(args or {}), sort_keys=True, separators=(",", ":"), default=str)
+
+
+def _json_value(value: Any) -> Any:
+    if isinstance(value, str):
+        try:
+            return json.loads(value)
+        except ValueError:
+            return value
+    return value
+
+
+def failed_status(result: ToolResult) -> Optional[int]:
+    """Status of a tool result whose payload reports a failure, or None
+
+    The gateway Lambdas answer failures with a normal payload of the form
+    {"statusCode": 4xx/5xx, "body": {"error": ...}} (body often JSON-encoded),
+    which MCP still marks as a successful call. An error without a status
+    code counts as 500.
+    """
+    for item in result.get("content") or []:
+        payload = _json_value(item.get("json", item.get("text")))
+        if not isinstance(payload, dict):
+            continue
+        status = payload.get("statusCode")
+        status = status if isinstance(status, int) else 0
+        if status >= 400:
+            return status
+        body = _json_value(payload.get("body"))
+        if payload.get("error") or (isinstance(body, dict) and body.get("error")):
+            return 500
+    return None
+
+
+def parse_ttls(spec: Optional[str]) -> Dict[str, float]:
+    """Parse "search-hotel=60,guest-advisory-kb=900" on top of the defaults"""
+    ttls = dict(DEFAULT_TOOL_TTLS)
+    for item in (spec or "").split(","):
+        if "=" in item:
+            name, ttl = item.split("=", 1)
+            ttls[name.strip()] = float(ttl)
+    return ttls
+
+
+class ToolResultCache:
+    """LRU cache of MCP tool results with per-tool TTLs
+
+    Only tools with a positive TTL are cached. Reservation-changing calls
+    invalidate the cached searches and reservation lookups they can affect,
+    scoped by guest email, hotel or city when both calls carry them.
+    """
+
+    def __init__(self, ttls: Optional[Dict[str, float]] = None, max_entries: int = 1024):
+        self.ttls = DEFAULT_TOOL_TTLS if ttls is None else ttls
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[CacheKey, Tuple[float, Dict[str, Any], ToolResult]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._metrics = {"hits": 0, "misses": 0, "stores": 0, "expired": 0, "evictions": 0, "invalidations": 0}
+
+    def ttl_for(self, tool_name: str) -> float:
+        target = match_target(tool_name, self.ttls)
+        return self.ttls[target] if target else 0
+
+    def get(self, tool_name: str, args: Dict[str, Any]) -> Optional[ToolResult]:
+        key = (tool_name, canonical_args(args))
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._metrics["misses"] += 1
+                return None
+            expires_at, _, result = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                self._metrics["expired"] += 1
+                self._metrics["misses"] += 1
+                return None
+            self._entries.move_to_end(key)
+            self._metrics["hits"] += 1
+            return copy.deepcopy(result)
+
+    def put(self, tool_name: str, args: Dict[str, Any], result: ToolResult):
+        ttl = self.ttl_for(tool_name)
+        if ttl <= 0:
+            return
+        key = (tool_name, canonical_args(args))
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, dict(args or {}), copy.deepcopy(result))
+            self._entries.move_to_end(key)
+            self._metrics["stores"] += 1
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._metrics["evictions"] += 1
+
+    def invalidate_for(self, tool_name: str, args: Dict[str, Any]):
+        """Drop entries a call to a reservation-changing tool may have made stale"""
+        if match_target(tool_name, MUTATING_TOOLS) is None:
+            return
+        scope = {k: str(v).strip().lower() for k, v in (args or {}).items() if k in SCOPE_ARGS and v}
+        with self._lock:
+            stale = [
+                key
+                for key, (_, cached_args, _) in self._entries.items()
+                if match_target(key[0], INVALIDATED_BY_MUTATION) and self._in_scope(cached_args, scope)
+            ]
+            for key in stale:
+                del self._entries[key]
+            self._metrics["invalidations"] += len(stale)
+        if stale:
+            logger.info(f"{tool_name} invalidated {len(stale)} cached tool results")
+
+    @staticmethod
+    def _in_scope(cached_args: Dict[str, Any], scope: Dict[str, str]) -> bool:
+        # Without a shared scoping argument the entry might be affected, so drop it
+        return all(
+            str(cached_args[k]).strip().lower() == v for k, v in scope.items() if cached_args.get(k)
+        )
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def metrics(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self._metrics["hits"] + self._metrics["misses"]
+            hit_ratio = self._metrics["hits"] / lookups if lookups else 0.0
+            return dict(self._metrics, entries=len(self._entries), hit_ratio=round(hit_ratio, 4))
+
+
+class CachingMCPTool(AgentTool):
+    """Serves an MCP tool's repeated calls from a ToolResultCache"""
+
+    def __init__(self, tool: AgentTool, cache: ToolResultCache):
+        super().__init__()
+        self.tool = tool
+        self.cache = cache
+
+    @property
+    def tool_name(self) -> str:
+        return self.tool.tool_name
+
+    @property
+    def tool_spec(self) -> ToolSpec:
+        return self.tool.tool_spec
+
+    @property
+    def tool_type(self) -> str:
+        return self.tool.tool_type
+
+    async def stream(self, tool_use: ToolUse, invocation_state: Dict[str, Any], **kwargs: Any) -> ToolGenerator:
+        args = tool_use.get("input") or {}
+        cacheable = self.cache.ttl_for(self.tool_name) > 0
+        cached = self.cache.get(self.tool_name, args) if cacheable else None
+        if cached is not None:
+            cached["toolUseId"] = tool_use["toolUseId"]
+            yield ToolResultEvent(cached)
+            return
+
+        async for event in self.tool.stream(tool_use, invocation_state, **kwargs):
+            if isinstance(event, ToolResultEvent):
+                # Update the cache first: the executor stops iterating at the result
+                self.cache.invalidate_for(self.tool_name, args)
+                result = event.tool_result
+                if cacheable and result.get("status") == "success" and failed_status(result) is None:
+                    self.cache.put(self.tool_name, args, result)
+            yield event
+
+
+_tool_cache: Optional[ToolResultCache] = None
+_tool_cache_lock = threading.Lock()
+
+
+def get_tool_result_cache() -> ToolResultCache:
+    """Return the process-wide tool result cache"""
+    global _tool_cache
+    with _tool_cache_lock:
+        if _tool_cache is None:
+            _tool_cache = ToolResultCache(
+                ttls=parse_ttls(os.getenv("MCP_TOOL_CACHE_TTLS")),
+                max_entries=int(os.getenv("MCP_TOOL_CACHE_MAX_ENTRIES", "1024")),
+            )
+        return _tool_cache
@@ -0,0 +1,125 @@
+import os
+import json
+import logging
+import threading
+from contextlib import contextmanager
+from typing import Iterator, Sequence
+
+from opentelemetry import context, propagate, trace
+from opentelemetry.sdk.trace import ReadableSpan
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor, SpanExporter, SpanExportResult
+
+logger = logging.getLogger(__name__)
+
+TRACER_NAME = "hotel-booking-system"
+
+_telemetry = None
+_setup_lock = threading.Lock()
+
+
+class JsonLinesSpanExporter(SpanExporter):
+    """Appends finished spans to a file, one JSON object per line, for offline analysis"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def export(self, spans: Sequence[ReadableSpan]) -> SpanExportResult:
+        lines = [json.dumps(self._to_dict(span), default=str) for span in spans]
+        try:
+            with self._lock, open(self.path, "a") as f:
+                f.write("\n".join(lines) + "\n")
+            return SpanExportResult.SUCCESS
+        except OSError as e:
+            logger.warning(f"Could not write spans to {self.path}: {e}")
+            return SpanExportResult.FAILURE
+
+    @staticmethod
+    def _to_dict(span: ReadableSpan) -> dict:
+        ctx = span.get_span_context()
+        return {
+            "name": span.name,
+            "trace_id": f"{ctx.trace_id:032x}",
+            "span_id": f"{ctx.span_id:016x}",
+            "parent_id": f"{span.parent.span_id:016x}" if span.parent else None,
+            "service": span.resource.attributes.get("service.name"),
+            "start_time": span.start_time,
+            "duration_ms": round((span.end_time - span.start_time) / 1e6, 3),
+            "status": span.status.status_code.name,
+            "attributes": dict(span.attributes or {}),
+        }
+
+
+def setup_tracing(service_name: str):
+    """Install the global tracer provider and the exporters listed in TRACING_EXPORTER
+
+    TRACING_EXPORTER is a comma-separated list of ``console``, ``file`` and
+    ``otlp`` (default: none, which disables tracing). ``file`` appends JSON
+    lines to TRACE_FILE_PATH; ``otlp`` uses the standard OTEL_EXPORTER_OTLP_*
+    variables. Strands then emits spans for every agent invocation, model
+    call and tool call; safe to call more than once per process.
+    """
+    global _telemetry
+    exporters = [e.strip().lower() for e in os.getenv("TRACING_EXPORTER", "none").split(",") if e.strip()]
+    exporters = [e for e in exporters if e != "none"]
+    if not exporters:
+        return None
+
+    with _setup_lock:
+        if _telemetry is not None:
+            return _telemetry
+        from strands.telemetry import StrandsTelemetry
+
+        os.environ.setdefault("OTEL_SERVICE_NAME", service_name)
+        telemetry = StrandsTelemetry()
+        for exporter in exporters:
+            if exporter == "console":
+                telemetry.setup_console_exporter()
+            elif exporter == "file":
+                path = os.getenv("TRACE_FILE_PATH", "traces.jsonl")
+                telemetry.tracer_provider.add_span_processor(SimpleSpanProcessor(JsonLinesSpanExporter(path)))
+            elif exporter == "otlp":
+                try:
+                    telemetry.setup_otlp_exporter()
+                except ImportError:
+                    logger.warning("OTLP exporter requested but opentelemetry-exporter-otlp is not installed")
+            else:
+                logger.warning(f"Unknown tracing exporter: {exporter}")
+        _telemetry = telemetry
+        logger.info(f"Tracing enabled for {service_name}: {', '.join(exporters)}")
+        return telemetry
+
+
+def get_tracer() -> trace.Tracer:
+    return trace.get_tracer(TRACER_NAME)
+
+
+@contextmanager
+def traced(name: str, **attributes) -> Iterator[trace.Span]:
+    """Run a block inside a span; a no-op span when tracing is disabled"""
+    attributes = {k: v for k, v in attributes.items() if v is not None}
+    with get_tracer().start_as_current_span(name, attributes=attributes) as span:
+        yield span
+
+
+async def inject_trace_context(request):
+    """httpx request hook that propagates the current trace to the called service"""
+    propagate.inject(request.headers)
+
+
+class TraceContextMiddleware:
+    """ASGI middleware that continues the caller's trace from the request headers"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        carrier = {key.decode("latin-1"): value.decode("latin-1") for key, value in scope.get("headers", [])}
+        token = context.attach(propagate.extract(carrier))
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            context.detach(token)
@@ -1,10 +1,47 @@
+import os
+import json
+import uuid
 import streamlit as st
 import requests
+from requests.adapters import HTTPAdapter
+
+API_URL = os.getenv("ASSISTANT_API_URL", "http://localhost:9000/inquire")
+# Connect timeout, then the longest wait between streamed chunks
+REQUEST_TIMEOUT = (5, float(os.getenv("ASSISTANT_READ_TIMEOUT", "120")))
+
+
+@st.cache_resource
+def get_http_session() -> requests.Session:
+    """One pooled keep-alive session shared across reruns"""
+    session = requests.Session()
+    session.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+    session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+    return session
+
+
+def stream_events(prompt: str):
+    """Yield the events of a streamed reply as they arrive"""
+    body = {
+        "question": prompt,
+        "stream": True,
+        "actor_id": st.session_state.actor_id,
+        "session_id": st.session_state.session_id,
+    }
+    with get_http_session().post(API_URL, json=body, stream=True, timeout=REQUEST_TIMEOUT) as response:
+        response.raise_for_status()
+        for line in response.iter_lines(decode_unicode=True):
+            if line and line.startswith("data: "):
+                yield json.loads(line[len("data: "):])
+
 
 st.title("Hotel Booking Assistant")
 
 if "messages" not in st.session_state:
     st.session_state.messages = []
+# Each browser session gets its own supervisor session and history
+if "session_id" not in st.session_state:
+    st.session_state.session_id = f"web_{uuid.uuid4().hex}"
+    st.session_state.actor_id = os.getenv("ASSISTANT_ACTOR_ID") or f"guest_{uuid.uuid4().hex[:12]}"
 
 for message in st.session_state.messages:
     with st.chat_message(message["role"]):
@@ -16,7 +53,22 @@ if prompt := st.chat_input("Ask about hotels..."):
         st.markdown(prompt)
 
     with st.chat_message("assistant"):
-        response = requests.post("http://localhost:9000/inquire", json={"question": prompt})
-        reply = response.json()[0]["text"] if response.status_code == 200 else "Error occurred"
-        st.markdown(reply)
+        status = st.empty()
+        placeholder = st.empty()
+        reply = ""
+        try:
+            for event in stream_events(prompt):
+                if event.get("type") == "progress":
+                    status.caption(event["message"])
+                elif event.get("type") == "text":
+                    reply += event["text"]
+                    placeholder.markdown(reply + "▌")
+                elif event.get("type") == "done":
+                    reply = reply or event["text"]
+                elif event.get("type") == "error":
+                    reply = reply or "Error occurred"
+        except requests.RequestException:
+            reply = reply or "Error occurred"
+        status.empty()
+        placeholder.markdown(reply)
         st.session_state.messages.append({"role": "assistant", "content": reply})
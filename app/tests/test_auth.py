@@ -0,0 +1,74 @@
+"""TokenManager refresh scheduling with a stubbed Cognito endpoint"""
+import time
+
+import pytest
+
+from src.utils.auth import MIN_REFRESH_DELAY_SECONDS, TokenManager
+
+
+class StubResponse:
+    def __init__(self, expires_in):
+        self.expires_in = expires_in
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return {"access_token": "token", "expires_in": self.expires_in}
+
+
+class StubSession:
+    """Counts token requests and answers each with the given lifetime"""
+
+    def __init__(self, expires_in):
+        self.expires_in = expires_in
+        self.posts = 0
+
+    def post(self, url, **kwargs):
+        self.posts += 1
+        return StubResponse(self.expires_in)
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def make_manager(monkeypatch):
+    monkeypatch.delenv("TOKEN_CACHE_PATH", raising=False)
+    monkeypatch.delenv("TOKEN_REFRESH_MARGIN_SECONDS", raising=False)
+    managers = []
+
+    def make(expires_in):
+        manager = TokenManager()
+        manager._session = StubSession(expires_in)
+        managers.append(manager)
+        return manager
+
+    yield make
+    for manager in managers:
+        manager.close()
+
+
+def test_default_margin_for_long_lived_tokens(make_manager):
+    manager = make_manager(expires_in=3600)
+    assert manager.get_token() == "token"
+    assert manager._timer.interval == pytest.approx(3300, abs=1)
+
+
+@pytest.mark.parametrize("expires_in", [300, 120])
+def test_short_lived_tokens_refresh_halfway(make_manager, expires_in):
+    manager = make_manager(expires_in=expires_in)
+    manager.get_token()
+
+    assert manager._timer.interval == pytest.approx(expires_in / 2, abs=1)
+    time.sleep(0.2)
+    assert manager._session.posts == 1
+
+
+def test_refresh_delay_has_a_floor(make_manager):
+    manager = make_manager(expires_in=10)
+    manager.get_token()
+
+    assert manager._timer.interval == MIN_REFRESH_DELAY_SECONDS
+    time.sleep(0.2)
+    assert manager._session.posts == 1
@@ -0,0 +1,171 @@
+"""EmailOutbox against a local aiosmtpd server"""
+import os
+import time
+import fcntl
+import socket
+from email.message import EmailMessage
+
+import pytest
+from aiosmtpd.controller import Controller
+
+from src.utils.smtp_outbox import EmailOutbox, SMTPConnectionPool
+
+
+class RecordingHandler:
+    """Accepts mail, or answers DATA with the next scripted reply"""
+
+    def __init__(self):
+        self.replies = []
+        self.refused = set()
+        self.delivered = []
+        self.sessions = set()
+
+    async def handle_RCPT(self, server, session, envelope, address, rcpt_options):
+        if address in self.refused:
+            return "550 No such user"
+        envelope.rcpt_tos.append(address)
+        return "250 OK"
+
+    async def handle_DATA(self, server, session, envelope):
+        self.sessions.add(id(session))
+        if self.replies:
+            return self.replies.pop(0)
+        self.delivered.append(envelope.content.decode())
+        return "250 OK"
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+@pytest.fixture
+def smtp_server():
+    handler = RecordingHandler()
+    port = free_port()
+    controller = Controller(handler, hostname="127.0.0.1", port=port)
+    controller.start()
+    yield handler, port
+    controller.stop()
+
+
+def make_outbox(port, **kwargs):
+    pool = SMTPConnectionPool("127.0.0.1", port, starttls=False, timeout=5)
+    kwargs.setdefault("retry_backoff", 0.01)
+    return EmailOutbox(pool, **kwargs)
+
+
+def make_message(subject, to="guest@example.com"):
+    msg = EmailMessage()
+    msg["From"] = "hotel@example.com"
+    msg["To"] = to
+    msg["Subject"] = subject
+    msg.set_content(subject)
+    return msg
+
+
+def wait_for(condition, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise AssertionError("timed out")
+        time.sleep(0.02)
+
+
+def test_sends_queued_emails_in_one_batch(smtp_server):
+    handler, port = smtp_server
+    outbox = make_outbox(port, batch_wait=0.5)
+    for i in range(5):
+        outbox.submit(make_message(f"Booking {i}"))
+
+    wait_for(lambda: outbox.metrics()["sent"] == 5)
+    outbox.close()
+    assert outbox.metrics()["batches"] == 1
+    assert len(handler.sessions) == 1
+    assert all(any(f"Booking {i}" in body for body in handler.delivered) for i in range(5))
+
+
+def test_retries_after_transient_failure(smtp_server):
+    handler, port = smtp_server
+    handler.replies = ["451 Try again later"]
+    outbox = make_outbox(port)
+    outbox.submit(make_message("Booking confirmed"))
+
+    wait_for(lambda: outbox.metrics()["sent"] == 1)
+    outbox.close()
+    assert outbox.metrics()["retried"] == 1
+    assert outbox.metrics()["failed"] == 0
+    assert len(handler.delivered) == 1
+
+
+def test_gives_up_on_refused_recipient_and_sends_the_rest(smtp_server):
+    handler, port = smtp_server
+    handler.refused = {"nobody@example.com"}
+    outbox = make_outbox(port, batch_wait=0.5)
+    outbox.submit(make_message("Refused", to="nobody@example.com"))
+    outbox.submit(make_message("Accepted"))
+
+    wait_for(lambda: outbox.metrics()["sent"] + outbox.metrics()["failed"] == 2)
+    outbox.close()
+    metrics = outbox.metrics()
+    assert (metrics["sent"], metrics["failed"], metrics["retried"]) == (1, 1, 0)
+    assert "Accepted" in handler.delivered[0]
+
+
+def test_gives_up_on_permanent_failure_and_sends_the_rest(smtp_server):
+    handler, port = smtp_server
+    handler.replies = ["554 Message rejected"]
+    outbox = make_outbox(port, batch_wait=0.5)
+    outbox.submit(make_message("Rejected"))
+    outbox.submit(make_message("Accepted"))
+
+    wait_for(lambda: outbox.metrics()["sent"] + outbox.metrics()["failed"] == 2)
+    outbox.close()
+    metrics = outbox.metrics()
+    assert (metrics["sent"], metrics["failed"], metrics["retried"]) == (1, 1, 0)
+    assert "Accepted" in handler.delivered[0]
+
+
+def test_spool_is_empty_after_delivery(smtp_server, tmp_path):
+    handler, port = smtp_server
+    outbox = make_outbox(port, spool_dir=str(tmp_path))
+    outbox.submit(make_message("Booking confirmed"))
+
+    wait_for(lambda: outbox.metrics()["sent"] == 1)
+    outbox.close()
+    assert os.listdir(tmp_path / "claims") == []
+
+
+def test_recovers_only_emails_no_running_process_owns(smtp_server, tmp_path):
+    handler, port = smtp_server
+    claims = tmp_path / "claims"
+    # A loose email, one left by a process that exited, and one a live process is sending
+    (tmp_path / "loose.eml").write_bytes(make_message("Loose").as_bytes())
+    for owner in ("exited", "running"):
+        (claims / owner).mkdir(parents=True)
+        (claims / owner / ".lock").touch()
+        (claims / owner / f"{owner}.eml").write_bytes(make_message(owner.title()).as_bytes())
+    with open(claims / "running" / ".lock") as running_lock:
+        fcntl.flock(running_lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+
+        outbox = make_outbox(port, spool_dir=str(tmp_path))
+        wait_for(lambda: outbox.metrics()["sent"] == 2)
+        outbox.close()
+
+        subjects = sorted(line for body in handler.delivered for line in body.splitlines() if line.startswith("Subject"))
+        assert subjects == ["Subject: Exited", "Subject: Loose"]
+        assert (claims / "running" / "running.eml").exists()
+        assert not (tmp_path / "loose.eml").exists()
+
+
+def test_close_sends_emails_waiting_to_be_retried(smtp_server):
+    handler, port = smtp_server
+    handler.replies = ["451 Try again later"]
+    outbox = make_outbox(port, retry_backoff=60)
+    outbox.submit(make_message("Booking confirmed"))
+
+    wait_for(lambda: outbox.metrics()["retried"] == 1)
+    outbox.close()
+    assert outbox.metrics()["sent"] == 1
+    assert len(handler.delivered) == 1
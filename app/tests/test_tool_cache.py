@@ -0,0 +1,17 @@
+"""Cache keys for MCP tool arguments"""
+from src.utils.tool_cache import canonical_args
+
+
+def test_key_ignores_order_and_surrounding_whitespace():
+    assert canonical_args({"city": "Lisbon ", "max_price": 200}) == canonical_args({"max_price": 200, "city": "Lisbon"})
+
+
+def test_email_and_city_are_case_insensitive():
+    assert canonical_args({"guest_email": "Jane@Example.com", "city": "LISBON"}) == canonical_args(
+        {"guest_email": "jane@example.com", "city": "lisbon"}
+    )
+
+
+def test_other_strings_keep_their_case():
+    assert canonical_args({"booking_id": "BK-10a"}) != canonical_args({"booking_id": "BK-10A"})
+    assert canonical_args({"filters": {"booking_id": "bk-1"}}) != canonical_args({"filters": {"booking_id": "BK-1"}})